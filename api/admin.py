@@ -1,8 +1,9 @@
 from django.contrib import admin
 
-from .models import AuctionItem, User, PageView
+from .models import AuctionItem, EmailNotification, User, PageView
 
 
 admin.site.register(AuctionItem)
 admin.site.register(User)
-admin.site.register(PageView)
\ No newline at end of file
+admin.site.register(PageView)
+admin.site.register(EmailNotification)
\ No newline at end of file
@@ -0,0 +1,127 @@
+"""
+Async versions of the read-heavy API endpoints, for ASGI deployments.
+
+Under an ASGI server a request waiting on the database or the cache is just
+a suspended coroutine here, rather than a worker thread held for the whole
+request as with the DRF views in ``api.views``. The payloads are the same as
+those views return (the same serializers, cursors and cache entries), so
+clients can switch by changing the URL prefix from ``/api/`` to
+``/api/async/``:
+
+* ``auction-items/``: a keyset-paginated page, fetched with the async ORM.
+  Searches use the search engine, which is synchronous, in a worker thread.
+* ``auction-items/<id>/``: one item, fetched with ``aget``.
+* ``item-questions/?item_id=<id>``: every question on an item, streamed as
+  a JSON array while rows arrive from ``aiterator`` (see ``api.streaming``).
+
+Under WSGI these views still work, but each one runs in its own event loop.
+"""
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+
+from . import cache as api_cache
+from . import prefetch, streaming
+from .conditional import (
+    auction_item_list_validators, auction_item_validators, conditional_get, item_question_list_validators,
+)
+from .models import AuctionItem, ItemQuestion
+from .pagination import AsyncAuctionItemCursorPagination, SearchPagination
+from .search import get_search_engine
+from .serializers import AuctionItemListSerializer, AuctionItemSerializer, ItemQuestionSerializer
+from .views import AuctionItemViewSet, item_id_param
+
+
+def api_view(view):
+    """
+    The DRF defaults the sync views get from their viewsets: read-only
+    methods, signed-in users only, 404 for unknown objects, and DRF's
+    exceptions (an invalid cursor or page, a bad parameter) turned into
+    their responses.
+    """
+    @wraps(view)
+    async def inner(request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return JsonResponse({'detail': f'Method "{request.method}" not allowed.'}, status=405)
+        user = await request.auser()
+        if not user.is_authenticated:
+            return JsonResponse({'detail': 'Authentication credentials were not provided.'}, status=403)
+        try:
+            return await view(request, *args, **kwargs)
+        except Http404:
+            return JsonResponse({'detail': 'Not found.'}, status=404)
+        except APIException as exc:
+            return exception_response(exc)
+    return inner
+
+
+def exception_response(exc):
+    """
+    The response DRF's exception handler gives for ``exc``.
+    """
+    data = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+    response = JsonResponse(data, status=exc.status_code, safe=False)
+    if getattr(exc, 'wait', None):
+        response['Retry-After'] = str(int(exc.wait))
+    return response
+
+
+def list_queryset():
+    return prefetch.optimize(AuctionItem.objects.all(), AuctionItemListSerializer).only(
+        *AuctionItemViewSet.list_only_fields
+    )
+
+
+def search_page(request, term):
+    queryset = list_queryset()
+    paginator = SearchPagination()
+    page = paginator.paginate_queryset(get_search_engine(queryset.db).search(queryset, term), Request(request))
+    data = AuctionItemListSerializer(page, many=True, context={'request': request}).data
+    return paginator.get_paginated_response(data).data
+
+
+@api_view
+@conditional_get(auction_item_list_validators)
+async def auction_item_list(request):
+    term = request.GET.get('search', '').strip()
+
+    async def build():
+        if term:
+            return await sync_to_async(search_page)(request, term)
+        paginator = AsyncAuctionItemCursorPagination()
+        page = await paginator.apaginate_queryset(list_queryset(), Request(request))
+        data = AuctionItemListSerializer(page, many=True, context={'request': request}).data
+        return paginator.get_paginated_response(data).data
+
+    key = await sync_to_async(api_cache.list_key)(request.build_absolute_uri())
+    return JsonResponse(await api_cache.aget_or_build('list', key, build))
+
+
+@api_view
+@conditional_get(auction_item_validators)
+async def auction_item_detail(request, pk):
+    async def build():
+        queryset = prefetch.optimize(AuctionItem.objects.all(), AuctionItemSerializer)
+        try:
+            item = await queryset.aget(pk=pk)
+        except AuctionItem.DoesNotExist:
+            raise Http404
+        return AuctionItemSerializer(item, context={'request': request}).data
+
+    key = await sync_to_async(api_cache.item_key)(pk, request.build_absolute_uri('/'))
+    return JsonResponse(await api_cache.aget_or_build('item', key, build))
+
+
+@api_view
+@conditional_get(item_question_list_validators)
+async def item_question_list(request):
+    queryset = prefetch.optimize(ItemQuestion.objects.all(), ItemQuestionSerializer)
+    item_id = item_id_param(request.GET)
+    if item_id is not None:
+        queryset = queryset.filter(item_id=item_id)
+    serializer = ItemQuestionSerializer(context={'request': request})
+    rows = streaming.aserialized(queryset.order_by('asked_at', 'pk'), serializer)
+    return StreamingHttpResponse(streaming.ajson_array(rows), content_type='application/json')
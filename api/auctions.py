@@ -0,0 +1,139 @@
+"""
+Auction state changes that must be safe under concurrent requests.
+"""
+from decimal import Decimal, InvalidOperation
+
+from django.db import transaction
+from django.db.models import F, Value, Window
+from django.db.models.functions import Coalesce, RowNumber
+from django.db.models.lookups import LessThan
+from django.utils import timezone
+
+from .cache import bump_items
+from .models import AuctionItem, ItemBid
+from .notifications import queue_winner_notifications
+from .realtime import get_broker, item_channel
+
+
+BID_QUANTUM = Decimal('0.01')
+
+
+class BidRejected(Exception):
+    """
+    Raised when a bid is not accepted. The message is safe to show to users.
+    """
+
+
+def parse_bid_amount(value):
+    """
+    Convert a submitted bid into a two-decimal-place ``Decimal``.
+    """
+    if value is None or str(value).strip() == '':
+        raise BidRejected('Bid amount is required.')
+    try:
+        amount = Decimal(str(value).strip())
+    except InvalidOperation:
+        raise BidRejected('Bid amount must be a number.')
+    if not amount.is_finite() or amount <= 0:
+        raise BidRejected('Bid amount must be a positive number.')
+    if amount != amount.quantize(BID_QUANTUM):
+        raise BidRejected('Bid amount can have at most two decimal places.')
+    return amount.quantize(BID_QUANTUM)
+
+
+def place_bid(item_id, bidder, amount):
+    """
+    Record ``bidder``'s bid of ``amount`` on an auction item.
+
+    The price check and the price change happen in a single conditional
+    UPDATE, so of two racing bids only one can move the price past a given
+    value. The same UPDATE maintains the item's bid count, last bid time and
+    top bidder (an accepted bid is always the new highest). The ``ItemBid``
+    row is inserted in the same transaction, and the new price is published
+    to the item's realtime channel after commit.
+
+    Raises ``AuctionItem.DoesNotExist`` if there is no such item and
+    ``BidRejected`` if the auction has ended or the bid is too low.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        updated = (
+            AuctionItem.objects
+            .filter(pk=item_id, end_datetime__gt=now)
+            .filter(LessThan(Coalesce('current_bid', 'starting_bid'), Value(amount)))
+            .update(
+                current_bid=amount, bid_count=F('bid_count') + 1, last_bid_at=now,
+                top_bidder=bidder, updated_at=now,
+            )
+        )
+        if not updated:
+            end_datetime = (
+                AuctionItem.objects
+                .values_list('end_datetime', flat=True)
+                .get(pk=item_id)
+            )
+            if end_datetime <= now:
+                raise BidRejected('This auction has ended.')
+            raise BidRejected('Bid must be higher than current bid.')
+
+        bid = ItemBid.objects.create(item_id=item_id, bidder=bidder, amount=amount)
+        bump_items(bid.item_id)
+        message = {'id': bid.item_id, 'current_bid': str(amount), 'bidder': bidder.username}
+        transaction.on_commit(lambda: get_broker().publish(item_channel(bid.item_id), message), robust=True)
+    return bid
+
+
+def close_ended_auctions(now, batch_size, item_ids=None):
+    """
+    Close up to ``batch_size`` auctions that ended by ``now`` and return them.
+
+    Rows locked by another closer are skipped (``SKIP LOCKED``), the winners
+    for the whole chunk come from one window-function query, and the chunk
+    is committed on its own. Winner emails are queued in the outbox in the
+    same transaction and delivered later, so no row locks are held while
+    talking to the mail server.
+
+    ``item_ids`` optionally restricts the chunk to specific auctions.
+    """
+    with transaction.atomic():
+        ended = (
+            AuctionItem.objects
+            .select_for_update(skip_locked=True)
+            .filter(end_datetime__lte=now, ended_processed=False)
+            .order_by('end_datetime', 'id')
+            .only('id', 'title', 'winner')
+        )
+        if item_ids is not None:
+            ended = ended.filter(pk__in=item_ids)
+        items = list(ended[:batch_size])
+        if not items:
+            return []
+
+        top_bids = {
+            bid.item_id: bid
+            for bid in (
+                ItemBid.objects
+                .filter(item_id__in=[item.pk for item in items])
+                .annotate(position=Window(
+                    RowNumber(),
+                    partition_by=F('item_id'),
+                    order_by=[F('amount').desc(), F('timestamp').asc()],
+                ))
+                .filter(position=1)
+                .select_related('bidder')
+            )
+        }
+
+        changed_at = timezone.now()
+        for item in items:
+            top_bid = top_bids.get(item.pk)
+            if top_bid:
+                item.winner = top_bid.bidder
+                item.winning_bid = top_bid.amount
+            item.ended_processed = True
+            item.updated_at = changed_at
+        AuctionItem.objects.bulk_update(items, ['winner', 'winning_bid', 'ended_processed', 'updated_at'])
+        bump_items(*(item.pk for item in items))
+
+        queue_winner_notifications(items)
+    return items
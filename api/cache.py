@@ -0,0 +1,200 @@
+"""
+Versioned read-through cache for serialized auction item payloads.
+
+Every cached payload's key contains a version number. Changing an item bumps
+its version (and the version shared by all list pages) instead of deleting
+keys, so stale entries are never read again and simply expire.
+
+Bumps happen immediately and again after the surrounding transaction
+commits, so a request that reads the old rows before the commit cannot
+repopulate the cache with them under the new version.
+
+A replica may not have caught up with a bump, so payloads built from a
+replica are stored under separate keys, briefly, and only requests that may
+read from a replica use them. Requests pinned to the primary build from it
+and fill the primary keys, which replica readers also use.
+"""
+import threading
+import time
+from collections import Counter
+from hashlib import sha1
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.encoding import force_bytes
+
+from project import routers
+
+
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def get_cache():
+    return caches[getattr(settings, 'API_CACHE_ALIAS', 'default')]
+
+
+def timeout():
+    """
+    Seconds to keep a newly built payload; 0 means payloads are not cached.
+    Payloads read from a replica may miss writes that have not replicated
+    yet, so they are kept for REPLICA_CACHE_TIMEOUT at most.
+    """
+    seconds = getattr(settings, 'API_CACHE_TIMEOUT', 300)
+    if seconds > 0 and routers.reading_from_replicas():
+        return min(seconds, getattr(settings, 'REPLICA_CACHE_TIMEOUT', 10))
+    return seconds
+
+
+def _version_key(name):
+    return f"version:{name}"
+
+
+def get_version(name):
+    """
+    Current version number for ``name``. Missing versions start from the
+    clock, so a version lost to eviction cannot collide with an old one.
+    """
+    cache = get_cache()
+    key = _version_key(name)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def _bump(name):
+    cache = get_cache()
+    key = _version_key(name)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=None)
+
+
+def bump(*names):
+    """
+    Invalidate everything cached under ``names``, now and after commit.
+    """
+    for name in names:
+        _bump(name)
+    transaction.on_commit(lambda: [_bump(name) for name in names])
+
+
+def item_version_name(item_id):
+    return f"item:{item_id}"
+
+
+LIST_VERSION_NAME = 'items'
+
+
+def bump_items(*item_ids):
+    """
+    Invalidate the cached payloads of the given items and every list page.
+    """
+    bump(LIST_VERSION_NAME, *(item_version_name(pk) for pk in item_ids))
+
+
+QUESTION_VERSION_NAME = 'questions'
+
+
+def question_version_name(item_id):
+    return f"questions:{item_id}"
+
+
+def bump_questions(*item_ids):
+    """
+    Invalidate the validators of every question list and of the given
+    items' question threads.
+    """
+    bump(QUESTION_VERSION_NAME, *(question_version_name(pk) for pk in item_ids))
+
+
+def item_key(item_id, variant=''):
+    return f"item:{item_id}:{get_version(item_version_name(item_id))}:{_digest(variant)}"
+
+
+def list_key(variant):
+    return f"items:{get_version(LIST_VERSION_NAME)}:{_digest(variant)}"
+
+
+def _digest(value):
+    return sha1(force_bytes(value)).hexdigest()
+
+
+def _keys(key):
+    """
+    The keys to look ``key`` up under, the one to store a new payload under
+    last.
+    """
+    if routers.reading_from_replicas():
+        return [key, f"replica:{key}"]
+    return [key]
+
+
+def _cached(found, keys):
+    for key in keys:
+        if found.get(key) is not None:
+            return found[key]
+    return None
+
+
+def get_or_build(kind, key, build):
+    """
+    Return the payload cached under ``key``, building and storing it on a
+    miss. ``kind`` labels the hit/miss counters.
+    """
+    if timeout() <= 0:
+        return build()
+    cache = get_cache()
+    keys = _keys(key)
+    payload = _cached(cache.get_many(keys), keys)
+    if payload is not None:
+        _count(kind, 'hits')
+        return payload
+    _count(kind, 'misses')
+    payload = build()
+    cache.set(keys[-1], payload, timeout())
+    return payload
+
+
+async def aget_or_build(kind, key, build):
+    """
+    ``get_or_build`` for async views; ``build`` is a coroutine function.
+    """
+    if timeout() <= 0:
+        return await build()
+    cache = get_cache()
+    keys = _keys(key)
+    payload = _cached(await cache.aget_many(keys), keys)
+    if payload is not None:
+        _count(kind, 'hits')
+        return payload
+    _count(kind, 'misses')
+    payload = await build()
+    await cache.aset(keys[-1], payload, timeout())
+    return payload
+
+
+def _count(kind, outcome):
+    with _stats_lock:
+        _stats[(kind, outcome)] += 1
+
+
+def stats():
+    """
+    Hit/miss counters for this process, e.g. ``{'item': {'hits': 3, 'misses': 1}}``.
+    """
+    with _stats_lock:
+        snapshot = dict(_stats)
+    result = {}
+    for (kind, outcome), count in sorted(snapshot.items()):
+        result.setdefault(kind, {'hits': 0, 'misses': 0})[outcome] = count
+    return result
+
+
+def reset_stats():
+    with _stats_lock:
+        _stats.clear()
@@ -0,0 +1,21 @@
+"""
+System checks for deployment settings (``manage.py check --deploy``).
+"""
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+from project import cache
+
+
+@register(Tags.caches, deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    if cache.is_shared(settings.CACHES['default']):
+        return []
+    return [Warning(
+        "The default cache is kept separately by each worker process.",
+        hint=(
+            "With more than one worker, set CACHE_BACKEND to file or redis. Otherwise rate limits "
+            "are counted per worker and the API payload cache stays off."
+        ),
+        id='api.W001',
+    )]
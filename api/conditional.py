@@ -0,0 +1,135 @@
+"""
+Conditional GET support (ETag / Last-Modified) for the API.
+
+Validators come from ``updated_at`` columns instead of hashing response
+bodies, so a client whose copy is current gets a 304 without the view or
+its serializer running. Auction item validators are kept in the versioned
+cache next to the payloads they describe, which makes a repeated request
+for an unchanged item free of database queries. Collections are tagged
+with the version numbers that ``api.signals`` bumps whenever one of their
+rows is saved or deleted, so validating a list never reads the table.
+"""
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.utils.cache import get_conditional_response, patch_cache_control, quote_etag
+from django.utils.http import http_date
+
+from . import cache as api_cache
+from .models import AuctionItem, ItemQuestion
+
+
+def conditional_get(validators):
+    """
+    Decorator answering conditional GET and HEAD requests for a view.
+
+    ``validators(request, *args, **kwargs)`` returns ``(etag, last_modified)``
+    for the requested resource (``last_modified`` may be ``None``), or
+    ``None`` if there is nothing to validate, e.g. the resource does not
+    exist. Other methods go straight to the view. For async views the
+    validators run in a worker thread.
+    """
+    def decorator(view):
+        if iscoroutinefunction(view):
+            @wraps(view)
+            async def ainner(request, *args, **kwargs):
+                if request.method not in ('GET', 'HEAD'):
+                    return await view(request, *args, **kwargs)
+                state = await sync_to_async(validators)(request, *args, **kwargs)
+                if state is None:
+                    return await view(request, *args, **kwargs)
+                etag, timestamp = _normalize(state)
+                response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+                if response is None:
+                    response = await view(request, *args, **kwargs)
+                return _add_validators(response, etag, timestamp)
+            return ainner
+
+        @wraps(view)
+        def inner(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(request, *args, **kwargs)
+            state = validators(request, *args, **kwargs)
+            if state is None:
+                return view(request, *args, **kwargs)
+            etag, timestamp = _normalize(state)
+            response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+            if response is None:
+                response = view(request, *args, **kwargs)
+            return _add_validators(response, etag, timestamp)
+        return inner
+    return decorator
+
+
+def _normalize(state):
+    etag, last_modified = state
+    return quote_etag(etag), int(last_modified.timestamp()) if last_modified else None
+
+
+def _add_validators(response, etag, timestamp):
+    if response.status_code in (200, 304):
+        response.headers.setdefault('ETag', etag)
+        if timestamp is not None:
+            response.headers.setdefault('Last-Modified', http_date(timestamp))
+    # Revalidate every time instead of trusting heuristic freshness:
+    # prices change while a page is open.
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def _version(moment):
+    return f"{moment.timestamp():.6f}"
+
+
+def _collection_etag(prefix, name):
+    # No Last-Modified: a deletion would not move it forward.
+    return f"{prefix}-{api_cache.get_version(name)}", None
+
+
+def auction_item_validators(request, pk=None, **kwargs):
+    def build():
+        try:
+            updated_at = AuctionItem.objects.filter(pk=pk).values_list('updated_at', flat=True).first()
+        except ValueError:
+            return None
+        if updated_at is None:
+            return None
+        return f"item-{pk}-{_version(updated_at)}", updated_at
+
+    return api_cache.get_or_build('item-validators', api_cache.item_key(pk, 'validators'), build)
+
+
+def auction_item_list_validators(request, **kwargs):
+    # Every page and search shares one tag.
+    return _collection_etag('items', api_cache.LIST_VERSION_NAME)
+
+
+def item_question_validators(request, pk=None, **kwargs):
+    try:
+        updated_at = ItemQuestion.objects.filter(pk=pk).values_list('updated_at', flat=True).first()
+    except ValueError:
+        return None
+    if updated_at is None:
+        return None
+    return f"question-{pk}-{_version(updated_at)}", updated_at
+
+
+def item_question_list_validators(request, **kwargs):
+    item_id = request.GET.get('item_id')
+    if item_id:
+        return item_question_thread_validators(request, pk=item_id)
+    return _collection_etag('questions', api_cache.QUESTION_VERSION_NAME)
+
+
+def item_question_thread_validators(request, pk=None, **kwargs):
+    try:
+        item_id = int(pk)
+    except (TypeError, ValueError):
+        return None
+    return _collection_etag(f"questions-{item_id}", api_cache.question_version_name(item_id))
+
+
+def profile_validators(request):
+    # Everyone's profile lives at the same URL, so the user is part of the tag.
+    user = request.user
+    return f"profile-{user.pk}-{_version(user.updated_at)}", user.updated_at
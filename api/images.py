@@ -0,0 +1,377 @@
+"""
+Uploaded image handling: validation, metadata stripping and resized variants.
+
+``clean_upload`` runs on the request path. It checks that an upload is a real
+JPEG, PNG or WebP image of sensible dimensions and re-encodes it without EXIF
+data (camera details, GPS position), applying the EXIF orientation first.
+
+Resizing is slower, so it happens after the upload is committed:
+``api.signals`` hands new images to ``ImagePipeline``, whose worker threads
+write WebP and JPEG copies at each of ``VARIANT_SIZES`` plus a tiny blurred
+placeholder, and record them in the model's ``<field>_variants`` and
+``<field>_placeholder`` columns. The ``process_images`` command does the same
+for existing media across several processes.
+"""
+import base64
+import logging
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
+from io import BytesIO
+from pathlib import PurePosixPath
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile, File
+from django.db import close_old_connections
+from django.utils import timezone
+from PIL import ExifTags, Image, ImageOps, UnidentifiedImageError
+
+from project.auth import user_cache
+
+from .cache import bump_items
+from .models import AuctionItem, User
+
+
+logger = logging.getLogger(__name__)
+
+# Longest edge, in pixels, of each generated variant.
+VARIANT_SIZES = {'thumb': 160, 'card': 480, 'large': 1200}
+
+VARIANT_FORMATS = {'webp': 'WEBP', 'jpeg': 'JPEG'}
+
+PLACEHOLDER_SIZE = 16
+
+ALLOWED_FORMATS = {'JPEG': 'jpg', 'PNG': 'png', 'WEBP': 'webp'}
+
+# The image field of each model that has one.
+IMAGE_FIELDS = {AuctionItem: 'image', User: 'profile_picture'}
+
+
+def max_pixels():
+    return getattr(settings, 'IMAGE_MAX_PIXELS', 40_000_000)
+
+
+def max_upload_size():
+    return getattr(settings, 'IMAGE_MAX_UPLOAD_SIZE', 15 * 1024 * 1024)
+
+
+def variants_field(field_name):
+    return f"{field_name}_variants"
+
+
+def placeholder_field(field_name):
+    return f"{field_name}_placeholder"
+
+
+def _open(data):
+    image = Image.open(BytesIO(data) if isinstance(data, bytes) else data)
+    if image.format not in ALLOWED_FORMATS:
+        raise ValidationError("Upload a JPEG, PNG or WebP image.")
+    if image.width * image.height > max_pixels():
+        raise ValidationError("This image is too large.")
+    return image
+
+
+def _flatten(image, background=(255, 255, 255)):
+    """
+    Convert to RGB, painting any transparency onto ``background``.
+    """
+    if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+        image = image.convert('RGBA')
+        flat = Image.new('RGB', image.size, background)
+        flat.paste(image, mask=image.getchannel('A'))
+        return flat
+    return image.convert('RGB')
+
+
+def clean_upload(upload):
+    """
+    Validate an uploaded image and return a copy without metadata.
+
+    The copy is written to a temporary file rather than held in memory.
+    Raises ``ValidationError`` if the file is not an acceptable image.
+    """
+    if upload.size is not None and upload.size > max_upload_size():
+        raise ValidationError("This image is too large.")
+    try:
+        with _open(upload) as image:
+            image_format = image.format
+            image.verify()
+        upload.seek(0)
+        with _open(upload) as image:
+            options = {'icc_profile': image.info.get('icc_profile')}
+            # Rotating copies the whole decoded image; most photos don't need it.
+            if image.getexif().get(ExifTags.Base.Orientation, 1) != 1:
+                image = ImageOps.exif_transpose(image)
+            if image_format == 'JPEG':
+                if image.mode not in ('RGB', 'L', 'CMYK'):
+                    image = image.convert('RGB')
+                # No optimize=True: it makes the encoder buffer the whole output.
+                options.update(quality=90)
+            stem = PurePosixPath(upload.name or 'image').stem
+            extension = ALLOWED_FORMATS[image_format]
+            output = File(tempfile.TemporaryFile(), name=f"{stem}.{extension}")
+            # No exif= argument, so none of the original metadata is written.
+            image.save(output, image_format, **options)
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, SyntaxError, ValueError):
+        raise ValidationError("Upload a valid image.")
+
+    output.size = output.tell()
+    output.seek(0)
+    return output
+
+
+def render_variants(data, sizes=VARIANT_SIZES):
+    """
+    Resize the image in ``data`` (bytes) to each of ``sizes``.
+
+    Returns ``(info, files)``: ``info`` holds every variant's dimensions and
+    the placeholder data URI, and ``files`` maps
+    ``(size, format)`` to encoded bytes. Touches neither the database nor
+    storage, so it can run in another process.
+    """
+    with _open(data) as image:
+        # Let the JPEG decoder scale down while decoding; far cheaper than
+        # decoding a full camera photo and resizing it afterwards.
+        image.draft('RGB', (max(sizes.values()),) * 2)
+        image = ImageOps.exif_transpose(image)
+        has_alpha = image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info)
+        image = image.convert('RGBA' if has_alpha else 'RGB')
+
+    info = {'sizes': {}}
+    files = {}
+    # Largest first, each variant resized from the previous one.
+    current = image
+    for name, edge in sorted(sizes.items(), key=lambda size: -size[1]):
+        current = current.copy()
+        current.thumbnail((edge, edge), Image.LANCZOS)
+        info['sizes'][name] = {'width': current.width, 'height': current.height}
+        for extension, image_format in VARIANT_FORMATS.items():
+            output = BytesIO()
+            if image_format == 'JPEG':
+                _flatten(current).save(output, image_format, quality=82, optimize=True, progressive=True)
+            else:
+                current.save(output, image_format, quality=80, method=4)
+            files[(name, extension)] = output.getvalue()
+
+    tiny = current.copy()
+    tiny.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE), Image.BILINEAR)
+    output = BytesIO()
+    _flatten(tiny).save(output, 'JPEG', quality=40)
+    info['placeholder'] = "data:image/jpeg;base64," + base64.b64encode(output.getvalue()).decode('ascii')
+    return info, files
+
+
+def variant_name(source, size, extension):
+    path = PurePosixPath(source)
+    return str(path.parent / 'variants' / f"{path.stem}-{size}.{extension}")
+
+
+def needs_processing(instance, field_name):
+    """
+    Whether the image in ``field_name`` has changed since variants were made.
+    """
+    file = getattr(instance, field_name)
+    variants = getattr(instance, variants_field(field_name)) or {}
+    return (file.name or '') != variants.get('source', '')
+
+
+def store_variants(model, pk, field_name, source, info, files):
+    """
+    Save rendered variants next to ``source`` and record them on the row,
+    unless the row's image has been replaced in the meantime.
+    """
+    field = model._meta.get_field(field_name)
+    storage = field.storage
+    previous = (
+        model._default_manager
+        .filter(pk=pk)
+        .values_list(variants_field(field_name), flat=True)
+        .first()
+    ) or {}
+
+    saved = []
+    for (size, extension), content in files.items():
+        name = storage.save(variant_name(source, size, extension), ContentFile(content))
+        saved.append(name)
+        info['sizes'][size][extension] = name
+    info['source'] = source
+
+    updated = model._default_manager.filter(pk=pk, **{field_name: source}).update(**{
+        variants_field(field_name): info,
+        placeholder_field(field_name): info.pop('placeholder'),
+        'updated_at': timezone.now(),
+    })
+    if not updated:
+        stale = saved
+    elif _in_use(model, field_name, previous.get('source'), pk):
+        stale = []
+    else:
+        stale = _variant_files(previous)
+    for name in stale:
+        storage.delete(name)
+    if updated:
+        _changed(model, pk)
+    return bool(updated)
+
+
+def clear_variants(model, pk, field_name):
+    storage = model._meta.get_field(field_name).storage
+    rows = model._default_manager.filter(pk=pk, **{field_name: ''})
+    previous = rows.values_list(variants_field(field_name), flat=True).first() or {}
+    if rows.update(**{variants_field(field_name): {}, placeholder_field(field_name): '', 'updated_at': timezone.now()}):
+        if not _in_use(model, field_name, previous.get('source'), pk):
+            for name in _variant_files(previous):
+                storage.delete(name)
+        _changed(model, pk)
+
+
+def _changed(model, pk):
+    """
+    Drop cached copies of a row whose images were updated in the database.
+    ``QuerySet.update`` sends no signals, so this stands in for them.
+    """
+    if model is AuctionItem:
+        bump_items(pk)
+    elif model is User:
+        user_cache.forget(pk)
+
+
+def _in_use(model, field_name, source, pk):
+    """
+    Whether rows other than ``pk`` still show ``source`` (and its variants).
+    """
+    return bool(source) and model._default_manager.filter(**{field_name: source}).exclude(pk=pk).exists()
+
+
+def _variant_files(variants):
+    return [
+        name
+        for size in (variants.get('sizes') or {}).values()
+        for extension, name in size.items() if extension in VARIANT_FORMATS
+    ]
+
+
+def reuse_variants(model, pk, field_name, source):
+    """
+    Copy the variants of another row showing the same (deduplicated) image.
+    """
+    twin = (
+        model._default_manager
+        .filter(**{field_name: source, f"{variants_field(field_name)}__source": source})
+        .exclude(pk=pk)
+        .values(variants_field(field_name), placeholder_field(field_name))
+        .first()
+    )
+    if twin is None:
+        return False
+    updated = model._default_manager.filter(pk=pk, **{field_name: source}).update(**twin, updated_at=timezone.now())
+    if updated:
+        _changed(model, pk)
+    return True
+
+
+def process_image(model, pk, field_name):
+    """
+    Generate and record variants for one row's image if they are missing.
+    """
+    instance = model._default_manager.filter(pk=pk).only('pk', field_name, variants_field(field_name)).first()
+    if instance is None or not needs_processing(instance, field_name):
+        return False
+    file = getattr(instance, field_name)
+    if not file:
+        clear_variants(model, pk, field_name)
+        return True
+    if reuse_variants(model, pk, field_name, file.name):
+        return True
+    with file.open('rb'):
+        data = file.read()
+    info, files = render_variants(data)
+    return store_variants(model, pk, field_name, file.name, info, files)
+
+
+def variant_urls(instance, field_name, build_url=None):
+    """
+    Public URLs of an instance's variants, by size and format, e.g.
+    ``{'card': {'width': 480, 'height': 360, 'webp': '...', 'jpeg': '...'}}``.
+    """
+    variants = getattr(instance, variants_field(field_name)) or {}
+    storage = instance._meta.get_field(field_name).storage
+    urls = {}
+    for size, entry in (variants.get('sizes') or {}).items():
+        urls[size] = {}
+        for key, value in entry.items():
+            if key in VARIANT_FORMATS:
+                url = storage.url(value)
+                value = build_url(url) if build_url else url
+            urls[size][key] = value
+    return urls
+
+
+class ImagePipeline:
+    """
+    Runs ``process_image`` on a small pool of worker threads.
+
+    Pillow releases the GIL while decoding, resizing and encoding, so a few
+    threads keep up with uploads without holding up the requests that made
+    them. With ``workers=0`` images are processed immediately instead.
+    """
+
+    def __init__(self, workers=2):
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='images') if workers else None
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def submit(self, model, pk, field_name):
+        if self._executor is None:
+            self._run(model, pk, field_name)
+            return
+        future = self._executor.submit(self._run_in_worker, model, pk, field_name)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+
+    def _done(self, future):
+        with self._lock:
+            self._pending.discard(future)
+
+    def pending(self):
+        with self._lock:
+            return len(self._pending)
+
+    def join(self):
+        """
+        Wait until the images submitted so far have been processed.
+        """
+        with self._lock:
+            futures = list(self._pending)
+        wait(futures)
+
+    def _run_in_worker(self, model, pk, field_name):
+        close_old_connections()
+        try:
+            self._run(model, pk, field_name)
+        finally:
+            close_old_connections()
+
+    @staticmethod
+    def _run(model, pk, field_name):
+        try:
+            process_image(model, pk, field_name)
+        except Exception:
+            logger.exception("Could not process %s %s of %s %s", field_name, model.__name__, pk)
+
+
+@lru_cache(maxsize=None)
+def _pipeline(workers):
+    return ImagePipeline(workers)
+
+
+def get_pipeline():
+    """
+    Return the process-wide pipeline sized by ``settings.IMAGE_WORKERS``.
+    """
+    return _pipeline(getattr(settings, 'IMAGE_WORKERS', 2))
@@ -0,0 +1,323 @@
+import csv
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+
+from django.core.files import File
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils import timezone
+
+from api import cache as api_cache
+from api.images import get_pipeline
+from api.models import AuctionItem, ItemBid, ItemQuestion, User
+from api.scheduler import NOTIFY_CHANNEL
+from api.search import get_search_engine
+from api.serializers import AuctionItemSerializer, ItemBidSerializer, ItemQuestionSerializer
+
+
+@dataclass
+class Entry:
+    """
+    One item record and the bid and question records that follow it.
+    """
+    line: int
+    data: dict
+    bids: list = field(default_factory=list)
+    questions: list = field(default_factory=list)
+
+    def __len__(self):
+        return 1 + len(self.bids) + len(self.questions)
+
+
+class Command(BaseCommand):
+    help = "Import auction items with their bids and questions from a CSV or JSON Lines file"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import, or - for standard input.")
+        parser.add_argument(
+            "--format", choices=("csv", "jsonl"),
+            help="Input format; by default taken from the file extension.",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=1000,
+            help="Rows validated and inserted per transaction.",
+        )
+        parser.add_argument(
+            "--image-root",
+            help="Directory relative image paths are read from; defaults to the file's directory.",
+        )
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_format = options["format"] or os.path.splitext(path)[1].lstrip(".").lower()
+        if file_format == "ndjson":
+            file_format = "jsonl"
+        if file_format not in ("csv", "jsonl"):
+            raise CommandError("Cannot tell the input format; pass --format csv or --format jsonl.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+        self.using = options["database"]
+        self.image_root = options["image_root"] or (os.getcwd() if path == "-" else os.path.dirname(os.path.abspath(path)))
+        self.counts = {"items": 0, "bids": 0, "questions": 0, "rejected": 0}
+
+        started = time.monotonic()
+        stream = sys.stdin if path == "-" else open(path, newline="", encoding="utf-8")
+        try:
+            for batch in self.batches(self.entries(self.records(stream, file_format)), options["batch_size"]):
+                self.import_batch(batch)
+                self.progress(started)
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+        # Let the image variants queued by the last batches finish before
+        # the process exits.
+        get_pipeline().join()
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {self.counts['items']} items, {self.counts['bids']} bids and "
+            f"{self.counts['questions']} questions ({self.counts['rejected']} rows rejected) "
+            f"in {elapsed:.2f}s, {self.imported() / max(elapsed, 1e-9):.0f} rows/s."
+        ))
+
+    def imported(self):
+        return self.counts["items"] + self.counts["bids"] + self.counts["questions"]
+
+    def progress(self, started):
+        elapsed = time.monotonic() - started
+        self.stdout.write(f"{self.imported()} rows imported, {self.imported() / max(elapsed, 1e-9):.0f} rows/s")
+
+    def reject(self, line, errors):
+        self.counts["rejected"] += 1
+        self.stderr.write(f"Line {line}: {errors}")
+
+    def records(self, stream, file_format):
+        """
+        Yield ``(line number, record)`` for every record in the input, with
+        empty CSV cells left out.
+        """
+        if file_format == "csv":
+            reader = csv.DictReader(stream)
+            for row in reader:
+                yield reader.line_num, {key: value for key, value in row.items() if key and value not in ("", None)}
+            return
+        for line, text in enumerate(stream, 1):
+            if not text.strip():
+                continue
+            try:
+                record = json.loads(text)
+            except ValueError as e:
+                self.reject(line, f"Invalid JSON: {e}.")
+                continue
+            if not isinstance(record, dict):
+                self.reject(line, "Expected a JSON object.")
+                continue
+            yield line, record
+
+    def entries(self, records):
+        """
+        Group records into ``Entry`` objects. A record's ``type`` is
+        ``item`` (the default), ``bid`` or ``question``; bids and questions
+        belong to the item above them. Item records in JSON may also carry
+        their own ``bids`` and ``questions`` lists.
+        """
+        entry = None
+        for line, record in records:
+            kind = record.pop("type", "item")
+            if kind == "item":
+                if entry is not None:
+                    yield entry
+                entry = Entry(line, record)
+                for name, children in (("bids", entry.bids), ("questions", entry.questions)):
+                    for child in record.pop(name, None) or ():
+                        if isinstance(child, dict):
+                            children.append((line, child))
+                        else:
+                            self.reject(line, f"Each of the {name} must be a JSON object.")
+            elif kind not in ("bid", "question"):
+                self.reject(line, f"Unknown record type {kind!r}.")
+            elif entry is None:
+                self.reject(line, f"A {kind} must follow the item it belongs to.")
+            else:
+                (entry.bids if kind == "bid" else entry.questions).append((line, record))
+        if entry is not None:
+            yield entry
+
+    @staticmethod
+    def batches(entries, size):
+        batch, rows = [], 0
+        for entry in entries:
+            batch.append(entry)
+            rows += len(entry)
+            if rows >= size:
+                yield batch
+                batch, rows = [], 0
+        if batch:
+            yield batch
+
+    def open_image(self, name):
+        path = os.path.join(self.image_root, name)
+        try:
+            return File(open(path, "rb"), name=os.path.basename(path))
+        except OSError as e:
+            raise ValueError(f"Cannot read image {name!r}: {e.strerror}.")
+
+    @staticmethod
+    def validate(serializer_class, record, required, optional=()):
+        """
+        Validate ``record``'s plain fields with ``serializer_class``. The
+        relations are resolved by the caller for the whole batch at once.
+        """
+        data = {name: record.get(name) for name in required}
+        data.update({name: record[name] for name in optional if name in record})
+        serializer = serializer_class(data=data, partial=True)
+        serializer.is_valid()
+        return serializer
+
+    def import_batch(self, batch):
+        """
+        Validate and insert one batch in a single transaction, with one
+        ``bulk_create`` per model.
+        """
+        usernames = set()
+        for entry in batch:
+            usernames.add(entry.data.get("owner"))
+            usernames.update(bid.get("bidder") for _, bid in entry.bids)
+            usernames.update(question.get("asked_by") for _, question in entry.questions)
+        usernames.discard(None)
+        users = User.objects.using(self.using).filter(username__in=usernames).in_bulk(field_name="username")
+
+        now = timezone.now()
+        items, bids, questions = [], [], []
+        for entry in batch:
+            item = self.build_item(entry, users)
+            if item is None:
+                continue
+            item_bids = self.build_bids(entry, item, users)
+            item_questions = self.build_questions(entry, item, users, now)
+            if item_bids:
+                # Highest bid first, earliest first among equal amounts.
+                top = max(item_bids, key=lambda bid: bid.amount)
+                item.current_bid, item.top_bidder = top.amount, top.bidder
+                item.bid_count, item.last_bid_at = len(item_bids), now
+            items.append(item)
+            bids += item_bids
+            questions += item_questions
+
+        with transaction.atomic(using=self.using):
+            # The pks bulk_create assigns to the items reach the bids and
+            # questions built against them when those are inserted.
+            AuctionItem.objects.using(self.using).bulk_create(items)
+            ItemBid.objects.using(self.using).bulk_create(bids)
+            ItemQuestion.objects.using(self.using).bulk_create(questions)
+            # bulk_create sends no signals, so index, schedule and queue
+            # image variants here.
+            get_search_engine(self.using).index_many(items)
+            self.notify_scheduler([item.pk for item in items])
+            self.queue_images([item.pk for item in items if item.image])
+            if items:
+                api_cache.bump_items()
+            if questions:
+                api_cache.bump_questions(*{question.item_id for question in questions})
+
+        self.counts["items"] += len(items)
+        self.counts["bids"] += len(bids)
+        self.counts["questions"] += len(questions)
+
+    def build_item(self, entry, users):
+        record = dict(entry.data)
+        owner = users.get(record.get("owner"))
+        if owner is None:
+            self.reject(entry.line, f"Unknown owner {record.get('owner')!r}.")
+            return None
+        image = None
+        if record.get("image"):
+            try:
+                image = record["image"] = self.open_image(record["image"])
+            except ValueError as e:
+                self.reject(entry.line, str(e))
+                return None
+        try:
+            serializer = AuctionItemSerializer(data=record)
+            valid = serializer.is_valid()
+        finally:
+            # The source file is only read while validating.
+            if image is not None:
+                image.close()
+        if not valid:
+            self.reject(entry.line, serializer.errors)
+            return None
+        data = serializer.validated_data
+        if isinstance(data.get("image"), File):
+            data["image"] = self.store_image(data["image"])
+        return AuctionItem(owner=owner, **data)
+
+    @staticmethod
+    def store_image(image):
+        """
+        Save a cleaned image and close it, returning the stored name, so a
+        batch holds image names rather than open temporary files.
+        """
+        field = AuctionItem._meta.get_field("image")
+        with image:
+            return field.storage.save(field.generate_filename(None, image.name), image)
+
+    def build_bids(self, entry, item, users):
+        bids = []
+        for line, record in entry.bids:
+            bidder = users.get(record.get("bidder"))
+            serializer = self.validate(ItemBidSerializer, record, ["amount"])
+            if bidder is None:
+                self.reject(line, f"Unknown bidder {record.get('bidder')!r}.")
+            elif not serializer.is_valid():
+                self.reject(line, serializer.errors)
+            elif serializer.validated_data["amount"] <= item.starting_bid:
+                self.reject(line, "Bid must be higher than the starting bid.")
+            else:
+                bids.append(ItemBid(item=item, bidder=bidder, amount=serializer.validated_data["amount"]))
+        return bids
+
+    def build_questions(self, entry, item, users, now):
+        questions = []
+        for line, record in entry.questions:
+            asked_by = users.get(record.get("asked_by"))
+            serializer = self.validate(ItemQuestionSerializer, record, ["question_text"], ["answer_text"])
+            if asked_by is None:
+                self.reject(line, f"Unknown user {record.get('asked_by')!r}.")
+            elif not serializer.is_valid():
+                self.reject(line, serializer.errors)
+            else:
+                answered_at = now if serializer.validated_data.get("answer_text") else None
+                questions.append(ItemQuestion(item=item, asked_by=asked_by, answered_at=answered_at, **serializer.validated_data))
+        return questions
+
+    def queue_images(self, item_ids):
+        """
+        Queue resized variants of the batch's images once it is committed,
+        as the post_save signal does for items saved one at a time.
+        """
+        if not item_ids:
+            return
+        pipeline = get_pipeline()
+        transaction.on_commit(
+            lambda: [pipeline.submit(AuctionItem, pk, "image") for pk in item_ids], using=self.using,
+        )
+
+    def notify_scheduler(self, item_ids):
+        """
+        Tell a running auction scheduler about the new deadlines, with one
+        statement for the batch instead of the per-item signal.
+        """
+        connection = connections[self.using]
+        if connection.vendor != "postgresql" or not item_ids:
+            return
+
+        def notify():
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_notify(%s, id::text) FROM unnest(%s) AS id", [NOTIFY_CHANNEL, item_ids])
+
+        transaction.on_commit(notify, using=self.using)
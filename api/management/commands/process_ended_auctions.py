@@ -1,63 +1,48 @@
+import time
+
 from django.core.management.base import BaseCommand
 from django.utils import timezone
-from django.core.mail import send_mail
-from django.conf import settings
-from django.db import transaction
 
-from api.models import AuctionItem, ItemBid
+from api.auctions import close_ended_auctions
+from api.notifications import OutboxSender
 
 class Command(BaseCommand):
     help = "Find ended auctions, determine winner, send confirmation email"
 
-    @transaction.atomic
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=100,
+            help="Number of auctions closed per transaction.",
+        )
+        parser.add_argument(
+            "--max-seconds", type=float, default=None,
+            help="Stop starting new batches after this many seconds.",
+        )
+        parser.add_argument(
+            "--no-notify", action="store_true",
+            help="Only queue winner emails; leave delivery to send_notifications.",
+        )
+
     def handle(self, *args, **options):
         now = timezone.now()
-
-        ended = (
-            AuctionItem.objects
-            .select_for_update()
-            .filter(end_datetime__lte=now, ended_processed=False)
-        )
+        started = time.monotonic()
+        max_seconds = options["max_seconds"]
 
         count = 0
-        for item in ended:
-            top_bid = (
-                ItemBid.objects
-                .filter(item=item)
-                .order_by("-amount", "timestamp")
-                .first()
-            )
-
-            if not top_bid:
-                item.ended_processed = True
-                item.save(update_fields=["ended_processed"])
-                continue
-
-            winner = top_bid.bidder
-            item.winner = winner
-            item.winning_bid = top_bid.amount
-
-            subject = f"You won the auction: {item.title}"
-            message = (
-                f"Hi {winner.username},\n\n"
-                f"Congratulations! You won the auction for '{item.title}'.\n"
-                f"Winning bid: £{top_bid.amount}\n\n"
-                f"Please proceed to purchase the item by logging into the site.\n\n"
-                f"Thanks,\nAuction Team"
-            )
-
-            if winner.email:
-                send_mail(
-                    subject,
-                    message,
-                    settings.DEFAULT_FROM_EMAIL,
-                    [winner.email],
-                    fail_silently=False,
-                )
-                item.winner_notified_at = timezone.now()
-
-            item.ended_processed = True
-            item.save(update_fields=["winner", "winning_bid", "winner_notified_at", "ended_processed"])
-            count += 1
-
-        self.stdout.write(self.style.SUCCESS(f"Processed {count} ended auctions."))
+        won = 0
+        while True:
+            items = close_ended_auctions(now, options["batch_size"])
+            if not items:
+                break
+            count += len(items)
+            won += sum(1 for item in items if item.winner_id)
+
+            if max_seconds is not None and time.monotonic() - started >= max_seconds:
+                self.stdout.write(self.style.WARNING("Time limit reached; remaining auctions left for the next run."))
+                break
+
+        self.stdout.write(self.style.SUCCESS(f"Processed {count} ended auctions ({won} with a winner)."))
+
+        if not options["no_notify"]:
+            stats = OutboxSender().run()
+            self.stdout.write(f"Sent {stats['sent']} winner emails ({stats['failed']} failed).")
@@ -0,0 +1,101 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import django
+from django.core.management.base import BaseCommand
+
+from api.images import IMAGE_FIELDS, render_variants, store_variants, variants_field
+
+
+class Command(BaseCommand):
+    help = "Generate resized variants for uploaded images that don't have them yet"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers", type=int, default=os.cpu_count() or 1,
+            help="Resizing processes; 0 resizes in this process.",
+        )
+        parser.add_argument("--force", action="store_true", help="Regenerate variants that already exist.")
+
+    def handle(self, *args, **options):
+        jobs = list(self.pending(options["force"]))
+        started = time.monotonic()
+        if options["workers"]:
+            done, failed = self.run_parallel(jobs, options["workers"])
+        else:
+            done, failed = self.run_inline(jobs)
+        self.stdout.write(self.style.SUCCESS(
+            f"Processed {done} images ({failed} failed) in {time.monotonic() - started:.2f}s."
+        ))
+
+    def pending(self, force):
+        """
+        Yield ``(model, pk, field_name, name)`` for every image to process.
+        """
+        for model, field_name in IMAGE_FIELDS.items():
+            rows = (
+                model._default_manager
+                .exclude(**{field_name: ''})
+                .exclude(**{f"{field_name}__isnull": True})
+                .values_list('pk', field_name, variants_field(field_name))
+            )
+            for pk, name, variants in rows.iterator():
+                if force or (variants or {}).get('source') != name:
+                    yield model, pk, field_name, name
+
+    @staticmethod
+    def read(model, field_name, name):
+        with model._meta.get_field(field_name).storage.open(name, 'rb') as file:
+            return file.read()
+
+    def run_inline(self, jobs):
+        done = failed = 0
+        for model, pk, field_name, name in jobs:
+            try:
+                info, files = render_variants(self.read(model, field_name, name))
+                done += store_variants(model, pk, field_name, name, info, files)
+            except Exception as e:
+                failed += 1
+                self.stderr.write(f"{model.__name__} {pk}: {e}")
+        return done, failed
+
+    def run_parallel(self, jobs, workers):
+        """
+        Resize in ``workers`` processes while this one reads files and writes
+        results. Only a couple of images per worker are in flight at a time,
+        which bounds memory use however many images there are.
+        """
+        done = failed = 0
+        jobs = iter(jobs)
+        in_flight = {}
+        # Fresh interpreters rather than forks: a forked child would share
+        # this process's database connections.
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(workers, mp_context=context, initializer=django.setup) as pool:
+            while True:
+                while len(in_flight) < workers * 2:
+                    job = next(jobs, None)
+                    if job is None:
+                        break
+                    model, pk, field_name, name = job
+                    try:
+                        data = self.read(model, field_name, name)
+                    except OSError as e:
+                        failed += 1
+                        self.stderr.write(f"{model.__name__} {pk}: {e}")
+                        continue
+                    in_flight[pool.submit(render_variants, data)] = job
+                if not in_flight:
+                    break
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    model, pk, field_name, name = in_flight.pop(future)
+                    try:
+                        info, files = future.result()
+                        done += store_variants(model, pk, field_name, name, info, files)
+                    except Exception as e:
+                        failed += 1
+                        self.stderr.write(f"{model.__name__} {pk}: {e}")
+        return done, failed
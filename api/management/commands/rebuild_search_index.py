@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from api.search import get_search_engine
+
+
+class Command(BaseCommand):
+    help = "Rebuild the auction item full-text search index"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        engine = get_search_engine(options["database"])
+        with transaction.atomic(using=options["database"]):
+            engine.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt search index with {type(engine).__name__}."))
@@ -0,0 +1,84 @@
+import signal
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.notifications import OutboxSender
+from api.scheduler import AuctionScheduler, PollingListener, get_listener
+
+
+class Command(BaseCommand):
+    help = "Close auctions as their deadlines pass (long-running)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=100,
+            help="Number of auctions closed per transaction.",
+        )
+        parser.add_argument(
+            "--lookahead", type=int, default=1000,
+            help="Number of upcoming deadlines kept in memory.",
+        )
+        parser.add_argument(
+            "--poll-interval", type=float, default=1,
+            help="Seconds between rescans when LISTEN/NOTIFY is unavailable (at most 1).",
+        )
+        parser.add_argument(
+            "--refresh-interval", type=float, default=300,
+            help="Seconds between safety rescans when LISTEN/NOTIFY is available.",
+        )
+        parser.add_argument(
+            "--no-email", action="store_true",
+            help="Leave delivering winner emails to send_notifications.",
+        )
+
+    def handle(self, *args, **options):
+        self.stopping = False
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGTERM, self.stop)
+
+        listener = get_listener()
+        if isinstance(listener, PollingListener):
+            # New and edited auctions are only seen on a rescan, so rescan
+            # at least every second to close them about on time.
+            refresh_interval = min(options["poll_interval"], 1.0)
+            self.stdout.write(f"Polling for auction changes every {refresh_interval}s.")
+        else:
+            refresh_interval = options["refresh_interval"]
+            self.stdout.write("Listening for auction changes.")
+
+        sender = None if options["no_email"] else OutboxSender()
+        scheduler = AuctionScheduler(options["batch_size"], options["lookahead"], sender)
+        scheduler.refresh()
+        # Emails left over from an earlier run, or from send_notifications.
+        scheduler.deliver()
+        last_refresh = time.monotonic()
+        try:
+            while not self.stopping:
+                closed = scheduler.close_due()
+                if closed:
+                    self.stdout.write(self.style.SUCCESS(f"Closed {len(closed)} auctions."))
+
+                since_refresh = time.monotonic() - last_refresh
+                if since_refresh >= refresh_interval:
+                    scheduler.refresh()
+                    last_refresh = time.monotonic()
+                    # Retries that have come due since the last batch.
+                    scheduler.deliver()
+                    continue
+
+                # Wake for the next deadline, the next rescan, or at least
+                # once a second so a stop request is noticed promptly.
+                timeout = min(refresh_interval - since_refresh, 1.0)
+                deadline = scheduler.next_deadline()
+                if deadline is not None:
+                    timeout = min(timeout, scheduler.seconds_until(deadline))
+                changed = listener.wait(timeout)
+                if changed:
+                    scheduler.add(changed)
+        finally:
+            listener.close()
+        self.stdout.write("Scheduler stopped.")
+
+    def stop(self, signum, frame):
+        self.stopping = True
@@ -0,0 +1,43 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.notifications import OutboxSender
+
+
+class Command(BaseCommand):
+    help = "Deliver queued notification emails"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=4, help="Concurrent mail connections.")
+        parser.add_argument("--batch-size", type=int, default=100, help="Emails claimed at a time.")
+        parser.add_argument("--max-attempts", type=int, default=5, help="Attempts before giving up on an email.")
+        parser.add_argument("--backoff", type=float, default=60, help="Seconds before the first retry; doubles each time.")
+        parser.add_argument(
+            "--loop", type=float, default=None, metavar="SECONDS",
+            help="Keep running, checking for new emails every SECONDS.",
+        )
+
+    def handle(self, *args, **options):
+        sender = OutboxSender(
+            workers=options["workers"],
+            batch_size=options["batch_size"],
+            max_attempts=options["max_attempts"],
+            backoff=options["backoff"],
+        )
+        try:
+            while True:
+                sender.run()
+                self.report(sender)
+                if options["loop"] is None:
+                    break
+                time.sleep(options["loop"])
+        except KeyboardInterrupt:
+            pass
+
+    def report(self, sender):
+        stats = sender.stats
+        self.stdout.write(self.style.SUCCESS(
+            f"Sent {stats['sent']}, failed {stats['failed']}, skipped {stats['skipped']} "
+            f"in {stats['seconds']:.2f}s ({sender.throughput():.1f} emails/s)."
+        ))
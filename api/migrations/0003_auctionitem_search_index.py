@@ -0,0 +1,44 @@
+from django.db import migrations
+
+
+POSTGRES_DOCUMENT_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute(
+            "CREATE INDEX api_auctionitem_search_idx ON api_auctionitem "
+            f"USING gin (({POSTGRES_DOCUMENT_SQL}))"
+        )
+    elif vendor == 'sqlite':
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE api_auctionitem_fts "
+            "USING fts5(title, description, tokenize='porter unicode61')"
+        )
+        schema_editor.execute(
+            "INSERT INTO api_auctionitem_fts (rowid, title, description) "
+            "SELECT id, title, description FROM api_auctionitem"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute("DROP INDEX IF EXISTS api_auctionitem_search_idx")
+    elif vendor == 'sqlite':
+        schema_editor.execute("DROP TABLE IF EXISTS api_auctionitem_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_auctionitem_ended_processed_auctionitem_winner_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_auctionitem_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='auctionitem',
+            index=models.Index(fields=['end_datetime', 'id'], name='auction_end_datetime_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auctionitem',
+            index=models.Index(condition=models.Q(('ended_processed', False)), fields=['end_datetime'], name='auction_unprocessed_end_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='itembid',
+            index=models.Index(fields=['item', '-amount', 'timestamp'], name='itembid_item_amount_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='itemquestion',
+            index=models.Index(fields=['item', 'asked_at'], name='question_item_asked_idx'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:31
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, Max, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def fill_bid_counters(apps, schema_editor):
+    """
+    Compute the counters for existing auctions in one UPDATE.
+    """
+    AuctionItem = apps.get_model('api', 'AuctionItem')
+    ItemBid = apps.get_model('api', 'ItemBid')
+    db = schema_editor.connection.alias
+    bids = ItemBid.objects.using(db).filter(item_id=OuterRef('pk'))
+    AuctionItem.objects.using(db).filter(pk__in=ItemBid.objects.using(db).values('item_id')).update(
+        bid_count=Coalesce(
+            Subquery(bids.order_by().values('item_id').annotate(n=Count('pk')).values('n')),
+            Value(0), output_field=IntegerField(),
+        ),
+        last_bid_at=Subquery(bids.order_by().values('item_id').annotate(at=Max('timestamp')).values('at')),
+        top_bidder=Subquery(bids.order_by('-amount', 'timestamp').values('bidder_id')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='auctionitem',
+            name='bid_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='auctionitem',
+            name='last_bid_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='auctionitem',
+            name='top_bidder',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='leading_auctions', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(fill_bid_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_bid_counters'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='itemquestion',
+            index=models.Index(condition=models.Q(('answered_at__isnull', True)), fields=['item', 'asked_at'], name='question_unanswered_idx'),
+        ),
+    ]
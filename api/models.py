@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
+from django.utils import timezone
 
 # Create your models here.
 
@@ -22,12 +23,18 @@ class AuctionItem(models.Model):
         starting_bid (Decimal): The starting bid amount for the auction item.
         current_bid (Decimal): The current highest bid for the auction item.
         image (Image): An optional image of the auction item.
+        image_variants (dict): Resized copies of the image, by size and format.
+        image_placeholder (str): A tiny blurred version of the image as a data URI.
         created_at (datetime): The date and time when the auction item was created.
         end_datetime (datetime): The date and time when the auction ends.
         ended_processed (bool): Flag indicating if the auction end has been processed.
         winner (ForeignKey): The user who won the auction (if any).
         winning_bid (Decimal): The amount of the winning bid (if any).
         winner_notified_at (datetime): The date and time when the winner was notified (if any).
+        bid_count (int): How many bids have been placed on the auction item.
+        last_bid_at (datetime): The date and time of the latest bid (if any).
+        top_bidder (ForeignKey): The user with the current highest bid (if any).
+        updated_at (datetime): The date and time when the auction item last changed.
 
     """
     owner = models.ForeignKey('User', on_delete=models.CASCADE)
@@ -36,12 +43,33 @@ class AuctionItem(models.Model):
     starting_bid = models.DecimalField(max_digits=10, decimal_places=2)
     current_bid = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
     image = models.ImageField(upload_to='auction_images/', null=True, blank=True)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
+    image_placeholder = models.TextField(blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     end_datetime = models.DateTimeField()
     ended_processed = models.BooleanField(default=False)
     winner = models.ForeignKey('User', on_delete=models.SET_NULL, null=True, blank=True, related_name='won_auctions')
     winning_bid = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
     winner_notified_at = models.DateTimeField(null=True, blank=True)
+    # Kept up to date by auctions.place_bid, so pages never count bids.
+    bid_count = models.PositiveIntegerField(default=0, editable=False)
+    last_bid_at = models.DateTimeField(null=True, blank=True, editable=False)
+    top_bidder = models.ForeignKey(
+        'User', on_delete=models.SET_NULL, null=True, blank=True, editable=False, related_name='leading_auctions',
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # List pages are keyset-paginated on (end_datetime, id).
+            models.Index(fields=['end_datetime', 'id'], name='auction_end_datetime_id_idx'),
+            # process_ended_auctions only looks at auctions not yet closed.
+            models.Index(
+                fields=['end_datetime'],
+                condition=models.Q(ended_processed=False),
+                name='auction_unprocessed_end_idx',
+            ),
+        ]
 
     def __str__(self):
         """
@@ -62,6 +90,7 @@ class ItemQuestion(models.Model):
         answer_text (str): The text of the answer (if answered).
         asked_at (datetime): The date and time when the question was asked.
         answered_at (datetime): The date and time when the question was answered (if answered).
+        updated_at (datetime): The date and time when the question last changed.
     """
     
     item = models.ForeignKey(
@@ -75,7 +104,17 @@ class ItemQuestion(models.Model):
     answer_text = models.TextField(null=True, blank=True)
     asked_at = models.DateTimeField(auto_now_add=True)
     answered_at = models.DateTimeField(null=True, blank=True)
-    
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['item', 'asked_at'], name='question_item_asked_idx'),
+            # Owners' lists of questions still waiting for an answer.
+            models.Index(
+                fields=['item', 'asked_at'], condition=models.Q(answered_at__isnull=True),
+                name='question_unanswered_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"Question by {self.asked_by.username} on {self.item.title}"
@@ -97,10 +136,55 @@ class ItemBid(models.Model):
 
     class Meta:
         ordering = ['-amount', 'timestamp']
+        indexes = [
+            # Serves "bids for an item, highest first" without a sort step.
+            models.Index(fields=['item', '-amount', 'timestamp'], name='itembid_item_amount_idx'),
+        ]
 
     def __str__(self):
         return f"Bid of {self.amount} by {self.bidder} on {self.item.title}"
 
+class EmailNotification(models.Model):
+    """
+    Outbox entry for an email that still has to be (or has been) delivered.
+
+    Rows are written in the same transaction as the change they report on and
+    delivered later by the ``send_notifications`` command, so the mail server
+    is never contacted while database locks are held.
+
+    Attributes:
+        item (ForeignKey): The auction item the email is about; one email per item.
+        recipient (str): The address the email is sent to.
+        subject (str): The email subject.
+        body (str): The plain-text email body.
+        attempts (int): How many delivery attempts have been started.
+        next_attempt_at (datetime): When delivery may next be tried; null once given up.
+        sent_at (datetime): When the email was delivered (if it was).
+        last_error (str): The error from the most recent failed attempt.
+        created_at (datetime): The date and time when the email was queued.
+    """
+    item = models.OneToOneField(AuctionItem, related_name='winner_notification', on_delete=models.CASCADE)
+    recipient = models.EmailField()
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(null=True, blank=True, default=timezone.now)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['next_attempt_at'],
+                condition=models.Q(sent_at__isnull=True),
+                name='notification_pending_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f"Email to {self.recipient}: {self.subject}"
+
 class User(AbstractUser):
     """
     Model representing a custom user in the system.
@@ -110,10 +194,17 @@ class User(AbstractUser):
         email (str): The email address of the user.
         password (str): The password for the user account.
         date_of_birth (date): The date of birth of the user.
+        profile_picture (Image): An optional profile picture.
+        profile_picture_variants (dict): Resized copies of the profile picture, by size and format.
+        profile_picture_placeholder (str): A tiny blurred version of the profile picture as a data URI.
+        updated_at (datetime): The date and time when the profile last changed.
 
     """
     date_of_birth = models.DateField(null=True, blank=True)
     profile_picture = models.ImageField(upload_to='profile_pictures/', null=True, blank=True)
+    profile_picture_variants = models.JSONField(default=dict, blank=True, editable=False)
+    profile_picture_placeholder = models.TextField(blank=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         """
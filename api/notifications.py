@@ -0,0 +1,223 @@
+"""
+Emails sent to users about auction outcomes.
+
+Winner emails go through an outbox: ``queue_winner_notifications`` stores an
+``EmailNotification`` row in the same transaction that closes the auction,
+and ``OutboxSender`` delivers pending rows over reused mail connections from
+a small thread pool, retrying failures with exponential backoff.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import AuctionItem, EmailNotification
+
+
+logger = logging.getLogger(__name__)
+
+
+def winner_email(item):
+    """
+    Build the "you won" email for a closed auction with a winner.
+    """
+    winner = item.winner
+    subject = f"You won the auction: {item.title}"
+    message = (
+        f"Hi {winner.username},\n\n"
+        f"Congratulations! You won the auction for '{item.title}'.\n"
+        f"Winning bid: £{item.winning_bid}\n\n"
+        f"Please proceed to purchase the item by logging into the site.\n\n"
+        f"Thanks,\nAuction Team"
+    )
+    return EmailMessage(subject, message, settings.DEFAULT_FROM_EMAIL, [winner.email])
+
+
+def queue_winner_notifications(items):
+    """
+    Add outbox entries for the winners of ``items`` who have an email address.
+    Call this inside the transaction that records the winners.
+    """
+    notifications = []
+    for item in items:
+        if not item.winner_id or not item.winner.email:
+            continue
+        message = winner_email(item)
+        notifications.append(EmailNotification(
+            item=item, recipient=message.to[0], subject=message.subject, body=message.body,
+        ))
+    EmailNotification.objects.bulk_create(notifications, ignore_conflicts=True)
+    return len(notifications)
+
+
+class OutboxSender:
+    """
+    Deliver pending ``EmailNotification`` rows.
+
+    ``run`` starts one pool of ``workers`` threads for all its batches, and
+    each thread keeps one mail connection open for every message it sends,
+    so a run costs one handshake per thread rather than per email or per
+    batch. Database reads and writes stay on the calling thread.
+    """
+
+    def __init__(self, workers=4, batch_size=100, max_attempts=5, backoff=60, lease=600):
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.lease = lease
+        self.stats = {'sent': 0, 'failed': 0, 'skipped': 0, 'seconds': 0.0}
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def retry_delay(self, attempts):
+        """
+        Exponential backoff after the ``attempts``-th failure, capped at a day.
+        """
+        return timedelta(seconds=min(self.backoff * 2 ** (attempts - 1), 86400))
+
+    def claim(self):
+        """
+        Lease up to ``batch_size`` due notifications to this sender.
+
+        Leased rows get a ``next_attempt_at`` in the future, so concurrent
+        senders skip them; if this sender dies they become due again.
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            ids = list(
+                EmailNotification.objects
+                .select_for_update(skip_locked=True)
+                .filter(sent_at__isnull=True, next_attempt_at__lte=now)
+                .order_by('next_attempt_at')
+                .values_list('id', flat=True)[:self.batch_size]
+            )
+            EmailNotification.objects.filter(pk__in=ids).update(
+                attempts=F('attempts') + 1,
+                next_attempt_at=now + timedelta(seconds=self.lease),
+            )
+        return list(
+            EmailNotification.objects
+            .filter(pk__in=ids)
+            .select_related('item')
+            .only('id', 'recipient', 'subject', 'body', 'attempts', 'item', 'item__winner_notified_at')
+        )
+
+    def run_once(self, pool=None):
+        """
+        Claim and deliver one batch with ``pool``, or with a pool of its own
+        whose connections are closed afterwards. Returns the number of rows
+        processed.
+        """
+        if pool is None:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                try:
+                    return self.run_once(pool)
+                finally:
+                    self.close()
+
+        started = time.monotonic()
+        notifications = self.claim()
+        if not notifications:
+            return 0
+
+        # Idempotency: an item whose winner was already notified is not emailed again.
+        already_sent = [n for n in notifications if n.item.winner_notified_at]
+        to_send = [n for n in notifications if not n.item.winner_notified_at]
+
+        results = list(pool.map(self._send, to_send))
+
+        now = timezone.now()
+        sent = [n for n, error in results if error is None] + already_sent
+        EmailNotification.objects.filter(pk__in=[n.pk for n in sent]).update(sent_at=now, last_error='')
+        AuctionItem.objects.filter(
+            pk__in=[n.item_id for n in sent], winner_notified_at__isnull=True,
+        ).update(winner_notified_at=now)
+
+        for notification, error in results:
+            if error is None:
+                continue
+            logger.warning("Email %s failed (attempt %s): %s", notification.pk, notification.attempts, error)
+            retry_at = None
+            if notification.attempts < self.max_attempts:
+                retry_at = now + self.retry_delay(notification.attempts)
+            EmailNotification.objects.filter(pk=notification.pk).update(
+                next_attempt_at=retry_at, last_error=error,
+            )
+
+        self.stats['sent'] += len(sent) - len(already_sent)
+        self.stats['skipped'] += len(already_sent)
+        self.stats['failed'] += len(results) - (len(sent) - len(already_sent))
+        self.stats['seconds'] += time.monotonic() - started
+        return len(notifications)
+
+    def run(self):
+        """
+        Deliver batches until nothing is due.
+        """
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            try:
+                while self.run_once(pool):
+                    pass
+            finally:
+                self.close()
+        return self.stats
+
+    def throughput(self):
+        """
+        Emails delivered per second of sending time.
+        """
+        if not self.stats['seconds']:
+            return 0.0
+        return self.stats['sent'] / self.stats['seconds']
+
+    def close(self):
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            try:
+                connection.close()
+            except Exception:
+                logger.exception("Could not close mail connection")
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = get_connection(fail_silently=False)
+            connection.open()
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def _discard_connection(self):
+        connection, self._local.connection = getattr(self._local, 'connection', None), None
+        if connection is None:
+            return
+        with self._lock:
+            if connection in self._connections:
+                self._connections.remove(connection)
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def _send(self, notification):
+        message = EmailMessage(
+            notification.subject, notification.body, settings.DEFAULT_FROM_EMAIL, [notification.recipient],
+        )
+        try:
+            self._connection().send_messages([message])
+        except Exception as e:
+            # The connection may be broken; open a fresh one next time.
+            self._discard_connection()
+            return notification, f"{type(e).__name__}: {e}"
+        return notification, None
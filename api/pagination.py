@@ -0,0 +1,85 @@
+from rest_framework.pagination import CursorPagination, PageNumberPagination, _reverse_ordering
+
+
+class AuctionItemCursorPagination(CursorPagination):
+    """
+    Keyset pagination for auction items ordered by (end_datetime, id).
+
+    Each page is fetched with a single indexed range query, so the cost of
+    a page does not grow with the size of the catalogue.
+    """
+    ordering = ('end_datetime', 'id')
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class AsyncAuctionItemCursorPagination(AuctionItemCursorPagination):
+    """
+    ``AuctionItemCursorPagination`` for async views.
+
+    ``apaginate_queryset`` is DRF's ``paginate_queryset`` with the page read
+    through the async ORM; the cursors and links are the same.
+    """
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+
+        self.cursor = self.decode_cursor(request)
+        offset, reverse, current_position = self.cursor or (0, False, None)
+
+        queryset = queryset.order_by(*(_reverse_ordering(self.ordering) if reverse else self.ordering))
+        if current_position is not None:
+            order = self.ordering[0]
+            lookup = 'lt' if self.cursor.reverse != order.startswith('-') else 'gt'
+            queryset = queryset.filter(**{f"{order.lstrip('-')}__{lookup}": current_position})
+
+        # One extra row tells whether there is a following page.
+        results = [row async for row in queryset[offset:offset + self.page_size + 1]]
+        self.page = results[:self.page_size]
+        has_following_position = len(results) > len(self.page)
+        following_position = (
+            self._get_position_from_instance(results[-1], self.ordering) if has_following_position else None
+        )
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = current_position is not None or offset > 0
+            self.has_previous = has_following_position
+            self.next_position = current_position
+            self.previous_position = following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = current_position is not None or offset > 0
+            self.next_position = following_position
+            self.previous_position = current_position
+        return self.page
+
+
+class SearchPagination(PageNumberPagination):
+    """
+    Page-number pagination for ranked search results.
+
+    Search results are ordered by relevance rather than by a unique column,
+    so they cannot use keyset pagination.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class ItemBidCursorPagination(CursorPagination):
+    """
+    Keyset pagination for an item's bids, highest first.
+
+    Accepted bids on an item always increase, so the amount alone identifies
+    a position and each page is a range scan of the (item, -amount,
+    timestamp) index.
+    """
+    ordering = ('-amount', 'timestamp')
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
@@ -0,0 +1,90 @@
+"""
+Query planning from serializer declarations.
+
+``optimize`` reads the fields a serializer declares and adds the
+``select_related`` and ``prefetch_related`` calls they need to a queryset,
+so a list endpoint runs the same number of queries for ten rows as for a
+thousand. A source such as ``owner.username`` joins ``owner``; a nested
+serializer or a many-valued relation is prefetched. Related fields that
+only output primary keys need nothing, because the ``<name>_id`` column is
+already on the row.
+"""
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.relations import ManyRelatedField, RelatedField
+from rest_framework.serializers import BaseSerializer, ListSerializer
+
+
+def optimize(queryset, serializer_class):
+    """
+    Return ``queryset`` with the joins and prefetches ``serializer_class``
+    needs to serialize its rows without further queries.
+    """
+    select_related, prefetch_related = plan(serializer_class, queryset.model)
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    return queryset
+
+
+@lru_cache(maxsize=None)
+def plan(serializer_class, model):
+    """
+    ``(select_related, prefetch_related)`` lookups for serializing ``model``
+    rows with ``serializer_class``, as sorted tuples.
+    """
+    select_related, prefetch_related = set(), set()
+    _walk(serializer_class(), model, [], False, select_related, prefetch_related)
+    # A join already implied by a longer one is left out.
+    select_related = {
+        path for path in select_related
+        if not any(other.startswith(path + '__') for other in select_related)
+    }
+    prefetch_related = {
+        path for path in prefetch_related
+        if not any(other.startswith(path + '__') for other in prefetch_related)
+    }
+    return tuple(sorted(select_related)), tuple(sorted(prefetch_related))
+
+
+def _walk(serializer, model, prefix, many, select_related, prefetch_related):
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+        source = field.source
+        if isinstance(field, ListSerializer):
+            field, field_many = field.child, True
+        else:
+            field_many = isinstance(field, ManyRelatedField)
+
+        if source == '*':
+            if isinstance(field, BaseSerializer):
+                _walk(field, model, prefix, many, select_related, prefetch_related)
+            continue
+
+        path, current, path_many = list(prefix), model, many
+        attrs = source.split('.')
+        for position, attr in enumerate(attrs):
+            try:
+                model_field = current._meta.get_field(attr)
+            except FieldDoesNotExist:
+                break  # A property or method: nothing more can be planned.
+            if not model_field.is_relation:
+                break
+            last = position == len(attrs) - 1
+            if last and _pk_only(field) and not field_many:
+                break  # Served from the <name>_id column.
+            path.append(attr)
+            path_many = path_many or model_field.many_to_many or model_field.one_to_many
+            (prefetch_related if path_many else select_related).add('__'.join(path))
+            current = model_field.related_model
+            if last and isinstance(field, BaseSerializer):
+                _walk(field, current, path, path_many, select_related, prefetch_related)
+
+
+def _pk_only(field):
+    if isinstance(field, ManyRelatedField):
+        field = field.child_relation
+    return isinstance(field, RelatedField) and field.use_pk_only_optimization()
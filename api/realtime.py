@@ -0,0 +1,319 @@
+"""
+Publish/subscribe for pushing live auction updates to browsers.
+
+Views publish small JSON-serialisable messages to named channels (one per
+auction item, see ``item_channel``) and the server-sent events endpoint
+subscribes to them. The broker is chosen with ``settings.REALTIME_BROKER``:
+
+* ``InProcessBroker`` fans messages out to subscribers in the same process.
+  Fine for a single ASGI worker.
+* ``PostgresBroker`` sends messages through PostgreSQL NOTIFY and has one
+  listener thread per process, so every worker sees every message.
+
+Browsers receive the messages as server-sent events from
+``EventStreamApplication``, which ``project/asgi.py`` puts in front of Django.
+"""
+import asyncio
+import json
+import logging
+import re
+import select
+import threading
+import time
+from collections import defaultdict
+from functools import lru_cache
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.auth import aget_user
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections, connections
+from django.http import HttpRequest
+from django.http.cookie import parse_cookie
+from django.utils.module_loading import import_string
+
+from .models import AuctionItem
+
+
+logger = logging.getLogger(__name__)
+
+
+# Comment lines keep idle event streams open through proxies.
+SSE_KEEPALIVE_SECONDS = 15
+
+ITEM_EVENTS_PATH = re.compile(r'^/api/auction-items/(?P<pk>[0-9]+)/events/$')
+
+DISCONNECTED = object()
+
+
+def item_channel(item_id):
+    return f"item-{item_id}"
+
+
+class Subscription:
+    """
+    A subscriber's bounded message queue, living on one event loop.
+
+    Messages describe the latest state, so when a slow client falls behind
+    the oldest queued message is dropped instead of buffering without limit.
+    """
+
+    def __init__(self, broker, channel, maxsize=16):
+        self.broker = broker
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize)
+
+    def put(self, message):
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(message)
+
+    async def get(self, timeout=None):
+        """
+        Wait for the next message; ``None`` if ``timeout`` seconds pass first.
+        """
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class InProcessBroker:
+    """
+    Delivers messages to subscribers in this process only.
+
+    ``publish`` may be called from any thread (sync views run in a thread
+    pool under ASGI); delivery is handed to each subscriber's event loop.
+    """
+
+    def __init__(self):
+        self._channels = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, channel):
+        """
+        Subscribe to ``channel``. Must be called from a running event loop.
+        """
+        subscription = Subscription(self, channel)
+        with self._lock:
+            self._channels[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscribers = self._channels.get(subscription.channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._channels[subscription.channel]
+
+    def subscriber_count(self, channel=None):
+        with self._lock:
+            if channel is not None:
+                return len(self._channels.get(channel, ()))
+            return sum(len(subscribers) for subscribers in self._channels.values())
+
+    def publish(self, channel, message):
+        self.deliver(channel, message)
+
+    def deliver(self, channel, message):
+        """
+        Hand ``message`` to every local subscriber of ``channel``.
+        """
+        with self._lock:
+            subscribers = list(self._channels.get(channel, ()))
+        by_loop = defaultdict(list)
+        for subscription in subscribers:
+            by_loop[subscription.loop].append(subscription)
+        # One wake-up per event loop, however many subscribers it serves.
+        for loop, batch in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(self._put_all, batch, message)
+            except RuntimeError:
+                # The loop has shut down; its subscribers are gone.
+                pass
+
+    @staticmethod
+    def _put_all(subscriptions, message):
+        for subscription in subscriptions:
+            subscription.put(message)
+
+
+class PostgresBroker(InProcessBroker):
+    """
+    Shares messages between processes with PostgreSQL LISTEN/NOTIFY.
+
+    Publishing runs ``pg_notify``; each process starts one listener thread,
+    on its own connection, the first time something subscribes.
+    """
+
+    notify_channel = 'realtime'
+
+    def __init__(self, using='default'):
+        super().__init__()
+        self.using = using
+        self._listener = None
+
+    def publish(self, channel, message):
+        payload = json.dumps({'channel': channel, 'message': message})
+        with connections[self.using].cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [self.notify_channel, payload])
+
+    def subscribe(self, channel):
+        with self._lock:
+            if self._listener is None:
+                self._listener = threading.Thread(target=self._listen, name='realtime-listener', daemon=True)
+                self._listener.start()
+        return super().subscribe(channel)
+
+    def _listen(self):
+        wrapper = connections[self.using]
+        while True:
+            try:
+                # Connect directly rather than through DATABASE_POOL: this
+                # connection is held for as long as the process runs.
+                raw = wrapper.Database.connect(**wrapper.get_connection_params())
+                raw.autocommit = True
+                with raw.cursor() as cursor:
+                    cursor.execute(f"LISTEN {self.notify_channel}")
+                if not hasattr(raw, 'poll'):
+                    # psycopg 3: notifies() blocks until the connection fails.
+                    for notify in raw.notifies():
+                        self._dispatch(notify.payload)
+                while True:
+                    if select.select([raw], [], [], 60) == ([], [], []):
+                        continue
+                    raw.poll()
+                    while raw.notifies:
+                        self._dispatch(raw.notifies.pop(0).payload)
+            except Exception:
+                logger.exception("Realtime listener lost its connection; reconnecting")
+                time.sleep(1)
+
+    def _dispatch(self, payload):
+        data = json.loads(payload)
+        self.deliver(data['channel'], data['message'])
+
+
+@lru_cache(maxsize=None)
+def get_broker():
+    """
+    Return the process-wide broker configured by ``settings.REALTIME_BROKER``.
+    """
+    return import_string(getattr(settings, 'REALTIME_BROKER', 'api.realtime.InProcessBroker'))()
+
+
+async def database_access(awaitable):
+    """
+    Await ORM work between the connection clean-ups Django's request handler
+    runs on ``request_started`` and ``request_finished``, which never fire
+    here, so broken connections and ones past ``CONN_MAX_AGE`` are replaced.
+    """
+    await sync_to_async(close_old_connections)()
+    try:
+        return await awaitable
+    finally:
+        await sync_to_async(close_old_connections)()
+
+
+class EventStreamApplication:
+    """
+    ASGI application serving ``/api/auction-items/<id>/events/`` as a
+    server-sent events stream and passing every other request to ``app``.
+
+    Django's ASGI handler keeps a dedicated thread (and database connection)
+    for each request until its response finishes, which is far too heavy for
+    thousands of mostly idle streams. Here only the session lookup and the
+    initial price read touch the database; after that a subscriber is just a
+    coroutine and a small queue.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        match = ITEM_EVENTS_PATH.match(scope['path']) if scope['type'] == 'http' else None
+        if match is None:
+            return await self.app(scope, receive, send)
+        if scope['method'] != 'GET':
+            return await self.respond(send, 405, b'Method not allowed')
+
+        # Drain the (empty) request body.
+        message = await receive()
+        while message['type'] == 'http.request' and message.get('more_body'):
+            message = await receive()
+
+        user = await self.authenticate(scope)
+        if not user.is_authenticated:
+            return await self.respond(send, 403, b'Authentication required')
+        await self.stream(int(match['pk']), receive, send)
+
+    async def authenticate(self, scope):
+        cookies = {}
+        for name, value in scope.get('headers', []):
+            if name == b'cookie':
+                cookies.update(parse_cookie(value.decode('latin-1')))
+        request = HttpRequest()
+        engine = import_module(settings.SESSION_ENGINE)
+        request.session = engine.SessionStore(cookies.get(settings.SESSION_COOKIE_NAME))
+        return await database_access(aget_user(request))
+
+    async def stream(self, item_id, receive, send):
+        # Subscribe before reading the price so no bid falls in between.
+        subscription = get_broker().subscribe(item_channel(item_id))
+        watcher = asyncio.create_task(self.watch_disconnect(receive, subscription))
+        try:
+            item = await database_access(
+                AuctionItem.objects.filter(pk=item_id).values('current_bid', 'starting_bid').afirst()
+            )
+            if item is None:
+                return await self.respond(send, 404, b'Not found')
+
+            await send({
+                'type': 'http.response.start',
+                'status': 200,
+                'headers': [
+                    (b'content-type', b'text/event-stream'),
+                    (b'cache-control', b'no-cache'),
+                    (b'x-accel-buffering', b'no'),
+                ],
+            })
+            snapshot = {'id': item_id, 'current_bid': str(item['current_bid'] or item['starting_bid'])}
+            await self.send_event(send, f"retry: 3000\nevent: bid\ndata: {json.dumps(snapshot)}\n\n")
+            while True:
+                message = await subscription.get(timeout=SSE_KEEPALIVE_SECONDS)
+                if message is DISCONNECTED:
+                    break
+                if message is None:
+                    await self.send_event(send, ": keepalive\n\n")
+                else:
+                    await self.send_event(send, f"event: bid\ndata: {json.dumps(message)}\n\n")
+        except OSError:
+            # The server reports a vanished client by failing the send.
+            pass
+        finally:
+            subscription.close()
+            watcher.cancel()
+
+    @staticmethod
+    async def watch_disconnect(receive, subscription):
+        while (await receive())['type'] != 'http.disconnect':
+            pass
+        subscription.put(DISCONNECTED)
+
+    @staticmethod
+    async def send_event(send, text):
+        await send({'type': 'http.response.body', 'body': text.encode(), 'more_body': True})
+
+    @staticmethod
+    async def respond(send, status, body):
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(b'content-type', b'text/plain; charset=utf-8')],
+        })
+        await send({'type': 'http.response.body', 'body': body})
@@ -0,0 +1,182 @@
+"""
+In-process scheduler that closes auctions as their deadlines pass.
+
+``AuctionScheduler`` keeps a min-heap of upcoming ``(end_datetime, id)``
+pairs and sleeps until the earliest one. Changes to auction items reach it
+through a listener: PostgreSQL pushes item ids over LISTEN/NOTIFY (sent by
+``api.signals``), other databases fall back to periodic polling.
+
+Heap entries are only hints: closing goes through
+``api.auctions.close_ended_auctions``, which re-checks the deadline and the
+``ended_processed`` flag, so stale or duplicate entries are harmless.
+Given an ``OutboxSender``, the scheduler also delivers the winner emails
+each closed batch queues.
+"""
+import heapq
+import logging
+import select
+import time
+
+from django.db import connection
+from django.utils import timezone
+
+from .auctions import close_ended_auctions
+from .models import AuctionItem
+
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = 'auction_items'
+
+
+class PollingListener:
+    """
+    Listener for databases without push notifications: it just waits, and
+    the scheduler's periodic refresh picks up new and edited auctions.
+    """
+
+    def wait(self, timeout):
+        time.sleep(max(timeout, 0))
+        return []
+
+    def close(self):
+        pass
+
+
+class PostgresListener:
+    """
+    Receives auction item ids published with NOTIFY on ``NOTIFY_CHANNEL``,
+    through psycopg 3 or psycopg2.
+    """
+
+    def __init__(self):
+        connection.ensure_connection()
+        self.raw = connection.connection
+        self.queued = []
+        if not hasattr(self.raw, 'poll'):
+            # psycopg 3 hands notifications that arrive while the scheduler
+            # runs its own queries to handlers rather than queueing them.
+            self.raw.add_notify_handler(self.queued.append)
+        with connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+
+    def wait(self, timeout):
+        if hasattr(self.raw, 'poll'):
+            notifies = self._wait_psycopg2(timeout)
+        else:
+            notifies = self._wait_psycopg(timeout)
+        # A notification can reach both the handler and ``notifies()``; the
+        # scheduler would only push a harmless duplicate, but skip it anyway.
+        ids = dict.fromkeys(int(n.payload) for n in notifies if n.payload.isdigit())
+        return list(ids)
+
+    def _wait_psycopg(self, timeout):
+        # Only block if nothing arrived during the scheduler's own queries.
+        if not self.queued:
+            received = list(self.raw.notifies(timeout=max(timeout, 0), stop_after=1))
+            self.queued += received
+        notifies, self.queued[:] = list(self.queued), []
+        return notifies
+
+    def _wait_psycopg2(self, timeout):
+        # Notifications that arrived while the scheduler ran its own queries
+        # on this connection are already queued; only block if there are none.
+        self.raw.poll()
+        if not self.raw.notifies:
+            if select.select([self.raw], [], [], max(timeout, 0)) == ([], [], []):
+                return []
+            self.raw.poll()
+        notifies = list(self.raw.notifies)
+        del self.raw.notifies[:]
+        return notifies
+
+    def close(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"UNLISTEN {NOTIFY_CHANNEL}")
+
+
+def get_listener():
+    """
+    Use LISTEN/NOTIFY on PostgreSQL, polling otherwise.
+    """
+    if connection.vendor == 'postgresql':
+        return PostgresListener()
+    return PollingListener()
+
+
+class AuctionScheduler:
+    """
+    Min-heap of upcoming auction deadlines.
+
+    ``lookahead`` caps how many upcoming deadlines are held in memory; the
+    periodic refresh pulls in later ones as earlier auctions close.
+    """
+
+    def __init__(self, batch_size=100, lookahead=1000, sender=None):
+        self.batch_size = batch_size
+        self.lookahead = lookahead
+        self.sender = sender
+        self.heap = []
+
+    def refresh(self):
+        """
+        Reload the heap with the next ``lookahead`` unprocessed deadlines.
+        """
+        upcoming = (
+            AuctionItem.objects
+            .filter(ended_processed=False)
+            .order_by('end_datetime', 'id')
+            .values_list('end_datetime', 'id')[:self.lookahead]
+        )
+        self.heap = list(upcoming)
+        heapq.heapify(self.heap)
+
+    def add(self, item_ids):
+        """
+        Schedule the given (new or edited) auctions.
+        """
+        for entry in (
+            AuctionItem.objects
+            .filter(pk__in=item_ids, ended_processed=False)
+            .values_list('end_datetime', 'id')
+        ):
+            heapq.heappush(self.heap, entry)
+
+    def next_deadline(self):
+        return self.heap[0][0] if self.heap else None
+
+    @staticmethod
+    def seconds_until(deadline):
+        return max((deadline - timezone.now()).total_seconds(), 0)
+
+    def close_due(self, now=None):
+        """
+        Close every scheduled auction whose deadline has passed. Returns the
+        closed items.
+        """
+        now = now or timezone.now()
+        due = set()
+        while self.heap and self.heap[0][0] <= now:
+            due.add(heapq.heappop(self.heap)[1])
+        if not due:
+            return []
+
+        closed = []
+        due = list(due)
+        for start in range(0, len(due), self.batch_size):
+            batch = close_ended_auctions(now, self.batch_size, item_ids=due[start:start + self.batch_size])
+            if batch:
+                self.deliver()
+            closed += batch
+        return closed
+
+    def deliver(self):
+        """
+        Send the due notification emails with ``sender``, if there is one.
+        """
+        if self.sender is None:
+            return
+        try:
+            self.sender.run()
+        except Exception:
+            logger.exception("Could not deliver notification emails")
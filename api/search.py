@@ -0,0 +1,160 @@
+"""
+Full-text search over auction item titles and descriptions.
+
+The engine is picked from the database vendor (or ``settings.SEARCH_ENGINE``):
+
+* PostgreSQL ranks with ``ts_rank`` over a weighted ``tsvector`` expression
+  that is backed by a GIN index (see migration 0003).
+* SQLite queries an FTS5 shadow table, ``api_auctionitem_fts``, which is kept
+  in sync with ``AuctionItem`` by the signal handlers in ``api.signals``.
+* Anything else falls back to the old ``icontains`` filter.
+"""
+from django.conf import settings
+from django.db import connections
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+from .models import AuctionItem
+
+
+FTS_TABLE = 'api_auctionitem_fts'
+
+# Must stay identical to the expression indexed in migration 0003 so the
+# planner can use the GIN index.
+POSTGRES_DOCUMENT_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+
+class SearchEngine:
+    """
+    Base class for search engines.
+
+    ``search`` returns ``queryset`` narrowed to the matches, best match
+    first, so the paginators count and slice it in SQL.
+    """
+
+    def __init__(self, using='default'):
+        self.using = using
+
+    def search(self, queryset, term):
+        raise NotImplementedError
+
+    def index(self, item):
+        """Add or refresh ``item`` in the index."""
+
+    def remove(self, pk):
+        """Drop the item with primary key ``pk`` from the index."""
+
+    def index_many(self, items):
+        """Add newly created ``items`` to the index (e.g. after ``bulk_create``)."""
+        for item in items:
+            self.index(item)
+
+    def rebuild(self):
+        """Re-index every auction item (e.g. after ``bulk_create``)."""
+
+
+class IContainsSearchEngine(SearchEngine):
+    """
+    Unindexed substring match, used when no full-text backend is available.
+    """
+
+    def search(self, queryset, term):
+        return queryset.filter(
+            Q(title__icontains=term) | Q(description__icontains=term)
+        ).order_by('end_datetime', 'id')
+
+
+class PostgresSearchEngine(SearchEngine):
+    """
+    Ranked search using the GIN-indexed ``tsvector`` expression.
+    """
+
+    def search(self, queryset, term):
+        query_sql = "websearch_to_tsquery('english', %s)"
+        return (
+            queryset
+            .filter(RawSQL(f"({POSTGRES_DOCUMENT_SQL}) @@ {query_sql}", [term], output_field=BooleanField()))
+            .annotate(search_rank=RawSQL(f"ts_rank({POSTGRES_DOCUMENT_SQL}, {query_sql})", [term], output_field=FloatField()))
+            .order_by('-search_rank', 'id')
+        )
+
+
+class SqliteFtsSearchEngine(SearchEngine):
+    """
+    Ranked search using the SQLite FTS5 shadow table and ``bm25``.
+    """
+
+    @staticmethod
+    def match_expression(term):
+        """
+        Turn free text into an FTS5 query: every word must match, and the
+        last one may be a prefix so search-as-you-type works.
+        """
+        words = [w.replace('"', '') for w in term.split()]
+        words = [w for w in words if w]
+        if not words:
+            return None
+        return ' '.join(f'"{w}"' for w in words[:-1]) + f' "{words[-1]}"*'
+
+    def search(self, queryset, term):
+        match = self.match_expression(term)
+        if match is None:
+            return queryset.none()
+        # A join rather than a list of matching ids: the count, the filters
+        # already on ``queryset`` and LIMIT/OFFSET all apply in one query.
+        table = queryset.model._meta.db_table
+        return queryset.extra(
+            tables=[FTS_TABLE],
+            where=[f"{FTS_TABLE}.rowid = {table}.id", f"{FTS_TABLE} MATCH %s"],
+            params=[match],
+            select={'search_rank': f"{FTS_TABLE}.rank"},
+        ).order_by('search_rank', 'id')
+
+    def index(self, item):
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [item.pk])
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE} (rowid, title, description) VALUES (%s, %s, %s)",
+                [item.pk, item.title, item.description],
+            )
+
+    def index_many(self, items):
+        rows = [(item.pk, item.title, item.description) for item in items]
+        with connections[self.using].cursor() as cursor:
+            cursor.executemany(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [row[:1] for row in rows])
+            cursor.executemany(f"INSERT INTO {FTS_TABLE} (rowid, title, description) VALUES (%s, %s, %s)", rows)
+
+    def remove(self, pk):
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [pk])
+
+    def rebuild(self):
+        table = AuctionItem._meta.db_table
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE}")
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE} (rowid, title, description) "
+                f"SELECT id, title, description FROM {table}"
+            )
+
+
+vendor_engines = {
+    'postgresql': PostgresSearchEngine,
+    'sqlite': SqliteFtsSearchEngine,
+}
+
+
+def get_search_engine(using='default'):
+    """
+    Return the search engine for database ``using``.
+    """
+    engine_path = getattr(settings, 'SEARCH_ENGINE', None)
+    if engine_path:
+        engine_class = import_string(engine_path)
+    else:
+        engine_class = vendor_engines.get(connections[using].vendor, IContainsSearchEngine)
+    return engine_class(using)
@@ -1,32 +1,108 @@
+from django.core.exceptions import ValidationError
 from rest_framework import serializers
+from project.metrics import serializer_timer
+from . import images, uploads
 from .models import AuctionItem
 from .models import ItemQuestion
 from .models import ItemBid
 
-class AuctionItemSerializer(serializers.ModelSerializer):
+class ImageVariantsField(serializers.Field):
+    """
+    Read-only URLs of the resized copies of the model's ``image_field``.
+    """
+
+    def __init__(self, image_field, **kwargs):
+        self.image_field = image_field
+        kwargs['source'] = '*'
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, instance):
+        request = self.context.get('request')
+        return images.variant_urls(instance, self.image_field, request.build_absolute_uri if request else None)
+
+
+class TimedSerializerMixin:
+    """
+    Reports the time spent producing representations to the request metrics.
+    """
+
+    def to_representation(self, instance):
+        with serializer_timer():
+            return super().to_representation(instance)
+
+
+class AuctionItemSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for AuctionItem model.
     """
     ownerUsername = serializers.CharField(source='owner.username', read_only=True)
+    topBidderUsername = serializers.CharField(source='top_bidder.username', read_only=True, default=None)
+    image_variants = ImageVariantsField('image')
+
+    class Meta:
+        model = AuctionItem
+        fields = ['id', 'owner', 'title', 'description', 'starting_bid', 'current_bid', 'image', 'image_variants', 'image_placeholder', 'created_at', 'end_datetime', 'ownerUsername', 'bid_count', 'last_bid_at', 'top_bidder', 'topBidderUsername']
+        read_only_fields = ['id', 'owner', 'created_at', 'current_bid', 'image_placeholder', 'bid_count', 'last_bid_at', 'top_bidder']
+
+    def validate_image(self, value):
+        """
+        Reject anything that is not a real image and drop its EXIF data,
+        reusing the stored copy of an identical earlier upload.
+        """
+        if not value:
+            return value
+        try:
+            return uploads.stored_image(value, AuctionItem, 'image')
+        except ValidationError as e:
+            raise serializers.ValidationError(e.messages)
+
+
+class AuctionItemListSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    """
+    Compact read-only serializer for auction item list pages.
+
+    Leaves out the long description so list responses stay small; the full
+    record is available from the detail endpoint.
+    """
+    ownerUsername = serializers.CharField(source='owner.username', read_only=True)
+    topBidderUsername = serializers.CharField(source='top_bidder.username', read_only=True, default=None)
+    image_variants = ImageVariantsField('image')
 
     class Meta:
         model = AuctionItem
-        fields = ['id', 'owner', 'title', 'description', 'starting_bid', 'current_bid', 'image', 'created_at', 'end_datetime', 'ownerUsername']
-        read_only_fields = ['id', 'owner', 'created_at', 'current_bid']
-    
-class ItemQuestionSerializer(serializers.ModelSerializer):
+        fields = ['id', 'owner', 'title', 'starting_bid', 'current_bid', 'image', 'image_variants', 'image_placeholder', 'end_datetime', 'ownerUsername', 'bid_count', 'last_bid_at', 'top_bidder', 'topBidderUsername']
+        read_only_fields = fields
+
+
+class ItemQuestionSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for ItemQuestion model.
     """
+    askedByUsername = serializers.CharField(source='asked_by.username', read_only=True)
+
     class Meta:
         model = ItemQuestion
-        fields = ['id', 'item', 'asked_by', 'question_text', 'answer_text', 'asked_at', 'answered_at']
-        read_only_fields = ['id', 'asked_by', 'asked_at', 'answered_at']
+        fields = ['id', 'item', 'asked_by', 'askedByUsername', 'question_text', 'answer_text', 'asked_at', 'answered_at', 'updated_at']
+        read_only_fields = ['id', 'asked_by', 'asked_at', 'answered_at', 'updated_at']
+
+
+class UnansweredQuestionSerializer(ItemQuestionSerializer):
+    """
+    A question with the title of its item, for the owner's list of questions
+    waiting for an answer.
+    """
+    itemTitle = serializers.CharField(source='item.title', read_only=True)
+
+    class Meta(ItemQuestionSerializer.Meta):
+        fields = ItemQuestionSerializer.Meta.fields + ['itemTitle']
         
-class ItemBidSerializer(serializers.ModelSerializer):
+class ItemBidSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for ItemBid model.
     """
+    bidderUsername = serializers.CharField(source='bidder.username', read_only=True)
+
     class Meta:
        model = ItemBid
-       fields = ['id', 'item', 'bidder', 'amount', 'timestamp']
\ No newline at end of file
+       fields = ['id', 'item', 'bidder', 'bidderUsername', 'amount', 'timestamp']
\ No newline at end of file
@@ -0,0 +1,96 @@
+from django.db import connections, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from project.auth import user_cache
+
+from .cache import bump_items, bump_questions
+from .images import IMAGE_FIELDS, get_pipeline, needs_processing, variants_field
+from .models import AuctionItem, ItemQuestion, User
+from .scheduler import NOTIFY_CHANNEL
+from .search import get_search_engine
+
+
+SEARCHABLE_FIELDS = {'title', 'description'}
+
+
+@receiver(post_save, sender=AuctionItem)
+def index_auction_item(sender, instance, using, update_fields=None, **kwargs):
+    """
+    Keep the search index in step with saved auction items.
+    """
+    if update_fields is not None and not SEARCHABLE_FIELDS & set(update_fields):
+        return
+    get_search_engine(using).index(instance)
+
+
+@receiver(post_delete, sender=AuctionItem)
+def unindex_auction_item(sender, instance, using, **kwargs):
+    """
+    Drop deleted auction items from the search index.
+    """
+    get_search_engine(using).remove(instance.pk)
+
+
+@receiver(post_save, sender=AuctionItem)
+def notify_auction_scheduler(sender, instance, using, update_fields=None, **kwargs):
+    """
+    Tell a running auction scheduler (over LISTEN/NOTIFY) that an auction's
+    deadline may have changed.
+    """
+    if update_fields is not None and 'end_datetime' not in update_fields:
+        return
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return
+
+    def notify():
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [NOTIFY_CHANNEL, str(instance.pk)])
+
+    transaction.on_commit(notify, using=using)
+
+
+@receiver(post_save, sender=AuctionItem)
+@receiver(post_delete, sender=AuctionItem)
+def invalidate_auction_item_cache(sender, instance, **kwargs):
+    """
+    Drop cached payloads for an item created, edited or deleted through the
+    ORM (the API, the admin, ...).
+    """
+    bump_items(instance.pk)
+
+
+@receiver(post_save, sender=ItemQuestion)
+@receiver(post_delete, sender=ItemQuestion)
+def invalidate_question_validators(sender, instance, **kwargs):
+    """
+    Change the ETags of the question lists a question created, answered or
+    deleted through the ORM appears in.
+    """
+    bump_questions(instance.item_id)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def forget_cached_user(sender, instance, **kwargs):
+    """
+    Stop serving this process's cached copy of a changed or deleted user.
+    """
+    user_cache.forget(instance.pk)
+
+
+@receiver(post_save, sender=AuctionItem)
+@receiver(post_save, sender=User)
+def process_uploaded_image(sender, instance, using, update_fields=None, **kwargs):
+    """
+    Queue resized variants of a new or replaced image once it is committed.
+    """
+    field_name = IMAGE_FIELDS[sender]
+    if update_fields is not None and field_name not in update_fields:
+        return
+    if {field_name, variants_field(field_name)} & instance.get_deferred_fields():
+        return
+    if not needs_processing(instance, field_name):
+        return
+    transaction.on_commit(lambda: get_pipeline().submit(sender, instance.pk, field_name), using=using)
@@ -22,7 +22,7 @@
  * pinia v3.0.4
  * (c) 2025 Eduardo San Martin Morote
  * @license MIT
- */let bc;const gi=e=>bc=e,yc=Symbol();function vr(e){return e&&typeof e=="object"&&Object.prototype.toString.call(e)==="[object Object]"&&typeof e.toJSON!="function"}var ss;(function(e){e.direct="direct",e.patchObject="patch object",e.patchFunction="patch function"})(ss||(ss={}));function ip(){const e=ol(!0),t=e.run(()=>ut({}));let n=[],s=[];const i=Fr({install(r){gi(i),i._a=r,r.provide(yc,i),r.config.globalProperties.$pinia=i,s.forEach(o=>n.push(o)),s=[]},use(r){return this._a?n.push(r):s.push(r),this},_p:n,_a:null,_e:e,_s:new Map,state:t});return i}const Ac=()=>{};function fa(e,t,n,s=Ac){e.add(t);const i=()=>{e.delete(t)&&s()};return!n&&al()&&Lu(i),i}function dn(e,...t){e.forEach(n=>{n(...t)})}const rp=e=>e(),da=Symbol(),Hi=Symbol();function Er(e,t){e instanceof Map&&t instanceof Map?t.forEach((n,s)=>e.set(s,n)):e instanceof Set&&t instanceof Set&&t.forEach(e.add,e);for(const n in t){if(!t.hasOwnProperty(n))continue;const s=t[n],i=e[n];vr(i)&&vr(s)&&e.hasOwnProperty(n)&&!mt(s)&&!He(s)?e[n]=Er(i,s):e[n]=s}return e}const op=Symbol();function ap(e){return!vr(e)||!Object.prototype.hasOwnProperty.call(e,op)}const{assign:Le}=Object;function lp(e){return!!(mt(e)&&e.effect)}function cp(e,t,n,s){const{state:i,actions:r,getters:o}=t,a=n.state.value[e];let l;function u(){a||(n.state.value[e]=i?i():{});const c=rf(n.state.value[e]);return Le(c,r,Object.keys(o||{}).reduce((f,p)=>(f[p]=Fr(Lt(()=>{gi(n);const m=n._s.get(e);return o[p].call(m,m)})),f),{}))}return l=wc(e,u,t,n,s,!0),l}function wc(e,t,n={},s,i,r){let o;const a=Le({actions:{}},n),l={deep:!0};let u,c,f=new Set,p=new Set,m;const A=s.state.value[e];!r&&!A&&(s.state.value[e]={}),ut({});let y;function I(H){let B;u=c=!1,typeof H=="function"?(H(s.state.value[e]),B={type:ss.patchFunction,storeId:e,events:m}):(Er(s.state.value[e],H),B={type:ss.patchObject,payload:H,storeId:e,events:m});const z=y=Symbol();Hr().then(()=>{y===z&&(u=!0)}),c=!0,dn(f,B,s.state.value[e])}const N=r?function(){const{state:B}=n,z=B?B():{};this.$patch(tt=>{Le(tt,z)})}:Ac;function $(){o.stop(),f.clear(),p.clear(),s._s.delete(e)}const R=(H,B="")=>{if(da in H)return H[Hi]=B,H;const z=function(){gi(s);const tt=Array.from(arguments),ht=new Set,it=new Set;function Ot(U){ht.add(U)}function At(U){it.add(U)}dn(p,{args:tt,name:z[Hi],store:C,after:Ot,onError:At});let X;try{X=H.apply(this&&this.$id===e?this:C,tt)}catch(U){throw dn(it,U),U}return X instanceof Promise?X.then(U=>(dn(ht,U),U)).catch(U=>(dn(it,U),Promise.reject(U))):(dn(ht,X),X)};return z[da]=!0,z[Hi]=B,z},T={_p:s,$id:e,$onAction:fa.bind(null,p),$patch:I,$reset:N,$subscribe(H,B={}){const z=fa(f,H,B.detached,()=>tt()),tt=o.run(()=>Zn(()=>s.state.value[e],ht=>{(B.flush==="sync"?c:u)&&H({storeId:e,type:ss.direct,events:m},ht)},Le({},l,B)));return z},$dispose:$},C=ms(T);s._s.set(e,C);const M=(s._a&&s._a.runWithContext||rp)(()=>s._e.run(()=>(o=ol()).run(()=>t({action:R}))));for(const H in M){const B=M[H];if(mt(B)&&!lp(B)||He(B))r||(A&&ap(B)&&(mt(B)?B.value=A[H]:Er(B,A[H])),s.state.value[e][H]=B);else if(typeof B=="function"){const z=R(B,H);M[H]=z,a.actions[H]=B}}return Le(C,M),Le(nt(C),M),Object.defineProperty(C,"$state",{get:()=>s.state.value[e],set:H=>{I(B=>{Le(B,H)})}}),s._p.forEach(H=>{Le(C,o.run(()=>H({store:C,app:s._a,pinia:s,options:a})))}),A&&r&&n.hydrate&&n.hydrate(C.$state,A),u=!0,c=!0,C}/*! #__NO_SIDE_EFFECTS__ */function up(e,t,n){let s;const i=typeof t=="function";s=i?n:t;function r(o,a){const l=Hf();return o=o||(l?zt(yc,null):null),o&&gi(o),o=bc,o._s.has(e)||(i?wc(e,t,s,o):cp(e,s,o)),o._s.get(e)}return r.$id=e,r}function fp(e){const t=document.cookie.match(new RegExp("(^|; )"+e+"=([^;]*)"));return t?decodeURIComponent(t[2]):null}const Gr=up("auctionStore",()=>{const e=ut([]);function t(o){const a=e.value.findIndex(l=>l.id===o.id);a>=0?e.value[a]=o:e.value.push(o)}function n(o,a){const l=e.value.find(u=>u.id===o);l&&(l.currentBid=a)}function s(o){return e.value.find(a=>a.id===o)||null}async function i(o=""){try{const a=await fetch(`/api/auction-items/?search=${encodeURIComponent(o)}`);if(!a.ok)throw new Error("Failed to fetch auction items");const l=await a.json();e.value=l.map(u=>({id:u.id,title:u.title,description:u.description,startingBid:parseFloat(u.starting_bid),currentBid:u.current_bid?parseFloat(u.current_bid):parseFloat(u.starting_bid),imageUrl:u.image,endDate:u.end_datetime}))}catch(a){console.error(a)}}async function r(o){const a=new FormData;a.append("title",o.title),a.append("description",o.description),a.append("starting_bid",o.startingBid.toFixed(2)),a.append("end_datetime",o.endDate),o.imageFile&&a.append("image",o.imageFile);const l=fp("csrftoken"),u=await fetch("/api/auction-items/",{method:"POST",body:a,credentials:"same-origin",headers:l?{"X-CSRFToken":l}:{}});if(!u.ok){const f=await u.text();try{const p=JSON.parse(f);throw new Error(Object.values(p).map(m=>Array.isArray(m)?m.join(", "):m).join(", "))}catch{throw new Error(f||`Request failed with status ${u.status}`)}}const c=await u.json();return t({id:c.id,title:c.title,description:c.description,startingBid:parseFloat(c.starting_bid),currentBid:c.current_bid?parseFloat(c.current_bid):0,imageUrl:c.image,endDate:c.end_datetime,ownerUsername:c.ownerUsername}),c}return{items:e,setItem:t,updateBid:n,getItem:s,fetchItems:i,createItem:r}}),dp=ln({name:"NewAuctionItem",setup(){const e=Gr(),t=Ec(),n=ut(""),s=ut(""),i=ut(0),r=ut(""),o=ut(null),a=ut("");return{title:n,description:s,startingBid:i,endDate:r,imageFile:o,handleFileUpload:c=>{const f=c.target;f.files&&f.files.length>0&&(o.value=f.files[0])},submitForm:async()=>{if(a.value="",!n.value||!s.value||!r.value){a.value="Please fill in all required fields.";return}try{const c=await e.createItem({title:n.value.trim(),description:s.value.trim(),startingBid:Number(i.value),endDate:r.value.length===16?r.value+":00":r.value,imageFile:o.value});t.push(`/item/${c.id}`)}catch(c){a.value=c.message||"Failed to create auction item."}},errorMessage:a}}}),hp={class:"new-auction-item"},pp={class:"form-group"},mp={class:"form-group"},gp={class:"form-group"},_p={class:"form-group"},vp={class:"form-group"},Ep={key:0,class:"error"};function bp(e,t,n,s,i,r){return lt(),dt("div",hp,[t[12]||(t[12]=L("h1",null,"Create New Auction Item",-1)),L("form",{onSubmit:t[5]||(t[5]=pr((...o)=>e.submitForm&&e.submitForm(...o),["prevent"]))},[L("div",pp,[t[6]||(t[6]=L("label",{for:"title"},"Title:",-1)),he(L("input",{type:"text",id:"title","onUpdate:modelValue":t[0]||(t[0]=o=>e.title=o),required:""},null,512),[[pe,e.title]])]),L("div",mp,[t[7]||(t[7]=L("label",{for:"description"},"Description:",-1)),he(L("textarea",{id:"description","onUpdate:modelValue":t[1]||(t[1]=o=>e.description=o),required:""},null,512),[[pe,e.description]])]),L("div",gp,[t[8]||(t[8]=L("label",{for:"startingBid"},"Starting Bid:",-1)),he(L("input",{type:"number",id:"startingBid","onUpdate:modelValue":t[2]||(t[2]=o=>e.startingBid=o),step:"0.01",min:"0",placeholder:"0.00"},null,512),[[pe,e.startingBid]])]),L("div",_p,[t[9]||(t[9]=L("label",{for:"endDate"},"End Date:",-1)),he(L("input",{type:"datetime-local",id:"endDate","onUpdate:modelValue":t[3]||(t[3]=o=>e.endDate=o),required:""},null,512),[[pe,e.endDate]])]),L("div",vp,[t[10]||(t[10]=L("label",{for:"image"},"Image:",-1)),L("input",{type:"file",id:"image",onChange:t[4]||(t[4]=(...o)=>e.handleFileUpload&&e.handleFileUpload(...o))},null,32)]),t[11]||(t[11]=L("button",{type:"submit",class:"submit-btn"},"Create Auction Item",-1))],32),e.errorMessage?(lt(),dt("p",Ep,vt(e.errorMessage),1)):ge("",!0)])}const yp=mi(dp,[["render",bp],["__scopeId","data-v-a3eda76e"]]),Ap=ln({name:"AuctionItemDetail",setup(){const e=Gr(),t=Xh(),n=Number(t.params.id),s=Lt(()=>e.getItem(n)),i=ut([]),r="/static/api/spa/assets/placeholder.jpg",o=ut(""),a=ut(""),l=ut(""),u=ut(null),c=ut(""),f=ut(!1);function p(C){const V=document.cookie.match(new RegExp("(^|; )"+C+"=([^;]*)"));return V?decodeURIComponent(V[2]):null}const m=C=>new Date(C).toLocaleString(),A=async C=>{try{const M=await(await fetch(`/api/auction-items/${C}/`)).json(),H={id:M.id,title:M.title,description:M.description,startingBid:parseFloat(M.starting_bid),currentBid:M.current_bid?parseFloat(M.current_bid):0,imageUrl:M.image,endDate:M.end_datetime,ownerUsername:M.ownerUsername};e.setItem(H)}catch(V){l.value="Failed to load item details.",console.error(V)}},y=async C=>{try{const V=await fetch(`/api/item-questions/?item_id=${C}`);if(!V.ok)throw new Error("Failed to fetch questions");i.value=await V.json()}catch(V){console.error(V)}},I=ut(null),N=async()=>{try{const C=await fetch("/api/current-user/",{credentials:"same-origin"});if(!C.ok)throw new Error("Failed to fetch current user");const V=await C.json();I.value=V.username}catch(C){console.error(C)}},$=async()=>{if(!s.value||!o.value.trim())return;const C=p("csrftoken");try{const V=await fetch("/api/item-questions/",{method:"POST",headers:{"Content-Type":"application/json",...C?{"X-CSRFToken":C}:{}},body:JSON.stringify({item:s.value.id,question_text:o.value})});if(!V.ok){const H=await V.text();throw new Error(H)}const M=await V.json();i.value.push(M),o.value="",a.value="",y(s.value.id)}catch(V){a.value=V.message}},R=async C=>{if(!C.newAnswer?.trim())return;const V=p("csrftoken");try{const M=await fetch(`/api/item-questions/${C.id}/answer/`,{method:"PATCH",headers:{"Content-Type":"application/json",...V?{"X-CSRFToken":V}:{}},body:JSON.stringify({answer_text:C.newAnswer})});if(!M.ok)throw new Error("Failed to submit answer");const H=await M.json();C.answer_text=H.answer_text,C.newAnswer=""}catch(M){console.error(M)}},T=async()=>{if(!s.value||u.value===null)return;const C=p("csrftoken"),V=new FormData;V.append("bid_amount",u.value.toString());try{const M=await fetch(`/api/auction-items/${s.value.id}/place_bid/`,{method:"POST",body:V,credentials:"same-origin",headers:C?{"X-CSRFToken":C}:{}}),H=await M.json().catch(()=>({}));if(!M.ok)throw new Error(H.error||"Failed to place bid.");const B=H;e.updateBid(s.value.id,parseFloat(B.current_bid)),u.value=null,c.value="",f.value=!0,setTimeout(()=>f.value=!1,1200)}catch(M){c.value=M.message}};return _s(()=>{const C=Number(t.params.id);isNaN(C)||(A(C),y(C),N())}),{item:s,currentUser:I,placeholderUrl:r,formatEndDate:m,newQuestion:o,questionError:a,submitQuestion:$,questions:i,fetchError:l,submitAnswer:R,newBid:u,bidError:c,submitBid:T,bidUpdated:f}}}),wp={class:"auction-item-detail"},Tp={key:0},Sp={class:"item-card"},Cp={class:"item-title"},Op=["src"],Np=["src"],$p={class:"item-info"},Dp={class:"place-bid"},Ip=["disabled"],Rp={key:0},xp={class:"item-questions"},Pp={key:0},Lp={key:1},Mp={key:0},kp={key:1},Vp=["onSubmit"],Fp=["onUpdate:modelValue"],Hp={key:2},jp={class:"ask-question"},Bp={key:0},Wp={key:1,class:"loading"},Up={key:2};function Kp(e,t,n,s,i,r){return lt(),dt("div",wp,[e.item?(lt(),dt("div",Tp,[L("div",Sp,[L("h1",Cp,vt(e.item.title),1),e.item.imageUrl?(lt(),dt("img",{key:0,src:e.item.imageUrl,class:"item-image"},null,8,Op)):(lt(),dt("img",{key:1,src:e.placeholderUrl,class:"item-image"},null,8,Np)),L("div",$p,[L("p",null,[t[4]||(t[4]=L("strong",null,"Description:",-1)),Bt(" "+vt(e.item.description),1)]),L("p",null,[t[5]||(t[5]=L("strong",null,"Starting Bid:",-1)),Bt(" $"+vt(e.item.startingBid.toFixed(2)),1)]),L("p",{class:ps({"bid-flash":e.bidUpdated})},[t[6]||(t[6]=L("strong",null,"Current Bid:",-1)),Bt(" $"+vt(e.item.currentBid.toFixed(2)),1)],2),L("p",null,[t[7]||(t[7]=L("strong",null,"Auction Ends:",-1)),Bt(" "+vt(e.formatEndDate(e.item.endDate)),1)])])]),L("div",Dp,[he(L("input",{type:"number","onUpdate:modelValue":t[0]||(t[0]=o=>e.newBid=o)},null,512),[[pe,e.newBid,void 0,{number:!0}]]),L("button",{onClick:t[1]||(t[1]=(...o)=>e.submitBid&&e.submitBid(...o)),disabled:!e.newBid||e.newBid<=e.item.currentBid}," Submit Bid ",8,Ip),e.bidError?(lt(),dt("p",Rp,vt(e.bidError),1)):ge("",!0)]),L("div",xp,[t[13]||(t[13]=L("h2",null,"Questions & Answers",-1)),e.questions.length===0?(lt(),dt("div",Pp,[...t[8]||(t[8]=[L("p",null,"No questions yet.",-1)])])):(lt(),dt("div",Lp,[(lt(!0),dt(se,null,Ll(e.questions,o=>(lt(),dt("div",{key:o.id},[L("p",null,[t[9]||(t[9]=L("strong",null,"Q:",-1)),Bt(" "+vt(o.question_text),1)]),o.answer_text?(lt(),dt("p",Mp,[t[10]||(t[10]=L("strong",null,"A:",-1)),Bt(" "+vt(o.answer_text),1)])):e.item.ownerUsername===e.currentUser?(lt(),dt("div",kp,[L("form",{onSubmit:pr(a=>e.submitAnswer(o),["prevent"])},[he(L("textarea",{"onUpdate:modelValue":a=>o.newAnswer=a},null,8,Fp),[[pe,o.newAnswer]]),t[11]||(t[11]=L("button",null,"Answer",-1))],40,Vp)])):(lt(),dt("div",Hp,[...t[12]||(t[12]=[L("em",null,"This question has not been answered yet.",-1)])]))]))),128))]))]),L("div",jp,[L("form",{onSubmit:t[3]||(t[3]=pr((...o)=>e.submitQuestion&&e.submitQuestion(...o),["prevent"]))},[he(L("textarea",{"onUpdate:modelValue":t[2]||(t[2]=o=>e.newQuestion=o)},null,512),[[pe,e.newQuestion]]),t[14]||(t[14]=L("button",{type:"submit"},"Ask Question",-1))],32),e.questionError?(lt(),dt("p",Bp,vt(e.questionError),1)):ge("",!0)])])):(lt(),dt("p",Wp,"Loading item details...")),e.fetchError?(lt(),dt("p",Up,vt(e.fetchError),1)):ge("",!0)])}const Yp=mi(Ap,[["render",Kp],["__scopeId","data-v-5f3f52cb"]]),qp=e=>{const t=new Date(e),n=new Date,s=t.getTime()-n.getTime();if(s<=0)return"Auction ended";const i=Math.floor(s/(1e3*60*60*24)),r=Math.floor(s/(1e3*60*60)%24),o=Math.floor(s/(1e3*60)%60);return`Ends in ${i}d ${r}h ${o}m`},Gp=ln({name:"AuctionItemList",setup(){const e=Gr(),t=Lt(()=>e.items),n=ut(""),s=ut(!1),i=Ec();function r(u,c){let f;return(...p)=>{clearTimeout(f),f=window.setTimeout(()=>{u(...p)},c)}}const o=(u,c)=>(u||c).toFixed(2),a=r(async()=>{s.value=!0,await e.fetchItems(n.value),s.value=!1},300),l=u=>{i.push({name:"AuctionItemDetail",params:{id:u}})};return _s(async()=>{s.value=!0,await e.fetchItems(),s.value=!1}),{items:t,searchQuery:n,loading:s,goToItem:l,formatBid:o,formatEndTime:qp,debouncedFetch:a}}}),zp={class:"auction-item-list"},Qp={key:0,class:"loading"},Xp={key:1},Jp={class:"items-grid"},Zp=["onClick"],tm=["src"],em={class:"description"},nm={class:"price"},sm={class:"end-time"};function im(e,t,n,s,i,r){return lt(),dt("div",zp,[t[2]||(t[2]=L("h1",null,"Auction Items",-1)),he(L("input",{type:"text","onUpdate:modelValue":t[0]||(t[0]=o=>e.searchQuery=o),placeholder:"Search auction items...",class:"search-bar",onInput:t[1]||(t[1]=(...o)=>e.debouncedFetch&&e.debouncedFetch(...o))},null,544),[[pe,e.searchQuery]]),e.loading?(lt(),dt("div",Qp,"Loading auction items...")):ge("",!0),!e.loading&&e.items.length===0?(lt(),dt("p",Xp,"No auction items found.")):ge("",!0),L("div",Jp,[(lt(!0),dt(se,null,Ll(e.items,o=>(lt(),dt("div",{key:o.id,class:ps(["item-card",{"ending-soon":new Date(o.endDate).getTime()-Date.now()<1440*60*1e3}]),onClick:a=>e.goToItem(o.id)},[L("img",{src:o.imageUrl??"/static/api/spa/assets/placeholder.jpg",alt:"Item Image"},null,8,tm),L("h3",null,vt(o.title),1),L("p",em,vt(o.description),1),L("p",nm," Current Bid: £"+vt(e.formatBid(o.currentBid,o.startingBid)),1),L("p",sm,vt(e.formatEndTime(o.endDate)),1)],10,Zp))),128))])])}const ha=mi(Gp,[["render",im],["__scopeId","data-v-ef47635a"]]),rm={class:"profile-container"},om={key:0,class:"profile-summary"},am=["src","alt"],lm=ln({__name:"Profile",setup(e){const t=ut("/static/api/spa/assets/profile-placeholder.webp"),n=ut(null),s=ut(""),i=ut(""),r=ut(null);function o(){return document.cookie.split("; ").find(u=>u.startsWith("csrftoken="))?.split("=")[1]||""}_s(async()=>{const c=await(await fetch("/api/profile/",{credentials:"same-origin"})).json();n.value=c,s.value=c?.email??"",i.value=c?.date_of_birth??"",t.value=c?.profile_image??"/static/api/spa/assets/profile-placeholder.webp"});async function a(){const u=new FormData;u.append("email",s.value),i.value&&u.append("date_of_birth",i.value),r.value&&u.append("profile_image",r.value);const f=await(await fetch("/api/profile/",{method:"POST",headers:{"X-CSRFToken":o()},body:u,credentials:"same-origin"})).json();n.value=f,f.profile_image&&(t.value=f.profile_image),alert("Profile updated successfully!")}function l(u){const f=u.target?.files?.[0]??null;f&&(r.value=f,t.value=URL.createObjectURL(f))}return(u,c)=>(lt(),dt("div",rm,[c[5]||(c[5]=L("h1",null,"Profile",-1)),c[6]||(c[6]=L("p",null,"Edit your details below.",-1)),n.value?(lt(),dt("div",om,[L("img",{src:t.value,alt:t.value,class:"profile-preview"},null,8,am),L("p",null,[c[2]||(c[2]=L("strong",null,"Username:",-1)),Bt(" "+vt(n.value.username),1)]),L("p",null,[c[3]||(c[3]=L("strong",null,"Email:",-1)),Bt(" "+vt(n.value.email),1)]),L("p",null,[c[4]||(c[4]=L("strong",null,"Date of Birth:",-1)),Bt(" "+vt(n.value.date_of_birth||"Not set"),1)])])):ge("",!0),c[7]||(c[7]=L("label",{for:""},"Email",-1)),he(L("input",{"onUpdate:modelValue":c[0]||(c[0]=f=>s.value=f),type:"email"},null,512),[[pe,s.value]]),c[8]||(c[8]=L("label",{for:""},"Date of Birth",-1)),he(L("input",{"onUpdate:modelValue":c[1]||(c[1]=f=>i.value=f),type:"date"},null,512),[[pe,i.value]]),c[9]||(c[9]=L("label",{for:""},"Profile Image",-1)),L("input",{type:"file",onChange:l},null,32),L("button",{onClick:a},"Save")]))}}),Tc=zh({history:Sh("/app/"),routes:[{path:"/",name:"Main Page",component:ha},{path:"/new-auction-item/",name:"New Auction Item",component:yp},{path:"/item/:id",name:"AuctionItemDetail",component:Yp},{path:"/auction-items",name:"AuctionItemList",component:ha},{path:"/profile/",name:"Profile",component:lm}]});var Dt="top",Kt="bottom",Yt="right",It="left",_i="auto",Mn=[Dt,Kt,Yt,It],rn="start",$n="end",Sc="clippingParents",zr="viewport",vn="popper",Cc="reference",br=Mn.reduce(function(e,t){return e.concat([t+"-"+rn,t+"-"+$n])},[]),Qr=[].concat(Mn,[_i]).reduce(function(e,t){return e.concat([t,t+"-"+rn,t+"-"+$n])},[]),Oc="beforeRead",Nc="read",$c="afterRead",Dc="beforeMain",Ic="main",Rc="afterMain",xc="beforeWrite",Pc="write",Lc="afterWrite",Mc=[Oc,Nc,$c,Dc,Ic,Rc,xc,Pc,Lc];function be(e){return e?(e.nodeName||"").toLowerCase():null}function qt(e){if(e==null)return window;if(e.toString()!=="[object Window]"){var t=e.ownerDocument;return t&&t.defaultView||window}return e}function on(e){var t=qt(e).Element;return e instanceof t||e instanceof Element}function Xt(e){var t=qt(e).HTMLElement;return e instanceof t||e instanceof HTMLElement}function Xr(e){if(typeof ShadowRoot>"u")return!1;var t=qt(e).ShadowRoot;return e instanceof t||e instanceof ShadowRoot}function cm(e){var t=e.state;Object.keys(t.elements).forEach(function(n){var s=t.styles[n]||{},i=t.attributes[n]||{},r=t.elements[n];!Xt(r)||!be(r)||(Object.assign(r.style,s),Object.keys(i).forEach(function(o){var a=i[o];a===!1?r.removeAttribute(o):r.setAttribute(o,a===!0?"":a)}))})}function um(e){var t=e.state,n={popper:{position:t.options.strategy,left:"0",top:"0",margin:"0"},arrow:{position:"absolute"},reference:{}};return Object.assign(t.elements.popper.style,n.popper),t.styles=n,t.elements.arrow&&Object.assign(t.elements.arrow.style,n.arrow),function(){Object.keys(t.elements).forEach(function(s){var i=t.elements[s],r=t.attributes[s]||{},o=Object.keys(t.styles.hasOwnProperty(s)?t.styles[s]:n[s]),a=o.reduce(function(l,u){return l[u]="",l},{});!Xt(i)||!be(i)||(Object.assign(i.style,a),Object.keys(r).forEach(function(l){i.removeAttribute(l)}))})}}const Jr={name:"applyStyles",enabled:!0,phase:"write",fn:cm,effect:um,requires:["computeStyles"]};function _e(e){return e.split("-")[0]}var sn=Math.max,Js=Math.min,Dn=Math.round;function yr(){var e=navigator.userAgentData;return e!=null&&e.brands&&Array.isArray(e.brands)?e.brands.map(function(t){return t.brand+"/"+t.version}).join(" "):navigator.userAgent}function kc(){return!/^((?!chrome|android).)*safari/i.test(yr())}function In(e,t,n){t===void 0&&(t=!1),n===void 0&&(n=!1);var s=e.getBoundingClientRect(),i=1,r=1;t&&Xt(e)&&(i=e.offsetWidth>0&&Dn(s.width)/e.offsetWidth||1,r=e.offsetHeight>0&&Dn(s.height)/e.offsetHeight||1);var o=on(e)?qt(e):window,a=o.visualViewport,l=!kc()&&n,u=(s.left+(l&&a?a.offsetLeft:0))/i,c=(s.top+(l&&a?a.offsetTop:0))/r,f=s.width/i,p=s.height/r;return{width:f,height:p,top:c,right:u+f,bottom:c+p,left:u,x:u,y:c}}function Zr(e){var t=In(e),n=e.offsetWidth,s=e.offsetHeight;return Math.abs(t.width-n)<=1&&(n=t.width),Math.abs(t.height-s)<=1&&(s=t.height),{x:e.offsetLeft,y:e.offsetTop,width:n,height:s}}function Vc(e,t){var n=t.getRootNode&&t.getRootNode();if(e.contains(t))return!0;if(n&&Xr(n)){var s=t;do{if(s&&e.isSameNode(s))return!0;s=s.parentNode||s.host}while(s)}return!1}function De(e){return qt(e).getComputedStyle(e)}function fm(e){return["table","td","th"].indexOf(be(e))>=0}function qe(e){return((on(e)?e.ownerDocument:e.document)||window.document).documentElement}function vi(e){return be(e)==="html"?e:e.assignedSlot||e.parentNode||(Xr(e)?e.host:null)||qe(e)}function pa(e){return!Xt(e)||De(e).position==="fixed"?null:e.offsetParent}function dm(e){var t=/firefox/i.test(yr()),n=/Trident/i.test(yr());if(n&&Xt(e)){var s=De(e);if(s.position==="fixed")return null}var i=vi(e);for(Xr(i)&&(i=i.host);Xt(i)&&["html","body"].indexOf(be(i))<0;){var r=De(i);if(r.transform!=="none"||r.perspective!=="none"||r.contain==="paint"||["transform","perspective"].indexOf(r.willChange)!==-1||t&&r.willChange==="filter"||t&&r.filter&&r.filter!=="none")return i;i=i.parentNode}return null}function Es(e){for(var t=qt(e),n=pa(e);n&&fm(n)&&De(n).position==="static";)n=pa(n);return n&&(be(n)==="html"||be(n)==="body"&&De(n).position==="static")?t:n||dm(e)||t}function to(e){return["top","bottom"].indexOf(e)>=0?"x":"y"}function is(e,t,n){return sn(e,Js(t,n))}function hm(e,t,n){var s=is(e,t,n);return s>n?n:s}function Fc(){return{top:0,right:0,bottom:0,left:0}}function Hc(e){return Object.assign({},Fc(),e)}function jc(e,t){return t.reduce(function(n,s){return n[s]=e,n},{})}var pm=function(t,n){return t=typeof t=="function"?t(Object.assign({},n.rects,{placement:n.placement})):t,Hc(typeof t!="number"?t:jc(t,Mn))};function mm(e){var t,n=e.state,s=e.name,i=e.options,r=n.elements.arrow,o=n.modifiersData.popperOffsets,a=_e(n.placement),l=to(a),u=[It,Yt].indexOf(a)>=0,c=u?"height":"width";if(!(!r||!o)){var f=pm(i.padding,n),p=Zr(r),m=l==="y"?Dt:It,A=l==="y"?Kt:Yt,y=n.rects.reference[c]+n.rects.reference[l]-o[l]-n.rects.popper[c],I=o[l]-n.rects.reference[l],N=Es(r),$=N?l==="y"?N.clientHeight||0:N.clientWidth||0:0,R=y/2-I/2,T=f[m],C=$-p[c]-f[A],V=$/2-p[c]/2+R,M=is(T,V,C),H=l;n.modifiersData[s]=(t={},t[H]=M,t.centerOffset=M-V,t)}}function gm(e){var t=e.state,n=e.options,s=n.element,i=s===void 0?"[data-popper-arrow]":s;i!=null&&(typeof i=="string"&&(i=t.elements.popper.querySelector(i),!i)||Vc(t.elements.popper,i)&&(t.elements.arrow=i))}const Bc={name:"arrow",enabled:!0,phase:"main",fn:mm,effect:gm,requires:["popperOffsets"],requiresIfExists:["preventOverflow"]};function Rn(e){return e.split("-")[1]}var _m={top:"auto",right:"auto",bottom:"auto",left:"auto"};function vm(e,t){var n=e.x,s=e.y,i=t.devicePixelRatio||1;return{x:Dn(n*i)/i||0,y:Dn(s*i)/i||0}}function ma(e){var t,n=e.popper,s=e.popperRect,i=e.placement,r=e.variation,o=e.offsets,a=e.position,l=e.gpuAcceleration,u=e.adaptive,c=e.roundOffsets,f=e.isFixed,p=o.x,m=p===void 0?0:p,A=o.y,y=A===void 0?0:A,I=typeof c=="function"?c({x:m,y}):{x:m,y};m=I.x,y=I.y;var N=o.hasOwnProperty("x"),$=o.hasOwnProperty("y"),R=It,T=Dt,C=window;if(u){var V=Es(n),M="clientHeight",H="clientWidth";if(V===qt(n)&&(V=qe(n),De(V).position!=="static"&&a==="absolute"&&(M="scrollHeight",H="scrollWidth")),V=V,i===Dt||(i===It||i===Yt)&&r===$n){T=Kt;var B=f&&V===C&&C.visualViewport?C.visualViewport.height:V[M];y-=B-s.height,y*=l?1:-1}if(i===It||(i===Dt||i===Kt)&&r===$n){R=Yt;var z=f&&V===C&&C.visualViewport?C.visualViewport.width:V[H];m-=z-s.width,m*=l?1:-1}}var tt=Object.assign({position:a},u&&_m),ht=c===!0?vm({x:m,y},qt(n)):{x:m,y};if(m=ht.x,y=ht.y,l){var it;return Object.assign({},tt,(it={},it[T]=$?"0":"",it[R]=N?"0":"",it.transform=(C.devicePixelRatio||1)<=1?"translate("+m+"px, "+y+"px)":"translate3d("+m+"px, "+y+"px, 0)",it))}return Object.assign({},tt,(t={},t[T]=$?y+"px":"",t[R]=N?m+"px":"",t.transform="",t))}function Em(e){var t=e.state,n=e.options,s=n.gpuAcceleration,i=s===void 0?!0:s,r=n.adaptive,o=r===void 0?!0:r,a=n.roundOffsets,l=a===void 0?!0:a,u={placement:_e(t.placement),variation:Rn(t.placement),popper:t.elements.popper,popperRect:t.rects.popper,gpuAcceleration:i,isFixed:t.options.strategy==="fixed"};t.modifiersData.popperOffsets!=null&&(t.styles.popper=Object.assign({},t.styles.popper,ma(Object.assign({},u,{offsets:t.modifiersData.popperOffsets,position:t.options.strategy,adaptive:o,roundOffsets:l})))),t.modifiersData.arrow!=null&&(t.styles.arrow=Object.assign({},t.styles.arrow,ma(Object.assign({},u,{offsets:t.modifiersData.arrow,position:"absolute",adaptive:!1,roundOffsets:l})))),t.attributes.popper=Object.assign({},t.attributes.popper,{"data-popper-placement":t.placement})}const eo={name:"computeStyles",enabled:!0,phase:"beforeWrite",fn:Em,data:{}};var Os={passive:!0};function bm(e){var t=e.state,n=e.instance,s=e.options,i=s.scroll,r=i===void 0?!0:i,o=s.resize,a=o===void 0?!0:o,l=qt(t.elements.popper),u=[].concat(t.scrollParents.reference,t.scrollParents.popper);return r&&u.forEach(function(c){c.addEventListener("scroll",n.update,Os)}),a&&l.addEventListener("resize",n.update,Os),function(){r&&u.forEach(function(c){c.removeEventListener("scroll",n.update,Os)}),a&&l.removeEventListener("resize",n.update,Os)}}const no={name:"eventListeners",enabled:!0,phase:"write",fn:function(){},effect:bm,data:{}};var ym={left:"right",right:"left",bottom:"top",top:"bottom"};function Fs(e){return e.replace(/left|right|bottom|top/g,function(t){return ym[t]})}var Am={start:"end",end:"start"};function ga(e){return e.replace(/start|end/g,function(t){return Am[t]})}function so(e){var t=qt(e),n=t.pageXOffset,s=t.pageYOffset;return{scrollLeft:n,scrollTop:s}}function io(e){return In(qe(e)).left+so(e).scrollLeft}function wm(e,t){var n=qt(e),s=qe(e),i=n.visualViewport,r=s.clientWidth,o=s.clientHeight,a=0,l=0;if(i){r=i.width,o=i.height;var u=kc();(u||!u&&t==="fixed")&&(a=i.offsetLeft,l=i.offsetTop)}return{width:r,height:o,x:a+io(e),y:l}}function Tm(e){var t,n=qe(e),s=so(e),i=(t=e.ownerDocument)==null?void 0:t.body,r=sn(n.scrollWidth,n.clientWidth,i?i.scrollWidth:0,i?i.clientWidth:0),o=sn(n.scrollHeight,n.clientHeight,i?i.scrollHeight:0,i?i.clientHeight:0),a=-s.scrollLeft+io(e),l=-s.scrollTop;return De(i||n).direction==="rtl"&&(a+=sn(n.clientWidth,i?i.clientWidth:0)-r),{width:r,height:o,x:a,y:l}}function ro(e){var t=De(e),n=t.overflow,s=t.overflowX,i=t.overflowY;return/auto|scroll|overlay|hidden/.test(n+i+s)}function Wc(e){return["html","body","#document"].indexOf(be(e))>=0?e.ownerDocument.body:Xt(e)&&ro(e)?e:Wc(vi(e))}function rs(e,t){var n;t===void 0&&(t=[]);var s=Wc(e),i=s===((n=e.ownerDocument)==null?void 0:n.body),r=qt(s),o=i?[r].concat(r.visualViewport||[],ro(s)?s:[]):s,a=t.concat(o);return i?a:a.concat(rs(vi(o)))}function Ar(e){return Object.assign({},e,{left:e.x,top:e.y,right:e.x+e.width,bottom:e.y+e.height})}function Sm(e,t){var n=In(e,!1,t==="fixed");return n.top=n.top+e.clientTop,n.left=n.left+e.clientLeft,n.bottom=n.top+e.clientHeight,n.right=n.left+e.clientWidth,n.width=e.clientWidth,n.height=e.clientHeight,n.x=n.left,n.y=n.top,n}function _a(e,t,n){return t===zr?Ar(wm(e,n)):on(t)?Sm(t,n):Ar(Tm(qe(e)))}function Cm(e){var t=rs(vi(e)),n=["absolute","fixed"].indexOf(De(e).position)>=0,s=n&&Xt(e)?Es(e):e;return on(s)?t.filter(function(i){return on(i)&&Vc(i,s)&&be(i)!=="body"}):[]}function Om(e,t,n,s){var i=t==="clippingParents"?Cm(e):[].concat(t),r=[].concat(i,[n]),o=r[0],a=r.reduce(function(l,u){var c=_a(e,u,s);return l.top=sn(c.top,l.top),l.right=Js(c.right,l.right),l.bottom=Js(c.bottom,l.bottom),l.left=sn(c.left,l.left),l},_a(e,o,s));return a.width=a.right-a.left,a.height=a.bottom-a.top,a.x=a.left,a.y=a.top,a}function Uc(e){var t=e.reference,n=e.element,s=e.placement,i=s?_e(s):null,r=s?Rn(s):null,o=t.x+t.width/2-n.width/2,a=t.y+t.height/2-n.height/2,l;switch(i){case Dt:l={x:o,y:t.y-n.height};break;case Kt:l={x:o,y:t.y+t.height};break;case Yt:l={x:t.x+t.width,y:a};break;case It:l={x:t.x-n.width,y:a};break;default:l={x:t.x,y:t.y}}var u=i?to(i):null;if(u!=null){var c=u==="y"?"height":"width";switch(r){case rn:l[u]=l[u]-(t[c]/2-n[c]/2);break;case $n:l[u]=l[u]+(t[c]/2-n[c]/2);break}}return l}function xn(e,t){t===void 0&&(t={});var n=t,s=n.placement,i=s===void 0?e.placement:s,r=n.strategy,o=r===void 0?e.strategy:r,a=n.boundary,l=a===void 0?Sc:a,u=n.rootBoundary,c=u===void 0?zr:u,f=n.elementContext,p=f===void 0?vn:f,m=n.altBoundary,A=m===void 0?!1:m,y=n.padding,I=y===void 0?0:y,N=Hc(typeof I!="number"?I:jc(I,Mn)),$=p===vn?Cc:vn,R=e.rects.popper,T=e.elements[A?$:p],C=Om(on(T)?T:T.contextElement||qe(e.elements.popper),l,c,o),V=In(e.elements.reference),M=Uc({reference:V,element:R,placement:i}),H=Ar(Object.assign({},R,M)),B=p===vn?H:V,z={top:C.top-B.top+N.top,bottom:B.bottom-C.bottom+N.bottom,left:C.left-B.left+N.left,right:B.right-C.right+N.right},tt=e.modifiersData.offset;if(p===vn&&tt){var ht=tt[i];Object.keys(z).forEach(function(it){var Ot=[Yt,Kt].indexOf(it)>=0?1:-1,At=[Dt,Kt].indexOf(it)>=0?"y":"x";z[it]+=ht[At]*Ot})}return z}function Nm(e,t){t===void 0&&(t={});var n=t,s=n.placement,i=n.boundary,r=n.rootBoundary,o=n.padding,a=n.flipVariations,l=n.allowedAutoPlacements,u=l===void 0?Qr:l,c=Rn(s),f=c?a?br:br.filter(function(A){return Rn(A)===c}):Mn,p=f.filter(function(A){return u.indexOf(A)>=0});p.length===0&&(p=f);var m=p.reduce(function(A,y){return A[y]=xn(e,{placement:y,boundary:i,rootBoundary:r,padding:o})[_e(y)],A},{});return Object.keys(m).sort(function(A,y){return m[A]-m[y]})}function $m(e){if(_e(e)===_i)return[];var t=Fs(e);return[ga(e),t,ga(t)]}function Dm(e){var t=e.state,n=e.options,s=e.name;if(!t.modifiersData[s]._skip){for(var i=n.mainAxis,r=i===void 0?!0:i,o=n.altAxis,a=o===void 0?!0:o,l=n.fallbackPlacements,u=n.padding,c=n.boundary,f=n.rootBoundary,p=n.altBoundary,m=n.flipVariations,A=m===void 0?!0:m,y=n.allowedAutoPlacements,I=t.options.placement,N=_e(I),$=N===I,R=l||($||!A?[Fs(I)]:$m(I)),T=[I].concat(R).reduce(function(Vt,Ft){return Vt.concat(_e(Ft)===_i?Nm(t,{placement:Ft,boundary:c,rootBoundary:f,padding:u,flipVariations:A,allowedAutoPlacements:y}):Ft)},[]),C=t.rects.reference,V=t.rects.popper,M=new Map,H=!0,B=T[0],z=0;z<T.length;z++){var tt=T[z],ht=_e(tt),it=Rn(tt)===rn,Ot=[Dt,Kt].indexOf(ht)>=0,At=Ot?"width":"height",X=xn(t,{placement:tt,boundary:c,rootBoundary:f,altBoundary:p,padding:u}),U=Ot?it?Yt:It:it?Kt:Dt;C[At]>V[At]&&(U=Fs(U));var Z=Fs(U),bt=[];if(r&&bt.push(X[ht]<=0),a&&bt.push(X[U]<=0,X[Z]<=0),bt.every(function(Vt){return Vt})){B=tt,H=!1;break}M.set(tt,bt)}if(H)for(var kt=A?3:1,Rt=function(Ft){var Et=T.find(function(_){var k=M.get(_);if(k)return k.slice(0,Ft).every(function(x){return x})});if(Et)return B=Et,"break"},gt=kt;gt>0;gt--){var ne=Rt(gt);if(ne==="break")break}t.placement!==B&&(t.modifiersData[s]._skip=!0,t.placement=B,t.reset=!0)}}const Kc={name:"flip",enabled:!0,phase:"main",fn:Dm,requiresIfExists:["offset"],data:{_skip:!1}};function va(e,t,n){return n===void 0&&(n={x:0,y:0}),{top:e.top-t.height-n.y,right:e.right-t.width+n.x,bottom:e.bottom-t.height+n.y,left:e.left-t.width-n.x}}function Ea(e){return[Dt,Yt,Kt,It].some(function(t){return e[t]>=0})}function Im(e){var t=e.state,n=e.name,s=t.rects.reference,i=t.rects.popper,r=t.modifiersData.preventOverflow,o=xn(t,{elementContext:"reference"}),a=xn(t,{altBoundary:!0}),l=va(o,s),u=va(a,i,r),c=Ea(l),f=Ea(u);t.modifiersData[n]={referenceClippingOffsets:l,popperEscapeOffsets:u,isReferenceHidden:c,hasPopperEscaped:f},t.attributes.popper=Object.assign({},t.attributes.popper,{"data-popper-reference-hidden":c,"data-popper-escaped":f})}const Yc={name:"hide",enabled:!0,phase:"main",requiresIfExists:["preventOverflow"],fn:Im};function Rm(e,t,n){var s=_e(e),i=[It,Dt].indexOf(s)>=0?-1:1,r=typeof n=="function"?n(Object.assign({},t,{placement:e})):n,o=r[0],a=r[1];return o=o||0,a=(a||0)*i,[It,Yt].indexOf(s)>=0?{x:a,y:o}:{x:o,y:a}}function xm(e){var t=e.state,n=e.options,s=e.name,i=n.offset,r=i===void 0?[0,0]:i,o=Qr.reduce(function(c,f){return c[f]=Rm(f,t.rects,r),c},{}),a=o[t.placement],l=a.x,u=a.y;t.modifiersData.popperOffsets!=null&&(t.modifiersData.popperOffsets.x+=l,t.modifiersData.popperOffsets.y+=u),t.modifiersData[s]=o}const qc={name:"offset",enabled:!0,phase:"main",requires:["popperOffsets"],fn:xm};function Pm(e){var t=e.state,n=e.name;t.modifiersData[n]=Uc({reference:t.rects.reference,element:t.rects.popper,placement:t.placement})}const oo={name:"popperOffsets",enabled:!0,phase:"read",fn:Pm,data:{}};function Lm(e){return e==="x"?"y":"x"}function Mm(e){var t=e.state,n=e.options,s=e.name,i=n.mainAxis,r=i===void 0?!0:i,o=n.altAxis,a=o===void 0?!1:o,l=n.boundary,u=n.rootBoundary,c=n.altBoundary,f=n.padding,p=n.tether,m=p===void 0?!0:p,A=n.tetherOffset,y=A===void 0?0:A,I=xn(t,{boundary:l,rootBoundary:u,padding:f,altBoundary:c}),N=_e(t.placement),$=Rn(t.placement),R=!$,T=to(N),C=Lm(T),V=t.modifiersData.popperOffsets,M=t.rects.reference,H=t.rects.popper,B=typeof y=="function"?y(Object.assign({},t.rects,{placement:t.placement})):y,z=typeof B=="number"?{mainAxis:B,altAxis:B}:Object.assign({mainAxis:0,altAxis:0},B),tt=t.modifiersData.offset?t.modifiersData.offset[t.placement]:null,ht={x:0,y:0};if(V){if(r){var it,Ot=T==="y"?Dt:It,At=T==="y"?Kt:Yt,X=T==="y"?"height":"width",U=V[T],Z=U+I[Ot],bt=U-I[At],kt=m?-H[X]/2:0,Rt=$===rn?M[X]:H[X],gt=$===rn?-H[X]:-M[X],ne=t.elements.arrow,Vt=m&&ne?Zr(ne):{width:0,height:0},Ft=t.modifiersData["arrow#persistent"]?t.modifiersData["arrow#persistent"].padding:Fc(),Et=Ft[Ot],_=Ft[At],k=is(0,M[X],Vt[X]),x=R?M[X]/2-kt-k-Et-z.mainAxis:Rt-k-Et-z.mainAxis,j=R?-M[X]/2+kt+k+_+z.mainAxis:gt+k+_+z.mainAxis,st=t.elements.arrow&&Es(t.elements.arrow),d=st?T==="y"?st.clientTop||0:st.clientLeft||0:0,h=(it=tt?.[T])!=null?it:0,g=U+x-h-d,E=U+j-h,b=is(m?Js(Z,g):Z,U,m?sn(bt,E):bt);V[T]=b,ht[T]=b-U}if(a){var v,P=T==="x"?Dt:It,D=T==="x"?Kt:Yt,O=V[C],S=C==="y"?"height":"width",K=O+I[P],F=O-I[D],W=[Dt,It].indexOf(N)!==-1,q=(v=tt?.[C])!=null?v:0,J=W?K:O-M[S]-H[S]-q+z.altAxis,at=W?O+M[S]+H[S]-q-z.altAxis:F,et=m&&W?hm(J,O,at):is(m?J:K,O,m?at:F);V[C]=et,ht[C]=et-O}t.modifiersData[s]=ht}}const Gc={name:"preventOverflow",enabled:!0,phase:"main",fn:Mm,requiresIfExists:["offset"]};function km(e){return{scrollLeft:e.scrollLeft,scrollTop:e.scrollTop}}function Vm(e){return e===qt(e)||!Xt(e)?so(e):km(e)}function Fm(e){var t=e.getBoundingClientRect(),n=Dn(t.width)/e.offsetWidth||1,s=Dn(t.height)/e.offsetHeight||1;return n!==1||s!==1}function Hm(e,t,n){n===void 0&&(n=!1);var s=Xt(t),i=Xt(t)&&Fm(t),r=qe(t),o=In(e,i,n),a={scrollLeft:0,scrollTop:0},l={x:0,y:0};return(s||!s&&!n)&&((be(t)!=="body"||ro(r))&&(a=Vm(t)),Xt(t)?(l=In(t,!0),l.x+=t.clientLeft,l.y+=t.clientTop):r&&(l.x=io(r))),{x:o.left+a.scrollLeft-l.x,y:o.top+a.scrollTop-l.y,width:o.width,height:o.height}}function jm(e){var t=new Map,n=new Set,s=[];e.forEach(function(r){t.set(r.name,r)});function i(r){n.add(r.name);var o=[].concat(r.requires||[],r.requiresIfExists||[]);o.forEach(function(a){if(!n.has(a)){var l=t.get(a);l&&i(l)}}),s.push(r)}return e.forEach(function(r){n.has(r.name)||i(r)}),s}function Bm(e){var t=jm(e);return Mc.reduce(function(n,s){return n.concat(t.filter(function(i){return i.phase===s}))},[])}function Wm(e){var t;return function(){return t||(t=new Promise(function(n){Promise.resolve().then(function(){t=void 0,n(e())})})),t}}function Um(e){var t=e.reduce(function(n,s){var i=n[s.name];return n[s.name]=i?Object.assign({},i,s,{options:Object.assign({},i.options,s.options),data:Object.assign({},i.data,s.data)}):s,n},{});return Object.keys(t).map(function(n){return t[n]})}var ba={placement:"bottom",modifiers:[],strategy:"absolute"};function ya(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return!t.some(function(s){return!(s&&typeof s.getBoundingClientRect=="function")})}function Ei(e){e===void 0&&(e={});var t=e,n=t.defaultModifiers,s=n===void 0?[]:n,i=t.defaultOptions,r=i===void 0?ba:i;return function(a,l,u){u===void 0&&(u=r);var c={placement:"bottom",orderedModifiers:[],options:Object.assign({},ba,r),modifiersData:{},elements:{reference:a,popper:l},attributes:{},styles:{}},f=[],p=!1,m={state:c,setOptions:function(N){var $=typeof N=="function"?N(c.options):N;y(),c.options=Object.assign({},r,c.options,$),c.scrollParents={reference:on(a)?rs(a):a.contextElement?rs(a.contextElement):[],popper:rs(l)};var R=Bm(Um([].concat(s,c.options.modifiers)));return c.orderedModifiers=R.filter(function(T){return T.enabled}),A(),m.update()},forceUpdate:function(){if(!p){var N=c.elements,$=N.reference,R=N.popper;if(ya($,R)){c.rects={reference:Hm($,Es(R),c.options.strategy==="fixed"),popper:Zr(R)},c.reset=!1,c.placement=c.options.placement,c.orderedModifiers.forEach(function(z){return c.modifiersData[z.name]=Object.assign({},z.data)});for(var T=0;T<c.orderedModifiers.length;T++){if(c.reset===!0){c.reset=!1,T=-1;continue}var C=c.orderedModifiers[T],V=C.fn,M=C.options,H=M===void 0?{}:M,B=C.name;typeof V=="function"&&(c=V({state:c,options:H,name:B,instance:m})||c)}}}},update:Wm(function(){return new Promise(function(I){m.forceUpdate(),I(c)})}),destroy:function(){y(),p=!0}};if(!ya(a,l))return m;m.setOptions(u).then(function(I){!p&&u.onFirstUpdate&&u.onFirstUpdate(I)});function A(){c.orderedModifiers.forEach(function(I){var N=I.name,$=I.options,R=$===void 0?{}:$,T=I.effect;if(typeof T=="function"){var C=T({state:c,name:N,instance:m,options:R}),V=function(){};f.push(C||V)}})}function y(){f.forEach(function(I){return I()}),f=[]}return m}}var Km=Ei(),Ym=[no,oo,eo,Jr],qm=Ei({defaultModifiers:Ym}),Gm=[no,oo,eo,Jr,qc,Kc,Gc,Bc,Yc],ao=Ei({defaultModifiers:Gm});const zc=Object.freeze(Object.defineProperty({__proto__:null,afterMain:Rc,afterRead:$c,afterWrite:Lc,applyStyles:Jr,arrow:Bc,auto:_i,basePlacements:Mn,beforeMain:Dc,beforeRead:Oc,beforeWrite:xc,bottom:Kt,clippingParents:Sc,computeStyles:eo,createPopper:ao,createPopperBase:Km,createPopperLite:qm,detectOverflow:xn,end:$n,eventListeners:no,flip:Kc,hide:Yc,left:It,main:Ic,modifierPhases:Mc,offset:qc,placements:Qr,popper:vn,popperGenerator:Ei,popperOffsets:oo,preventOverflow:Gc,read:Nc,reference:Cc,right:Yt,start:rn,top:Dt,variationPlacements:br,viewport:zr,write:Pc},Symbol.toStringTag,{value:"Module"}));/*!
+ */let bc;const gi=e=>bc=e,yc=Symbol();function vr(e){return e&&typeof e=="object"&&Object.prototype.toString.call(e)==="[object Object]"&&typeof e.toJSON!="function"}var ss;(function(e){e.direct="direct",e.patchObject="patch object",e.patchFunction="patch function"})(ss||(ss={}));function ip(){const e=ol(!0),t=e.run(()=>ut({}));let n=[],s=[];const i=Fr({install(r){gi(i),i._a=r,r.provide(yc,i),r.config.globalProperties.$pinia=i,s.forEach(o=>n.push(o)),s=[]},use(r){return this._a?n.push(r):s.push(r),this},_p:n,_a:null,_e:e,_s:new Map,state:t});return i}const Ac=()=>{};function fa(e,t,n,s=Ac){e.add(t);const i=()=>{e.delete(t)&&s()};return!n&&al()&&Lu(i),i}function dn(e,...t){e.forEach(n=>{n(...t)})}const rp=e=>e(),da=Symbol(),Hi=Symbol();function Er(e,t){e instanceof Map&&t instanceof Map?t.forEach((n,s)=>e.set(s,n)):e instanceof Set&&t instanceof Set&&t.forEach(e.add,e);for(const n in t){if(!t.hasOwnProperty(n))continue;const s=t[n],i=e[n];vr(i)&&vr(s)&&e.hasOwnProperty(n)&&!mt(s)&&!He(s)?e[n]=Er(i,s):e[n]=s}return e}const op=Symbol();function ap(e){return!vr(e)||!Object.prototype.hasOwnProperty.call(e,op)}const{assign:Le}=Object;function lp(e){return!!(mt(e)&&e.effect)}function cp(e,t,n,s){const{state:i,actions:r,getters:o}=t,a=n.state.value[e];let l;function u(){a||(n.state.value[e]=i?i():{});const c=rf(n.state.value[e]);return Le(c,r,Object.keys(o||{}).reduce((f,p)=>(f[p]=Fr(Lt(()=>{gi(n);const m=n._s.get(e);return o[p].call(m,m)})),f),{}))}return l=wc(e,u,t,n,s,!0),l}function wc(e,t,n={},s,i,r){let o;const a=Le({actions:{}},n),l={deep:!0};let u,c,f=new Set,p=new Set,m;const A=s.state.value[e];!r&&!A&&(s.state.value[e]={}),ut({});let y;function I(H){let B;u=c=!1,typeof H=="function"?(H(s.state.value[e]),B={type:ss.patchFunction,storeId:e,events:m}):(Er(s.state.value[e],H),B={type:ss.patchObject,payload:H,storeId:e,events:m});const z=y=Symbol();Hr().then(()=>{y===z&&(u=!0)}),c=!0,dn(f,B,s.state.value[e])}const N=r?function(){const{state:B}=n,z=B?B():{};this.$patch(tt=>{Le(tt,z)})}:Ac;function $(){o.stop(),f.clear(),p.clear(),s._s.delete(e)}const R=(H,B="")=>{if(da in H)return H[Hi]=B,H;const z=function(){gi(s);const tt=Array.from(arguments),ht=new Set,it=new Set;function Ot(U){ht.add(U)}function At(U){it.add(U)}dn(p,{args:tt,name:z[Hi],store:C,after:Ot,onError:At});let X;try{X=H.apply(this&&this.$id===e?this:C,tt)}catch(U){throw dn(it,U),U}return X instanceof Promise?X.then(U=>(dn(ht,U),U)).catch(U=>(dn(it,U),Promise.reject(U))):(dn(ht,X),X)};return z[da]=!0,z[Hi]=B,z},T={_p:s,$id:e,$onAction:fa.bind(null,p),$patch:I,$reset:N,$subscribe(H,B={}){const z=fa(f,H,B.detached,()=>tt()),tt=o.run(()=>Zn(()=>s.state.value[e],ht=>{(B.flush==="sync"?c:u)&&H({storeId:e,type:ss.direct,events:m},ht)},Le({},l,B)));return z},$dispose:$},C=ms(T);s._s.set(e,C);const M=(s._a&&s._a.runWithContext||rp)(()=>s._e.run(()=>(o=ol()).run(()=>t({action:R}))));for(const H in M){const B=M[H];if(mt(B)&&!lp(B)||He(B))r||(A&&ap(B)&&(mt(B)?B.value=A[H]:Er(B,A[H])),s.state.value[e][H]=B);else if(typeof B=="function"){const z=R(B,H);M[H]=z,a.actions[H]=B}}return Le(C,M),Le(nt(C),M),Object.defineProperty(C,"$state",{get:()=>s.state.value[e],set:H=>{I(B=>{Le(B,H)})}}),s._p.forEach(H=>{Le(C,o.run(()=>H({store:C,app:s._a,pinia:s,options:a})))}),A&&r&&n.hydrate&&n.hydrate(C.$state,A),u=!0,c=!0,C}/*! #__NO_SIDE_EFFECTS__ */function up(e,t,n){let s;const i=typeof t=="function";s=i?n:t;function r(o,a){const l=Hf();return o=o||(l?zt(yc,null):null),o&&gi(o),o=bc,o._s.has(e)||(i?wc(e,t,s,o):cp(e,s,o)),o._s.get(e)}return r.$id=e,r}function fp(e){const t=document.cookie.match(new RegExp("(^|; )"+e+"=([^;]*)"));return t?decodeURIComponent(t[2]):null}const Gr=up("auctionStore",()=>{const e=ut([]);function t(o){const a=e.value.findIndex(l=>l.id===o.id);a>=0?e.value[a]=o:e.value.push(o)}function n(o,a){const l=e.value.find(u=>u.id===o);l&&(l.currentBid=a)}function s(o){return e.value.find(a=>a.id===o)||null}async function i(o=""){try{const a=await fetch(`/api/auction-items/?search=${encodeURIComponent(o)}`);if(!a.ok)throw new Error("Failed to fetch auction items");const l=(await a.json()).results;e.value=l.map(u=>({id:u.id,title:u.title,description:u.description,startingBid:parseFloat(u.starting_bid),currentBid:u.current_bid?parseFloat(u.current_bid):parseFloat(u.starting_bid),imageUrl:u.image,endDate:u.end_datetime}))}catch(a){console.error(a)}}async function r(o){const a=new FormData;a.append("title",o.title),a.append("description",o.description),a.append("starting_bid",o.startingBid.toFixed(2)),a.append("end_datetime",o.endDate),o.imageFile&&a.append("image",o.imageFile);const l=fp("csrftoken"),u=await fetch("/api/auction-items/",{method:"POST",body:a,credentials:"same-origin",headers:l?{"X-CSRFToken":l}:{}});if(!u.ok){const f=await u.text();try{const p=JSON.parse(f);throw new Error(Object.values(p).map(m=>Array.isArray(m)?m.join(", "):m).join(", "))}catch{throw new Error(f||`Request failed with status ${u.status}`)}}const c=await u.json();return t({id:c.id,title:c.title,description:c.description,startingBid:parseFloat(c.starting_bid),currentBid:c.current_bid?parseFloat(c.current_bid):0,imageUrl:c.image,endDate:c.end_datetime,ownerUsername:c.ownerUsername}),c}return{items:e,setItem:t,updateBid:n,getItem:s,fetchItems:i,createItem:r}}),dp=ln({name:"NewAuctionItem",setup(){const e=Gr(),t=Ec(),n=ut(""),s=ut(""),i=ut(0),r=ut(""),o=ut(null),a=ut("");return{title:n,description:s,startingBid:i,endDate:r,imageFile:o,handleFileUpload:c=>{const f=c.target;f.files&&f.files.length>0&&(o.value=f.files[0])},submitForm:async()=>{if(a.value="",!n.value||!s.value||!r.value){a.value="Please fill in all required fields.";return}try{const c=await e.createItem({title:n.value.trim(),description:s.value.trim(),startingBid:Number(i.value),endDate:r.value.length===16?r.value+":00":r.value,imageFile:o.value});t.push(`/item/${c.id}`)}catch(c){a.value=c.message||"Failed to create auction item."}},errorMessage:a}}}),hp={class:"new-auction-item"},pp={class:"form-group"},mp={class:"form-group"},gp={class:"form-group"},_p={class:"form-group"},vp={class:"form-group"},Ep={key:0,class:"error"};function bp(e,t,n,s,i,r){return lt(),dt("div",hp,[t[12]||(t[12]=L("h1",null,"Create New Auction Item",-1)),L("form",{onSubmit:t[5]||(t[5]=pr((...o)=>e.submitForm&&e.submitForm(...o),["prevent"]))},[L("div",pp,[t[6]||(t[6]=L("label",{for:"title"},"Title:",-1)),he(L("input",{type:"text",id:"title","onUpdate:modelValue":t[0]||(t[0]=o=>e.title=o),required:""},null,512),[[pe,e.title]])]),L("div",mp,[t[7]||(t[7]=L("label",{for:"description"},"Description:",-1)),he(L("textarea",{id:"description","onUpdate:modelValue":t[1]||(t[1]=o=>e.description=o),required:""},null,512),[[pe,e.description]])]),L("div",gp,[t[8]||(t[8]=L("label",{for:"startingBid"},"Starting Bid:",-1)),he(L("input",{type:"number",id:"startingBid","onUpdate:modelValue":t[2]||(t[2]=o=>e.startingBid=o),step:"0.01",min:"0",placeholder:"0.00"},null,512),[[pe,e.startingBid]])]),L("div",_p,[t[9]||(t[9]=L("label",{for:"endDate"},"End Date:",-1)),he(L("input",{type:"datetime-local",id:"endDate","onUpdate:modelValue":t[3]||(t[3]=o=>e.endDate=o),required:""},null,512),[[pe,e.endDate]])]),L("div",vp,[t[10]||(t[10]=L("label",{for:"image"},"Image:",-1)),L("input",{type:"file",id:"image",onChange:t[4]||(t[4]=(...o)=>e.handleFileUpload&&e.handleFileUpload(...o))},null,32)]),t[11]||(t[11]=L("button",{type:"submit",class:"submit-btn"},"Create Auction Item",-1))],32),e.errorMessage?(lt(),dt("p",Ep,vt(e.errorMessage),1)):ge("",!0)])}const yp=mi(dp,[["render",bp],["__scopeId","data-v-a3eda76e"]]),Ap=ln({name:"AuctionItemDetail",setup(){const e=Gr(),t=Xh(),n=Number(t.params.id),s=Lt(()=>e.getItem(n)),i=ut([]),r="/static/api/spa/assets/placeholder.jpg",o=ut(""),a=ut(""),l=ut(""),u=ut(null),c=ut(""),f=ut(!1);function p(C){const V=document.cookie.match(new RegExp("(^|; )"+C+"=([^;]*)"));return V?decodeURIComponent(V[2]):null}const m=C=>new Date(C).toLocaleString(),A=async C=>{try{const M=await(await fetch(`/api/auction-items/${C}/`)).json(),H={id:M.id,title:M.title,description:M.description,startingBid:parseFloat(M.starting_bid),currentBid:M.current_bid?parseFloat(M.current_bid):0,imageUrl:M.image,endDate:M.end_datetime,ownerUsername:M.ownerUsername};e.setItem(H)}catch(V){l.value="Failed to load item details.",console.error(V)}},y=async C=>{try{const V=await fetch(`/api/item-questions/?item_id=${C}`);if(!V.ok)throw new Error("Failed to fetch questions");i.value=await V.json()}catch(V){console.error(V)}},I=ut(null),N=async()=>{try{const C=await fetch("/api/current-user/",{credentials:"same-origin"});if(!C.ok)throw new Error("Failed to fetch current user");const V=await C.json();I.value=V.username}catch(C){console.error(C)}},$=async()=>{if(!s.value||!o.value.trim())return;const C=p("csrftoken");try{const V=await fetch("/api/item-questions/",{method:"POST",headers:{"Content-Type":"application/json",...C?{"X-CSRFToken":C}:{}},body:JSON.stringify({item:s.value.id,question_text:o.value})});if(!V.ok){const H=await V.text();throw new Error(H)}const M=await V.json();i.value.push(M),o.value="",a.value="",y(s.value.id)}catch(V){a.value=V.message}},R=async C=>{if(!C.newAnswer?.trim())return;const V=p("csrftoken");try{const M=await fetch(`/api/item-questions/${C.id}/answer/`,{method:"PATCH",headers:{"Content-Type":"application/json",...V?{"X-CSRFToken":V}:{}},body:JSON.stringify({answer_text:C.newAnswer})});if(!M.ok)throw new Error("Failed to submit answer");const H=await M.json();C.answer_text=H.answer_text,C.newAnswer=""}catch(M){console.error(M)}},T=async()=>{if(!s.value||u.value===null)return;const C=p("csrftoken"),V=new FormData;V.append("bid_amount",u.value.toString());try{const M=await fetch(`/api/auction-items/${s.value.id}/place_bid/`,{method:"POST",body:V,credentials:"same-origin",headers:C?{"X-CSRFToken":C}:{}}),H=await M.json().catch(()=>({}));if(!M.ok)throw new Error(H.error||"Failed to place bid.");const B=H;e.updateBid(s.value.id,parseFloat(B.current_bid)),u.value=null,c.value="",f.value=!0,setTimeout(()=>f.value=!1,1200)}catch(M){c.value=M.message}};return _s(()=>{const C=Number(t.params.id);isNaN(C)||(A(C),y(C),N())}),{item:s,currentUser:I,placeholderUrl:r,formatEndDate:m,newQuestion:o,questionError:a,submitQuestion:$,questions:i,fetchError:l,submitAnswer:R,newBid:u,bidError:c,submitBid:T,bidUpdated:f}}}),wp={class:"auction-item-detail"},Tp={key:0},Sp={class:"item-card"},Cp={class:"item-title"},Op=["src"],Np=["src"],$p={class:"item-info"},Dp={class:"place-bid"},Ip=["disabled"],Rp={key:0},xp={class:"item-questions"},Pp={key:0},Lp={key:1},Mp={key:0},kp={key:1},Vp=["onSubmit"],Fp=["onUpdate:modelValue"],Hp={key:2},jp={class:"ask-question"},Bp={key:0},Wp={key:1,class:"loading"},Up={key:2};function Kp(e,t,n,s,i,r){return lt(),dt("div",wp,[e.item?(lt(),dt("div",Tp,[L("div",Sp,[L("h1",Cp,vt(e.item.title),1),e.item.imageUrl?(lt(),dt("img",{key:0,src:e.item.imageUrl,class:"item-image"},null,8,Op)):(lt(),dt("img",{key:1,src:e.placeholderUrl,class:"item-image"},null,8,Np)),L("div",$p,[L("p",null,[t[4]||(t[4]=L("strong",null,"Description:",-1)),Bt(" "+vt(e.item.description),1)]),L("p",null,[t[5]||(t[5]=L("strong",null,"Starting Bid:",-1)),Bt(" $"+vt(e.item.startingBid.toFixed(2)),1)]),L("p",{class:ps({"bid-flash":e.bidUpdated})},[t[6]||(t[6]=L("strong",null,"Current Bid:",-1)),Bt(" $"+vt(e.item.currentBid.toFixed(2)),1)],2),L("p",null,[t[7]||(t[7]=L("strong",null,"Auction Ends:",-1)),Bt(" "+vt(e.formatEndDate(e.item.endDate)),1)])])]),L("div",Dp,[he(L("input",{type:"number","onUpdate:modelValue":t[0]||(t[0]=o=>e.newBid=o)},null,512),[[pe,e.newBid,void 0,{number:!0}]]),L("button",{onClick:t[1]||(t[1]=(...o)=>e.submitBid&&e.submitBid(...o)),disabled:!e.newBid||e.newBid<=e.item.currentBid}," Submit Bid ",8,Ip),e.bidError?(lt(),dt("p",Rp,vt(e.bidError),1)):ge("",!0)]),L("div",xp,[t[13]||(t[13]=L("h2",null,"Questions & Answers",-1)),e.questions.length===0?(lt(),dt("div",Pp,[...t[8]||(t[8]=[L("p",null,"No questions yet.",-1)])])):(lt(),dt("div",Lp,[(lt(!0),dt(se,null,Ll(e.questions,o=>(lt(),dt("div",{key:o.id},[L("p",null,[t[9]||(t[9]=L("strong",null,"Q:",-1)),Bt(" "+vt(o.question_text),1)]),o.answer_text?(lt(),dt("p",Mp,[t[10]||(t[10]=L("strong",null,"A:",-1)),Bt(" "+vt(o.answer_text),1)])):e.item.ownerUsername===e.currentUser?(lt(),dt("div",kp,[L("form",{onSubmit:pr(a=>e.submitAnswer(o),["prevent"])},[he(L("textarea",{"onUpdate:modelValue":a=>o.newAnswer=a},null,8,Fp),[[pe,o.newAnswer]]),t[11]||(t[11]=L("button",null,"Answer",-1))],40,Vp)])):(lt(),dt("div",Hp,[...t[12]||(t[12]=[L("em",null,"This question has not been answered yet.",-1)])]))]))),128))]))]),L("div",jp,[L("form",{onSubmit:t[3]||(t[3]=pr((...o)=>e.submitQuestion&&e.submitQuestion(...o),["prevent"]))},[he(L("textarea",{"onUpdate:modelValue":t[2]||(t[2]=o=>e.newQuestion=o)},null,512),[[pe,e.newQuestion]]),t[14]||(t[14]=L("button",{type:"submit"},"Ask Question",-1))],32),e.questionError?(lt(),dt("p",Bp,vt(e.questionError),1)):ge("",!0)])])):(lt(),dt("p",Wp,"Loading item details...")),e.fetchError?(lt(),dt("p",Up,vt(e.fetchError),1)):ge("",!0)])}const Yp=mi(Ap,[["render",Kp],["__scopeId","data-v-5f3f52cb"]]),qp=e=>{const t=new Date(e),n=new Date,s=t.getTime()-n.getTime();if(s<=0)return"Auction ended";const i=Math.floor(s/(1e3*60*60*24)),r=Math.floor(s/(1e3*60*60)%24),o=Math.floor(s/(1e3*60)%60);return`Ends in ${i}d ${r}h ${o}m`},Gp=ln({name:"AuctionItemList",setup(){const e=Gr(),t=Lt(()=>e.items),n=ut(""),s=ut(!1),i=Ec();function r(u,c){let f;return(...p)=>{clearTimeout(f),f=window.setTimeout(()=>{u(...p)},c)}}const o=(u,c)=>(u||c).toFixed(2),a=r(async()=>{s.value=!0,await e.fetchItems(n.value),s.value=!1},300),l=u=>{i.push({name:"AuctionItemDetail",params:{id:u}})};return _s(async()=>{s.value=!0,await e.fetchItems(),s.value=!1}),{items:t,searchQuery:n,loading:s,goToItem:l,formatBid:o,formatEndTime:qp,debouncedFetch:a}}}),zp={class:"auction-item-list"},Qp={key:0,class:"loading"},Xp={key:1},Jp={class:"items-grid"},Zp=["onClick"],tm=["src"],em={class:"description"},nm={class:"price"},sm={class:"end-time"};function im(e,t,n,s,i,r){return lt(),dt("div",zp,[t[2]||(t[2]=L("h1",null,"Auction Items",-1)),he(L("input",{type:"text","onUpdate:modelValue":t[0]||(t[0]=o=>e.searchQuery=o),placeholder:"Search auction items...",class:"search-bar",onInput:t[1]||(t[1]=(...o)=>e.debouncedFetch&&e.debouncedFetch(...o))},null,544),[[pe,e.searchQuery]]),e.loading?(lt(),dt("div",Qp,"Loading auction items...")):ge("",!0),!e.loading&&e.items.length===0?(lt(),dt("p",Xp,"No auction items found.")):ge("",!0),L("div",Jp,[(lt(!0),dt(se,null,Ll(e.items,o=>(lt(),dt("div",{key:o.id,class:ps(["item-card",{"ending-soon":new Date(o.endDate).getTime()-Date.now()<1440*60*1e3}]),onClick:a=>e.goToItem(o.id)},[L("img",{src:o.imageUrl??"/static/api/spa/assets/placeholder.jpg",alt:"Item Image"},null,8,tm),L("h3",null,vt(o.title),1),L("p",em,vt(o.description),1),L("p",nm," Current Bid: £"+vt(e.formatBid(o.currentBid,o.startingBid)),1),L("p",sm,vt(e.formatEndTime(o.endDate)),1)],10,Zp))),128))])])}const ha=mi(Gp,[["render",im],["__scopeId","data-v-ef47635a"]]),rm={class:"profile-container"},om={key:0,class:"profile-summary"},am=["src","alt"],lm=ln({__name:"Profile",setup(e){const t=ut("/static/api/spa/assets/profile-placeholder.webp"),n=ut(null),s=ut(""),i=ut(""),r=ut(null);function o(){return document.cookie.split("; ").find(u=>u.startsWith("csrftoken="))?.split("=")[1]||""}_s(async()=>{const c=await(await fetch("/api/profile/",{credentials:"same-origin"})).json();n.value=c,s.value=c?.email??"",i.value=c?.date_of_birth??"",t.value=c?.profile_image??"/static/api/spa/assets/profile-placeholder.webp"});async function a(){const u=new FormData;u.append("email",s.value),i.value&&u.append("date_of_birth",i.value),r.value&&u.append("profile_image",r.value);const f=await(await fetch("/api/profile/",{method:"POST",headers:{"X-CSRFToken":o()},body:u,credentials:"same-origin"})).json();n.value=f,f.profile_image&&(t.value=f.profile_image),alert("Profile updated successfully!")}function l(u){const f=u.target?.files?.[0]??null;f&&(r.value=f,t.value=URL.createObjectURL(f))}return(u,c)=>(lt(),dt("div",rm,[c[5]||(c[5]=L("h1",null,"Profile",-1)),c[6]||(c[6]=L("p",null,"Edit your details below.",-1)),n.value?(lt(),dt("div",om,[L("img",{src:t.value,alt:t.value,class:"profile-preview"},null,8,am),L("p",null,[c[2]||(c[2]=L("strong",null,"Username:",-1)),Bt(" "+vt(n.value.username),1)]),L("p",null,[c[3]||(c[3]=L("strong",null,"Email:",-1)),Bt(" "+vt(n.value.email),1)]),L("p",null,[c[4]||(c[4]=L("strong",null,"Date of Birth:",-1)),Bt(" "+vt(n.value.date_of_birth||"Not set"),1)])])):ge("",!0),c[7]||(c[7]=L("label",{for:""},"Email",-1)),he(L("input",{"onUpdate:modelValue":c[0]||(c[0]=f=>s.value=f),type:"email"},null,512),[[pe,s.value]]),c[8]||(c[8]=L("label",{for:""},"Date of Birth",-1)),he(L("input",{"onUpdate:modelValue":c[1]||(c[1]=f=>i.value=f),type:"date"},null,512),[[pe,i.value]]),c[9]||(c[9]=L("label",{for:""},"Profile Image",-1)),L("input",{type:"file",onChange:l},null,32),L("button",{onClick:a},"Save")]))}}),Tc=zh({history:Sh("/app/"),routes:[{path:"/",name:"Main Page",component:ha},{path:"/new-auction-item/",name:"New Auction Item",component:yp},{path:"/item/:id",name:"AuctionItemDetail",component:Yp},{path:"/auction-items",name:"AuctionItemList",component:ha},{path:"/profile/",name:"Profile",component:lm}]});var Dt="top",Kt="bottom",Yt="right",It="left",_i="auto",Mn=[Dt,Kt,Yt,It],rn="start",$n="end",Sc="clippingParents",zr="viewport",vn="popper",Cc="reference",br=Mn.reduce(function(e,t){return e.concat([t+"-"+rn,t+"-"+$n])},[]),Qr=[].concat(Mn,[_i]).reduce(function(e,t){return e.concat([t,t+"-"+rn,t+"-"+$n])},[]),Oc="beforeRead",Nc="read",$c="afterRead",Dc="beforeMain",Ic="main",Rc="afterMain",xc="beforeWrite",Pc="write",Lc="afterWrite",Mc=[Oc,Nc,$c,Dc,Ic,Rc,xc,Pc,Lc];function be(e){return e?(e.nodeName||"").toLowerCase():null}function qt(e){if(e==null)return window;if(e.toString()!=="[object Window]"){var t=e.ownerDocument;return t&&t.defaultView||window}return e}function on(e){var t=qt(e).Element;return e instanceof t||e instanceof Element}function Xt(e){var t=qt(e).HTMLElement;return e instanceof t||e instanceof HTMLElement}function Xr(e){if(typeof ShadowRoot>"u")return!1;var t=qt(e).ShadowRoot;return e instanceof t||e instanceof ShadowRoot}function cm(e){var t=e.state;Object.keys(t.elements).forEach(function(n){var s=t.styles[n]||{},i=t.attributes[n]||{},r=t.elements[n];!Xt(r)||!be(r)||(Object.assign(r.style,s),Object.keys(i).forEach(function(o){var a=i[o];a===!1?r.removeAttribute(o):r.setAttribute(o,a===!0?"":a)}))})}function um(e){var t=e.state,n={popper:{position:t.options.strategy,left:"0",top:"0",margin:"0"},arrow:{position:"absolute"},reference:{}};return Object.assign(t.elements.popper.style,n.popper),t.styles=n,t.elements.arrow&&Object.assign(t.elements.arrow.style,n.arrow),function(){Object.keys(t.elements).forEach(function(s){var i=t.elements[s],r=t.attributes[s]||{},o=Object.keys(t.styles.hasOwnProperty(s)?t.styles[s]:n[s]),a=o.reduce(function(l,u){return l[u]="",l},{});!Xt(i)||!be(i)||(Object.assign(i.style,a),Object.keys(r).forEach(function(l){i.removeAttribute(l)}))})}}const Jr={name:"applyStyles",enabled:!0,phase:"write",fn:cm,effect:um,requires:["computeStyles"]};function _e(e){return e.split("-")[0]}var sn=Math.max,Js=Math.min,Dn=Math.round;function yr(){var e=navigator.userAgentData;return e!=null&&e.brands&&Array.isArray(e.brands)?e.brands.map(function(t){return t.brand+"/"+t.version}).join(" "):navigator.userAgent}function kc(){return!/^((?!chrome|android).)*safari/i.test(yr())}function In(e,t,n){t===void 0&&(t=!1),n===void 0&&(n=!1);var s=e.getBoundingClientRect(),i=1,r=1;t&&Xt(e)&&(i=e.offsetWidth>0&&Dn(s.width)/e.offsetWidth||1,r=e.offsetHeight>0&&Dn(s.height)/e.offsetHeight||1);var o=on(e)?qt(e):window,a=o.visualViewport,l=!kc()&&n,u=(s.left+(l&&a?a.offsetLeft:0))/i,c=(s.top+(l&&a?a.offsetTop:0))/r,f=s.width/i,p=s.height/r;return{width:f,height:p,top:c,right:u+f,bottom:c+p,left:u,x:u,y:c}}function Zr(e){var t=In(e),n=e.offsetWidth,s=e.offsetHeight;return Math.abs(t.width-n)<=1&&(n=t.width),Math.abs(t.height-s)<=1&&(s=t.height),{x:e.offsetLeft,y:e.offsetTop,width:n,height:s}}function Vc(e,t){var n=t.getRootNode&&t.getRootNode();if(e.contains(t))return!0;if(n&&Xr(n)){var s=t;do{if(s&&e.isSameNode(s))return!0;s=s.parentNode||s.host}while(s)}return!1}function De(e){return qt(e).getComputedStyle(e)}function fm(e){return["table","td","th"].indexOf(be(e))>=0}function qe(e){return((on(e)?e.ownerDocument:e.document)||window.document).documentElement}function vi(e){return be(e)==="html"?e:e.assignedSlot||e.parentNode||(Xr(e)?e.host:null)||qe(e)}function pa(e){return!Xt(e)||De(e).position==="fixed"?null:e.offsetParent}function dm(e){var t=/firefox/i.test(yr()),n=/Trident/i.test(yr());if(n&&Xt(e)){var s=De(e);if(s.position==="fixed")return null}var i=vi(e);for(Xr(i)&&(i=i.host);Xt(i)&&["html","body"].indexOf(be(i))<0;){var r=De(i);if(r.transform!=="none"||r.perspective!=="none"||r.contain==="paint"||["transform","perspective"].indexOf(r.willChange)!==-1||t&&r.willChange==="filter"||t&&r.filter&&r.filter!=="none")return i;i=i.parentNode}return null}function Es(e){for(var t=qt(e),n=pa(e);n&&fm(n)&&De(n).position==="static";)n=pa(n);return n&&(be(n)==="html"||be(n)==="body"&&De(n).position==="static")?t:n||dm(e)||t}function to(e){return["top","bottom"].indexOf(e)>=0?"x":"y"}function is(e,t,n){return sn(e,Js(t,n))}function hm(e,t,n){var s=is(e,t,n);return s>n?n:s}function Fc(){return{top:0,right:0,bottom:0,left:0}}function Hc(e){return Object.assign({},Fc(),e)}function jc(e,t){return t.reduce(function(n,s){return n[s]=e,n},{})}var pm=function(t,n){return t=typeof t=="function"?t(Object.assign({},n.rects,{placement:n.placement})):t,Hc(typeof t!="number"?t:jc(t,Mn))};function mm(e){var t,n=e.state,s=e.name,i=e.options,r=n.elements.arrow,o=n.modifiersData.popperOffsets,a=_e(n.placement),l=to(a),u=[It,Yt].indexOf(a)>=0,c=u?"height":"width";if(!(!r||!o)){var f=pm(i.padding,n),p=Zr(r),m=l==="y"?Dt:It,A=l==="y"?Kt:Yt,y=n.rects.reference[c]+n.rects.reference[l]-o[l]-n.rects.popper[c],I=o[l]-n.rects.reference[l],N=Es(r),$=N?l==="y"?N.clientHeight||0:N.clientWidth||0:0,R=y/2-I/2,T=f[m],C=$-p[c]-f[A],V=$/2-p[c]/2+R,M=is(T,V,C),H=l;n.modifiersData[s]=(t={},t[H]=M,t.centerOffset=M-V,t)}}function gm(e){var t=e.state,n=e.options,s=n.element,i=s===void 0?"[data-popper-arrow]":s;i!=null&&(typeof i=="string"&&(i=t.elements.popper.querySelector(i),!i)||Vc(t.elements.popper,i)&&(t.elements.arrow=i))}const Bc={name:"arrow",enabled:!0,phase:"main",fn:mm,effect:gm,requires:["popperOffsets"],requiresIfExists:["preventOverflow"]};function Rn(e){return e.split("-")[1]}var _m={top:"auto",right:"auto",bottom:"auto",left:"auto"};function vm(e,t){var n=e.x,s=e.y,i=t.devicePixelRatio||1;return{x:Dn(n*i)/i||0,y:Dn(s*i)/i||0}}function ma(e){var t,n=e.popper,s=e.popperRect,i=e.placement,r=e.variation,o=e.offsets,a=e.position,l=e.gpuAcceleration,u=e.adaptive,c=e.roundOffsets,f=e.isFixed,p=o.x,m=p===void 0?0:p,A=o.y,y=A===void 0?0:A,I=typeof c=="function"?c({x:m,y}):{x:m,y};m=I.x,y=I.y;var N=o.hasOwnProperty("x"),$=o.hasOwnProperty("y"),R=It,T=Dt,C=window;if(u){var V=Es(n),M="clientHeight",H="clientWidth";if(V===qt(n)&&(V=qe(n),De(V).position!=="static"&&a==="absolute"&&(M="scrollHeight",H="scrollWidth")),V=V,i===Dt||(i===It||i===Yt)&&r===$n){T=Kt;var B=f&&V===C&&C.visualViewport?C.visualViewport.height:V[M];y-=B-s.height,y*=l?1:-1}if(i===It||(i===Dt||i===Kt)&&r===$n){R=Yt;var z=f&&V===C&&C.visualViewport?C.visualViewport.width:V[H];m-=z-s.width,m*=l?1:-1}}var tt=Object.assign({position:a},u&&_m),ht=c===!0?vm({x:m,y},qt(n)):{x:m,y};if(m=ht.x,y=ht.y,l){var it;return Object.assign({},tt,(it={},it[T]=$?"0":"",it[R]=N?"0":"",it.transform=(C.devicePixelRatio||1)<=1?"translate("+m+"px, "+y+"px)":"translate3d("+m+"px, "+y+"px, 0)",it))}return Object.assign({},tt,(t={},t[T]=$?y+"px":"",t[R]=N?m+"px":"",t.transform="",t))}function Em(e){var t=e.state,n=e.options,s=n.gpuAcceleration,i=s===void 0?!0:s,r=n.adaptive,o=r===void 0?!0:r,a=n.roundOffsets,l=a===void 0?!0:a,u={placement:_e(t.placement),variation:Rn(t.placement),popper:t.elements.popper,popperRect:t.rects.popper,gpuAcceleration:i,isFixed:t.options.strategy==="fixed"};t.modifiersData.popperOffsets!=null&&(t.styles.popper=Object.assign({},t.styles.popper,ma(Object.assign({},u,{offsets:t.modifiersData.popperOffsets,position:t.options.strategy,adaptive:o,roundOffsets:l})))),t.modifiersData.arrow!=null&&(t.styles.arrow=Object.assign({},t.styles.arrow,ma(Object.assign({},u,{offsets:t.modifiersData.arrow,position:"absolute",adaptive:!1,roundOffsets:l})))),t.attributes.popper=Object.assign({},t.attributes.popper,{"data-popper-placement":t.placement})}const eo={name:"computeStyles",enabled:!0,phase:"beforeWrite",fn:Em,data:{}};var Os={passive:!0};function bm(e){var t=e.state,n=e.instance,s=e.options,i=s.scroll,r=i===void 0?!0:i,o=s.resize,a=o===void 0?!0:o,l=qt(t.elements.popper),u=[].concat(t.scrollParents.reference,t.scrollParents.popper);return r&&u.forEach(function(c){c.addEventListener("scroll",n.update,Os)}),a&&l.addEventListener("resize",n.update,Os),function(){r&&u.forEach(function(c){c.removeEventListener("scroll",n.update,Os)}),a&&l.removeEventListener("resize",n.update,Os)}}const no={name:"eventListeners",enabled:!0,phase:"write",fn:function(){},effect:bm,data:{}};var ym={left:"right",right:"left",bottom:"top",top:"bottom"};function Fs(e){return e.replace(/left|right|bottom|top/g,function(t){return ym[t]})}var Am={start:"end",end:"start"};function ga(e){return e.replace(/start|end/g,function(t){return Am[t]})}function so(e){var t=qt(e),n=t.pageXOffset,s=t.pageYOffset;return{scrollLeft:n,scrollTop:s}}function io(e){return In(qe(e)).left+so(e).scrollLeft}function wm(e,t){var n=qt(e),s=qe(e),i=n.visualViewport,r=s.clientWidth,o=s.clientHeight,a=0,l=0;if(i){r=i.width,o=i.height;var u=kc();(u||!u&&t==="fixed")&&(a=i.offsetLeft,l=i.offsetTop)}return{width:r,height:o,x:a+io(e),y:l}}function Tm(e){var t,n=qe(e),s=so(e),i=(t=e.ownerDocument)==null?void 0:t.body,r=sn(n.scrollWidth,n.clientWidth,i?i.scrollWidth:0,i?i.clientWidth:0),o=sn(n.scrollHeight,n.clientHeight,i?i.scrollHeight:0,i?i.clientHeight:0),a=-s.scrollLeft+io(e),l=-s.scrollTop;return De(i||n).direction==="rtl"&&(a+=sn(n.clientWidth,i?i.clientWidth:0)-r),{width:r,height:o,x:a,y:l}}function ro(e){var t=De(e),n=t.overflow,s=t.overflowX,i=t.overflowY;return/auto|scroll|overlay|hidden/.test(n+i+s)}function Wc(e){return["html","body","#document"].indexOf(be(e))>=0?e.ownerDocument.body:Xt(e)&&ro(e)?e:Wc(vi(e))}function rs(e,t){var n;t===void 0&&(t=[]);var s=Wc(e),i=s===((n=e.ownerDocument)==null?void 0:n.body),r=qt(s),o=i?[r].concat(r.visualViewport||[],ro(s)?s:[]):s,a=t.concat(o);return i?a:a.concat(rs(vi(o)))}function Ar(e){return Object.assign({},e,{left:e.x,top:e.y,right:e.x+e.width,bottom:e.y+e.height})}function Sm(e,t){var n=In(e,!1,t==="fixed");return n.top=n.top+e.clientTop,n.left=n.left+e.clientLeft,n.bottom=n.top+e.clientHeight,n.right=n.left+e.clientWidth,n.width=e.clientWidth,n.height=e.clientHeight,n.x=n.left,n.y=n.top,n}function _a(e,t,n){return t===zr?Ar(wm(e,n)):on(t)?Sm(t,n):Ar(Tm(qe(e)))}function Cm(e){var t=rs(vi(e)),n=["absolute","fixed"].indexOf(De(e).position)>=0,s=n&&Xt(e)?Es(e):e;return on(s)?t.filter(function(i){return on(i)&&Vc(i,s)&&be(i)!=="body"}):[]}function Om(e,t,n,s){var i=t==="clippingParents"?Cm(e):[].concat(t),r=[].concat(i,[n]),o=r[0],a=r.reduce(function(l,u){var c=_a(e,u,s);return l.top=sn(c.top,l.top),l.right=Js(c.right,l.right),l.bottom=Js(c.bottom,l.bottom),l.left=sn(c.left,l.left),l},_a(e,o,s));return a.width=a.right-a.left,a.height=a.bottom-a.top,a.x=a.left,a.y=a.top,a}function Uc(e){var t=e.reference,n=e.element,s=e.placement,i=s?_e(s):null,r=s?Rn(s):null,o=t.x+t.width/2-n.width/2,a=t.y+t.height/2-n.height/2,l;switch(i){case Dt:l={x:o,y:t.y-n.height};break;case Kt:l={x:o,y:t.y+t.height};break;case Yt:l={x:t.x+t.width,y:a};break;case It:l={x:t.x-n.width,y:a};break;default:l={x:t.x,y:t.y}}var u=i?to(i):null;if(u!=null){var c=u==="y"?"height":"width";switch(r){case rn:l[u]=l[u]-(t[c]/2-n[c]/2);break;case $n:l[u]=l[u]+(t[c]/2-n[c]/2);break}}return l}function xn(e,t){t===void 0&&(t={});var n=t,s=n.placement,i=s===void 0?e.placement:s,r=n.strategy,o=r===void 0?e.strategy:r,a=n.boundary,l=a===void 0?Sc:a,u=n.rootBoundary,c=u===void 0?zr:u,f=n.elementContext,p=f===void 0?vn:f,m=n.altBoundary,A=m===void 0?!1:m,y=n.padding,I=y===void 0?0:y,N=Hc(typeof I!="number"?I:jc(I,Mn)),$=p===vn?Cc:vn,R=e.rects.popper,T=e.elements[A?$:p],C=Om(on(T)?T:T.contextElement||qe(e.elements.popper),l,c,o),V=In(e.elements.reference),M=Uc({reference:V,element:R,placement:i}),H=Ar(Object.assign({},R,M)),B=p===vn?H:V,z={top:C.top-B.top+N.top,bottom:B.bottom-C.bottom+N.bottom,left:C.left-B.left+N.left,right:B.right-C.right+N.right},tt=e.modifiersData.offset;if(p===vn&&tt){var ht=tt[i];Object.keys(z).forEach(function(it){var Ot=[Yt,Kt].indexOf(it)>=0?1:-1,At=[Dt,Kt].indexOf(it)>=0?"y":"x";z[it]+=ht[At]*Ot})}return z}function Nm(e,t){t===void 0&&(t={});var n=t,s=n.placement,i=n.boundary,r=n.rootBoundary,o=n.padding,a=n.flipVariations,l=n.allowedAutoPlacements,u=l===void 0?Qr:l,c=Rn(s),f=c?a?br:br.filter(function(A){return Rn(A)===c}):Mn,p=f.filter(function(A){return u.indexOf(A)>=0});p.length===0&&(p=f);var m=p.reduce(function(A,y){return A[y]=xn(e,{placement:y,boundary:i,rootBoundary:r,padding:o})[_e(y)],A},{});return Object.keys(m).sort(function(A,y){return m[A]-m[y]})}function $m(e){if(_e(e)===_i)return[];var t=Fs(e);return[ga(e),t,ga(t)]}function Dm(e){var t=e.state,n=e.options,s=e.name;if(!t.modifiersData[s]._skip){for(var i=n.mainAxis,r=i===void 0?!0:i,o=n.altAxis,a=o===void 0?!0:o,l=n.fallbackPlacements,u=n.padding,c=n.boundary,f=n.rootBoundary,p=n.altBoundary,m=n.flipVariations,A=m===void 0?!0:m,y=n.allowedAutoPlacements,I=t.options.placement,N=_e(I),$=N===I,R=l||($||!A?[Fs(I)]:$m(I)),T=[I].concat(R).reduce(function(Vt,Ft){return Vt.concat(_e(Ft)===_i?Nm(t,{placement:Ft,boundary:c,rootBoundary:f,padding:u,flipVariations:A,allowedAutoPlacements:y}):Ft)},[]),C=t.rects.reference,V=t.rects.popper,M=new Map,H=!0,B=T[0],z=0;z<T.length;z++){var tt=T[z],ht=_e(tt),it=Rn(tt)===rn,Ot=[Dt,Kt].indexOf(ht)>=0,At=Ot?"width":"height",X=xn(t,{placement:tt,boundary:c,rootBoundary:f,altBoundary:p,padding:u}),U=Ot?it?Yt:It:it?Kt:Dt;C[At]>V[At]&&(U=Fs(U));var Z=Fs(U),bt=[];if(r&&bt.push(X[ht]<=0),a&&bt.push(X[U]<=0,X[Z]<=0),bt.every(function(Vt){return Vt})){B=tt,H=!1;break}M.set(tt,bt)}if(H)for(var kt=A?3:1,Rt=function(Ft){var Et=T.find(function(_){var k=M.get(_);if(k)return k.slice(0,Ft).every(function(x){return x})});if(Et)return B=Et,"break"},gt=kt;gt>0;gt--){var ne=Rt(gt);if(ne==="break")break}t.placement!==B&&(t.modifiersData[s]._skip=!0,t.placement=B,t.reset=!0)}}const Kc={name:"flip",enabled:!0,phase:"main",fn:Dm,requiresIfExists:["offset"],data:{_skip:!1}};function va(e,t,n){return n===void 0&&(n={x:0,y:0}),{top:e.top-t.height-n.y,right:e.right-t.width+n.x,bottom:e.bottom-t.height+n.y,left:e.left-t.width-n.x}}function Ea(e){return[Dt,Yt,Kt,It].some(function(t){return e[t]>=0})}function Im(e){var t=e.state,n=e.name,s=t.rects.reference,i=t.rects.popper,r=t.modifiersData.preventOverflow,o=xn(t,{elementContext:"reference"}),a=xn(t,{altBoundary:!0}),l=va(o,s),u=va(a,i,r),c=Ea(l),f=Ea(u);t.modifiersData[n]={referenceClippingOffsets:l,popperEscapeOffsets:u,isReferenceHidden:c,hasPopperEscaped:f},t.attributes.popper=Object.assign({},t.attributes.popper,{"data-popper-reference-hidden":c,"data-popper-escaped":f})}const Yc={name:"hide",enabled:!0,phase:"main",requiresIfExists:["preventOverflow"],fn:Im};function Rm(e,t,n){var s=_e(e),i=[It,Dt].indexOf(s)>=0?-1:1,r=typeof n=="function"?n(Object.assign({},t,{placement:e})):n,o=r[0],a=r[1];return o=o||0,a=(a||0)*i,[It,Yt].indexOf(s)>=0?{x:a,y:o}:{x:o,y:a}}function xm(e){var t=e.state,n=e.options,s=e.name,i=n.offset,r=i===void 0?[0,0]:i,o=Qr.reduce(function(c,f){return c[f]=Rm(f,t.rects,r),c},{}),a=o[t.placement],l=a.x,u=a.y;t.modifiersData.popperOffsets!=null&&(t.modifiersData.popperOffsets.x+=l,t.modifiersData.popperOffsets.y+=u),t.modifiersData[s]=o}const qc={name:"offset",enabled:!0,phase:"main",requires:["popperOffsets"],fn:xm};function Pm(e){var t=e.state,n=e.name;t.modifiersData[n]=Uc({reference:t.rects.reference,element:t.rects.popper,placement:t.placement})}const oo={name:"popperOffsets",enabled:!0,phase:"read",fn:Pm,data:{}};function Lm(e){return e==="x"?"y":"x"}function Mm(e){var t=e.state,n=e.options,s=e.name,i=n.mainAxis,r=i===void 0?!0:i,o=n.altAxis,a=o===void 0?!1:o,l=n.boundary,u=n.rootBoundary,c=n.altBoundary,f=n.padding,p=n.tether,m=p===void 0?!0:p,A=n.tetherOffset,y=A===void 0?0:A,I=xn(t,{boundary:l,rootBoundary:u,padding:f,altBoundary:c}),N=_e(t.placement),$=Rn(t.placement),R=!$,T=to(N),C=Lm(T),V=t.modifiersData.popperOffsets,M=t.rects.reference,H=t.rects.popper,B=typeof y=="function"?y(Object.assign({},t.rects,{placement:t.placement})):y,z=typeof B=="number"?{mainAxis:B,altAxis:B}:Object.assign({mainAxis:0,altAxis:0},B),tt=t.modifiersData.offset?t.modifiersData.offset[t.placement]:null,ht={x:0,y:0};if(V){if(r){var it,Ot=T==="y"?Dt:It,At=T==="y"?Kt:Yt,X=T==="y"?"height":"width",U=V[T],Z=U+I[Ot],bt=U-I[At],kt=m?-H[X]/2:0,Rt=$===rn?M[X]:H[X],gt=$===rn?-H[X]:-M[X],ne=t.elements.arrow,Vt=m&&ne?Zr(ne):{width:0,height:0},Ft=t.modifiersData["arrow#persistent"]?t.modifiersData["arrow#persistent"].padding:Fc(),Et=Ft[Ot],_=Ft[At],k=is(0,M[X],Vt[X]),x=R?M[X]/2-kt-k-Et-z.mainAxis:Rt-k-Et-z.mainAxis,j=R?-M[X]/2+kt+k+_+z.mainAxis:gt+k+_+z.mainAxis,st=t.elements.arrow&&Es(t.elements.arrow),d=st?T==="y"?st.clientTop||0:st.clientLeft||0:0,h=(it=tt?.[T])!=null?it:0,g=U+x-h-d,E=U+j-h,b=is(m?Js(Z,g):Z,U,m?sn(bt,E):bt);V[T]=b,ht[T]=b-U}if(a){var v,P=T==="x"?Dt:It,D=T==="x"?Kt:Yt,O=V[C],S=C==="y"?"height":"width",K=O+I[P],F=O-I[D],W=[Dt,It].indexOf(N)!==-1,q=(v=tt?.[C])!=null?v:0,J=W?K:O-M[S]-H[S]-q+z.altAxis,at=W?O+M[S]+H[S]-q-z.altAxis:F,et=m&&W?hm(J,O,at):is(m?J:K,O,m?at:F);V[C]=et,ht[C]=et-O}t.modifiersData[s]=ht}}const Gc={name:"preventOverflow",enabled:!0,phase:"main",fn:Mm,requiresIfExists:["offset"]};function km(e){return{scrollLeft:e.scrollLeft,scrollTop:e.scrollTop}}function Vm(e){return e===qt(e)||!Xt(e)?so(e):km(e)}function Fm(e){var t=e.getBoundingClientRect(),n=Dn(t.width)/e.offsetWidth||1,s=Dn(t.height)/e.offsetHeight||1;return n!==1||s!==1}function Hm(e,t,n){n===void 0&&(n=!1);var s=Xt(t),i=Xt(t)&&Fm(t),r=qe(t),o=In(e,i,n),a={scrollLeft:0,scrollTop:0},l={x:0,y:0};return(s||!s&&!n)&&((be(t)!=="body"||ro(r))&&(a=Vm(t)),Xt(t)?(l=In(t,!0),l.x+=t.clientLeft,l.y+=t.clientTop):r&&(l.x=io(r))),{x:o.left+a.scrollLeft-l.x,y:o.top+a.scrollTop-l.y,width:o.width,height:o.height}}function jm(e){var t=new Map,n=new Set,s=[];e.forEach(function(r){t.set(r.name,r)});function i(r){n.add(r.name);var o=[].concat(r.requires||[],r.requiresIfExists||[]);o.forEach(function(a){if(!n.has(a)){var l=t.get(a);l&&i(l)}}),s.push(r)}return e.forEach(function(r){n.has(r.name)||i(r)}),s}function Bm(e){var t=jm(e);return Mc.reduce(function(n,s){return n.concat(t.filter(function(i){return i.phase===s}))},[])}function Wm(e){var t;return function(){return t||(t=new Promise(function(n){Promise.resolve().then(function(){t=void 0,n(e())})})),t}}function Um(e){var t=e.reduce(function(n,s){var i=n[s.name];return n[s.name]=i?Object.assign({},i,s,{options:Object.assign({},i.options,s.options),data:Object.assign({},i.data,s.data)}):s,n},{});return Object.keys(t).map(function(n){return t[n]})}var ba={placement:"bottom",modifiers:[],strategy:"absolute"};function ya(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return!t.some(function(s){return!(s&&typeof s.getBoundingClientRect=="function")})}function Ei(e){e===void 0&&(e={});var t=e,n=t.defaultModifiers,s=n===void 0?[]:n,i=t.defaultOptions,r=i===void 0?ba:i;return function(a,l,u){u===void 0&&(u=r);var c={placement:"bottom",orderedModifiers:[],options:Object.assign({},ba,r),modifiersData:{},elements:{reference:a,popper:l},attributes:{},styles:{}},f=[],p=!1,m={state:c,setOptions:function(N){var $=typeof N=="function"?N(c.options):N;y(),c.options=Object.assign({},r,c.options,$),c.scrollParents={reference:on(a)?rs(a):a.contextElement?rs(a.contextElement):[],popper:rs(l)};var R=Bm(Um([].concat(s,c.options.modifiers)));return c.orderedModifiers=R.filter(function(T){return T.enabled}),A(),m.update()},forceUpdate:function(){if(!p){var N=c.elements,$=N.reference,R=N.popper;if(ya($,R)){c.rects={reference:Hm($,Es(R),c.options.strategy==="fixed"),popper:Zr(R)},c.reset=!1,c.placement=c.options.placement,c.orderedModifiers.forEach(function(z){return c.modifiersData[z.name]=Object.assign({},z.data)});for(var T=0;T<c.orderedModifiers.length;T++){if(c.reset===!0){c.reset=!1,T=-1;continue}var C=c.orderedModifiers[T],V=C.fn,M=C.options,H=M===void 0?{}:M,B=C.name;typeof V=="function"&&(c=V({state:c,options:H,name:B,instance:m})||c)}}}},update:Wm(function(){return new Promise(function(I){m.forceUpdate(),I(c)})}),destroy:function(){y(),p=!0}};if(!ya(a,l))return m;m.setOptions(u).then(function(I){!p&&u.onFirstUpdate&&u.onFirstUpdate(I)});function A(){c.orderedModifiers.forEach(function(I){var N=I.name,$=I.options,R=$===void 0?{}:$,T=I.effect;if(typeof T=="function"){var C=T({state:c,name:N,instance:m,options:R}),V=function(){};f.push(C||V)}})}function y(){f.forEach(function(I){return I()}),f=[]}return m}}var Km=Ei(),Ym=[no,oo,eo,Jr],qm=Ei({defaultModifiers:Ym}),Gm=[no,oo,eo,Jr,qc,Kc,Gc,Bc,Yc],ao=Ei({defaultModifiers:Gm});const zc=Object.freeze(Object.defineProperty({__proto__:null,afterMain:Rc,afterRead:$c,afterWrite:Lc,applyStyles:Jr,arrow:Bc,auto:_i,basePlacements:Mn,beforeMain:Dc,beforeRead:Oc,beforeWrite:xc,bottom:Kt,clippingParents:Sc,computeStyles:eo,createPopper:ao,createPopperBase:Km,createPopperLite:qm,detectOverflow:xn,end:$n,eventListeners:no,flip:Kc,hide:Yc,left:It,main:Ic,modifierPhases:Mc,offset:qc,placements:Qr,popper:vn,popperGenerator:Ei,popperOffsets:oo,preventOverflow:Gc,read:Nc,reference:Cc,right:Yt,start:rn,top:Dt,variationPlacements:br,viewport:zr,write:Pc},Symbol.toStringTag,{value:"Module"}));/*!
   * Bootstrap v5.3.8 (https://getbootstrap.com/)
   * Copyright 2011-2025 The Bootstrap Authors (https://github.com/twbs/bootstrap/graphs/contributors)
   * Licensed under MIT (https://github.com/twbs/bootstrap/blob/main/LICENSE)
@@ -0,0 +1,216 @@
+"""
+Token-bucket throttles for writes that are cheap to send and expensive to
+serve: bids, questions and sign-ups.
+
+Each bucket holds up to N tokens and refills at N per period, for a rate of
+``'N/period'`` in ``REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']``. Bursts of up
+to N requests go through, and a steady stream is held to the average rate.
+Bucket state lives in the ``THROTTLE_CACHE_ALIAS`` cache, so every worker
+sees the same buckets. If that cache fails, each process falls back to its
+own in-memory buckets.
+
+Per-IP buckets are checked before authentication, so a flood from one
+address is turned away without any database work. Per-user buckets are
+checked once the user is known, before the view runs.
+"""
+import logging
+import math
+import threading
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_rate(rate):
+    """
+    ``'30/min'`` -> ``(30, 60)``: capacity and seconds to refill it.
+    """
+    count, period = rate.split('/')
+    return int(count), PERIODS[period[0]]
+
+
+def get_cache():
+    return caches[getattr(settings, 'THROTTLE_CACHE_ALIAS', 'default')]
+
+
+class LocalBuckets:
+    """
+    In-process bucket storage, used while the shared cache is unavailable.
+    """
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            state = self._buckets.get(key)
+        if state is None or state[1] < time.time():
+            return None
+        return state[0]
+
+    def set(self, key, value, timeout):
+        with self._lock:
+            self._buckets[key] = (value, time.time() + timeout)
+            if len(self._buckets) > 10000:
+                now = time.time()
+                self._buckets = {k: v for k, v in self._buckets.items() if v[1] >= now}
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+local_buckets = LocalBuckets()
+
+
+def take(scope, ident, rate, now=None):
+    """
+    Take a token from the ``scope`` bucket of ``ident``. Returns 0 if the
+    request may go ahead, otherwise the seconds until a token is available.
+
+    Two workers updating the same bucket at the same moment can both take
+    the last token; the limit is approximate under concurrency.
+    """
+    capacity, period = parse_rate(rate)
+    refill = capacity / period
+    now = time.time() if now is None else now
+    key = f"throttle:{scope}:{ident}"
+
+    try:
+        storage = get_cache()
+        state = storage.get(key)
+    except Exception:
+        logger.warning("Throttle cache unavailable; using in-process buckets", exc_info=True)
+        storage = local_buckets
+        state = storage.get(key)
+
+    tokens, updated = state if state is not None else (capacity, now)
+    tokens = min(capacity, tokens + (now - updated) * refill)
+    if tokens < 1:
+        return (1 - tokens) / refill
+    try:
+        # A key that expires is a bucket that has refilled completely.
+        storage.set(key, (tokens - 1, now), period)
+    except Exception:
+        logger.warning("Throttle cache unavailable; using in-process buckets", exc_info=True)
+        local_buckets.set(key, (tokens - 1, now), period)
+    return 0
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Base class: subclasses set ``scope`` and implement ``get_cache_key``.
+    """
+    scope = None
+    before_authentication = False
+
+    def __init__(self):
+        self.delay = None
+
+    def get_rate(self):
+        return api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+
+    def get_cache_key(self, request, view):
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        rate = self.get_rate()
+        if rate is None:
+            return True
+        self.delay = take(self.scope, self.get_cache_key(request, view), rate)
+        return not self.delay
+
+    def wait(self):
+        return self.delay
+
+
+class UserTokenBucketThrottle(TokenBucketThrottle):
+    """
+    One bucket per signed-in user (per address for anonymous requests).
+    """
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            return f"user-{request.user.pk}"
+        return f"ip-{self.get_ident(request)}"
+
+
+class IPTokenBucketThrottle(TokenBucketThrottle):
+    """
+    One bucket per client address.
+    """
+    before_authentication = True
+
+    def get_cache_key(self, request, view):
+        return f"ip-{self.get_ident(request)}"
+
+
+class BidUserThrottle(UserTokenBucketThrottle):
+    scope = 'bid'
+
+
+class BidIPThrottle(IPTokenBucketThrottle):
+    scope = 'bid_ip'
+
+
+class QuestionUserThrottle(UserTokenBucketThrottle):
+    scope = 'question'
+
+
+class QuestionIPThrottle(IPTokenBucketThrottle):
+    scope = 'question_ip'
+
+
+class EarlyThrottleMixin:
+    """
+    View mixin checking ``before_authentication`` throttles ahead of
+    authentication and the rest after it, as DRF normally does.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        self.check_throttle_group(request, before_authentication=True)
+        super().initial(request, *args, **kwargs)
+
+    def check_throttles(self, request):
+        self.check_throttle_group(request, before_authentication=False)
+
+    def check_throttle_group(self, request, before_authentication):
+        waits = [
+            throttle.wait()
+            for throttle in self.get_throttles()
+            if getattr(throttle, 'before_authentication', False) == before_authentication
+            and not throttle.allow_request(request, self)
+        ]
+        if waits:
+            self.throttled(request, max((wait for wait in waits if wait is not None), default=None))
+
+
+def throttle_ip(scope):
+    """
+    Decorator for plain Django views: POSTs beyond the ``scope`` rate per
+    client address get a 429 response with ``Retry-After``.
+    """
+    def decorator(view):
+        @wraps(view)
+        def inner(request, *args, **kwargs):
+            rate = api_settings.DEFAULT_THROTTLE_RATES.get(scope)
+            if request.method == 'POST' and rate is not None:
+                delay = take(scope, f"ip-{BaseThrottle().get_ident(request)}", rate)
+                if delay:
+                    response = HttpResponse("Too many attempts. Please try again later.", status=429)
+                    response['Retry-After'] = str(math.ceil(delay))
+                    return response
+            return view(request, *args, **kwargs)
+        return inner
+    return decorator
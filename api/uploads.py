@@ -0,0 +1,160 @@
+"""
+Streaming image uploads.
+
+``HashingUploadHandler`` writes each uploaded file straight to a temporary
+file in chunks, hashing it on the way, and gives up on the request as soon as
+it can tell the upload is too big: from ``Content-Length`` before anything is
+read, from the running byte count, or from the image dimensions in the first
+few chunks. It accepts only images, so it is installed per view (see
+``image_upload_handlers``) rather than through ``FILE_UPLOAD_HANDLERS``.
+
+``stored_image`` names cleaned images after the hash of what was uploaded,
+so uploading the same photo again reuses the stored file instead of
+decoding and writing it a second time.
+"""
+import hashlib
+from functools import wraps
+from io import BytesIO
+
+from django.conf import settings
+from django.core.exceptions import BadRequest
+from django.core.files.uploadhandler import TemporaryFileUploadHandler, load_handler
+from django.http.multipartparser import MultiPartParserError
+from django.views.decorators.csrf import csrf_exempt, csrf_protect
+from PIL import Image
+
+from . import images
+
+
+# Image headers (and so dimensions) are expected within this many bytes.
+HEADER_BYTES = 256 * 1024
+
+# Allowance for the non-file parts of a multipart request body.
+FORM_OVERHEAD = 64 * 1024
+
+
+class UploadRejected(MultiPartParserError, BadRequest):
+    """
+    Raised while parsing a request whose upload breaks the limits. DRF turns
+    it into a 400 response, as does Django for plain views.
+    """
+
+
+def content_hash(upload):
+    """
+    SHA-256 of an uploaded file, as computed while it streamed in if possible.
+    """
+    digest = getattr(upload, 'sha256', None)
+    if digest is None:
+        hasher = hashlib.sha256()
+        for chunk in upload.chunks():
+            hasher.update(chunk)
+        upload.seek(0)
+        digest = hasher.hexdigest()
+    return digest
+
+
+class HashingUploadHandler(TemporaryFileUploadHandler):
+    """
+    Stream uploaded files to disk, hashing them and enforcing the image size
+    and pixel limits while the request body is still arriving.
+    """
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        if content_length > images.max_upload_size() + FORM_OVERHEAD:
+            raise UploadRejected("The upload is too large.")
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.hasher = hashlib.sha256()
+        self.header = bytearray()
+        self.header_checked = False
+
+    def receive_data_chunk(self, raw_data, start):
+        if start + len(raw_data) > images.max_upload_size():
+            self.reject("The upload is too large.")
+        self.hasher.update(raw_data)
+        if not self.header_checked:
+            self.check_header(raw_data)
+        self.file.write(raw_data)
+
+    def check_header(self, raw_data):
+        """
+        Read the image format and dimensions as soon as the header has arrived.
+        """
+        self.header += raw_data
+        try:
+            with Image.open(BytesIO(self.header)) as image:
+                image_format, width, height = image.format, image.width, image.height
+        except Image.DecompressionBombError:
+            self.reject("This image is too large.")
+        except Exception:
+            if len(self.header) >= HEADER_BYTES:
+                self.reject("Upload a valid image.")
+            return
+        self.header_checked = True
+        self.header = None
+        if image_format not in images.ALLOWED_FORMATS:
+            self.reject("Upload a JPEG, PNG or WebP image.")
+        if width * height > images.max_pixels():
+            self.reject("This image is too large.")
+
+    def file_complete(self, file_size):
+        if not self.header_checked:
+            self.reject("Upload a valid image.")
+        upload = super().file_complete(file_size)
+        upload.sha256 = self.hasher.hexdigest()
+        return upload
+
+    def reject(self, message):
+        self.upload_interrupted()
+        raise UploadRejected(message)
+
+
+def image_upload_handlers(request):
+    """
+    Upload handlers for a request that uploads images, from
+    ``IMAGE_UPLOAD_HANDLERS``.
+    """
+    return [
+        load_handler(path, request)
+        for path in getattr(settings, 'IMAGE_UPLOAD_HANDLERS', ['api.uploads.HashingUploadHandler'])
+    ]
+
+
+def image_uploads(view):
+    """
+    Decorator parsing the uploads of a function view with
+    ``image_upload_handlers``.
+
+    The CSRF middleware reads ``request.POST`` before the view runs, after
+    which the handlers can no longer change, so the view is exempted from
+    the middleware and its CSRF check runs here once the handlers are set.
+    """
+    protected = csrf_protect(view)
+
+    @csrf_exempt
+    @wraps(view)
+    def inner(request, *args, **kwargs):
+        request.upload_handlers = image_upload_handlers(request)
+        return protected(request, *args, **kwargs)
+    return inner
+
+
+def stored_image(upload, model, field_name):
+    """
+    Return what to assign to ``field_name`` of a ``model`` instance for
+    ``upload``: the name of the stored copy of an identical earlier upload,
+    or a new metadata-free file named after the upload's hash.
+
+    Raises ``ValidationError`` if the upload is not an acceptable image.
+    """
+    field = model._meta.get_field(field_name)
+    digest = content_hash(upload)
+    for extension in images.ALLOWED_FORMATS.values():
+        name = field.generate_filename(None, f"{digest}.{extension}")
+        if field.storage.exists(name):
+            return name
+    cleaned = images.clean_upload(upload)
+    cleaned.name = f"{digest}.{cleaned.name.rsplit('.', 1)[-1]}"
+    return cleaned
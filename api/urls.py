@@ -17,7 +17,7 @@ Including another URLconf
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import AuctionItemViewSet, ItemQuestionViewSet
-from api import views
+from api import async_views, views
 
 router = DefaultRouter()
 router.register(r'auction-items', AuctionItemViewSet, basename='auctionitem')
@@ -27,4 +27,9 @@ urlpatterns = [
     path('', include(router.urls)),
     path('current-user/', views.current_user, name='current-user'),
     path("profile/", views.profile_api, name="profile_api"),
+    path("cache-stats/", views.cache_stats, name="cache-stats"),
+    path("db-stats/", views.db_stats, name="db-stats"),
+    path("async/auction-items/", async_views.auction_item_list, name="async-auctionitem-list"),
+    path("async/auction-items/<int:pk>/", async_views.auction_item_detail, name="async-auctionitem-detail"),
+    path("async/item-questions/", async_views.item_question_list, name="async-itemquestion-list"),
 ]
@@ -1,26 +1,39 @@
+from datetime import timedelta
 from urllib import request
 from django.utils import timezone
-from django.http import HttpResponse, HttpRequest, JsonResponse
+from django.http import Http404, HttpResponse, HttpRequest, JsonResponse
 from django.shortcuts import render, redirect
 from rest_framework import permissions, viewsets
-from .models import AuctionItem
-from .serializers import AuctionItemSerializer
+from .models import AuctionItem, ItemBid
+from .serializers import AuctionItemSerializer, AuctionItemListSerializer, ItemBidSerializer
+from .pagination import AuctionItemCursorPagination, ItemBidCursorPagination, SearchPagination
+from .search import get_search_engine
 from rest_framework.parsers import MultiPartParser, FormParser
 from django.contrib.auth import login, get_user_model
 from django.contrib.auth.forms import UserCreationForm
 from django import forms
-from django.db.models import Q
 from .models import ItemQuestion
-from .serializers import ItemQuestionSerializer
+from .serializers import ItemQuestionSerializer, UnansweredQuestionSerializer
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
-from .models import ItemBid
-from .serializers import ItemBidSerializer
-#from decimal import Decimalfrom django.contrib.auth
-#from decimal import login, get_user_model
-from decimal import Decimal
-from django.contrib.auth.decorators import login_required
+from rest_framework import exceptions
+from django.db.models import F
+from django.utils.dateparse import parse_datetime
+from . import auctions
+from . import cache as api_cache
+from . import images, prefetch, streaming, uploads
+from .throttling import (
+    BidIPThrottle, BidUserThrottle, EarlyThrottleMixin, QuestionIPThrottle, QuestionUserThrottle, throttle_ip,
+)
+from django.core.exceptions import ValidationError
+from project import database
+from .conditional import (
+    auction_item_list_validators, auction_item_validators, conditional_get,
+    item_question_list_validators, item_question_thread_validators, item_question_validators, profile_validators,
+)
+from django.utils.decorators import method_decorator
+from django.contrib.auth.decorators import login_required, user_passes_test
 from django.shortcuts import render
 from django.views.decorators.http import require_http_methods
 
@@ -42,18 +55,15 @@ def current_user(request):
         "username": request.user.username
     })
 
+@uploads.image_uploads
 @login_required
 @require_http_methods(["GET", "POST"])
+@conditional_get(profile_validators)
 def profile_api(request):
     user = request.user
 
     if request.method == "GET":
-        return JsonResponse({
-            "username": user.username,
-            "email": user.email,
-            "date_of_birth": getattr(user, "date_of_birth", None),
-            "profile_image": user.profile_picture.url if getattr(user, "profile_picture", None) else None,
-        })
+        return JsonResponse(profile_payload(user))
 
     if request.method == "POST":
         email = request.POST.get("email")
@@ -67,18 +77,27 @@ def profile_api(request):
             user.date_of_birth = date_of_birth
 
         if profile_image:
-            user.profile_picture = profile_image
+            try:
+                user.profile_picture = uploads.stored_image(profile_image, User, "profile_picture")
+            except ValidationError as e:
+                return JsonResponse({"error": e.messages[0]}, status=400)
 
         user.save()
 
-        return JsonResponse({
-            "username": user.username,
-            "email": user.email,
-            "date_of_birth": getattr(user, "date_of_birth", None),
-            "profile_image": user.profile_picture.url if getattr(user, "profile_picture", None) else None,
-        })
+        return JsonResponse(profile_payload(user))
 
-class AuctionItemViewSet(viewsets.ModelViewSet):
+
+def profile_payload(user):
+    return {
+        "username": user.username,
+        "email": user.email,
+        "date_of_birth": getattr(user, "date_of_birth", None),
+        "profile_image": user.profile_picture.url if getattr(user, "profile_picture", None) else None,
+        "profile_image_variants": images.variant_urls(user, "profile_picture"),
+        "profile_image_placeholder": user.profile_picture_placeholder or None,
+    }
+
+class AuctionItemViewSet(EarlyThrottleMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing AuctionItem instances.
     Provides CRUD operations for auction items.
@@ -87,53 +106,208 @@ class AuctionItemViewSet(viewsets.ModelViewSet):
     serializer_class = AuctionItemSerializer
     permission_classes = [permissions.IsAuthenticated]
     parser_classes = [MultiPartParser, FormParser]
+    pagination_class = AuctionItemCursorPagination
+
+    # Columns needed by AuctionItemListSerializer; the long text fields are deferred.
+    list_only_fields = [
+        'id', 'owner_id', 'owner__username', 'title', 'starting_bid',
+        'current_bid', 'image', 'image_variants', 'image_placeholder', 'end_datetime',
+        'bid_count', 'last_bid_at', 'top_bidder_id', 'top_bidder__username',
+    ]
+
+    def initialize_request(self, request, *args, **kwargs):
+        # Before DRF wraps the request, while the body is still unread.
+        request.upload_handlers = uploads.image_upload_handlers(request)
+        return super().initialize_request(request, *args, **kwargs)
+
+    def get_serializer_class(self):
+        if self.action in ('list', 'export'):
+            return AuctionItemListSerializer
+        return AuctionItemSerializer
+
+    @property
+    def search_term(self):
+        return self.request.query_params.get('search', '').strip()
+
+    @property
+    def paginator(self):
+        """
+        Ranked search results are paged by number; everything else by cursor.
+        """
+        if not hasattr(self, '_paginator'):
+            if self.action == 'list' and self.search_term:
+                self._paginator = SearchPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
 
     def get_queryset(self):
         """
-        Optionally filters auction items by a 'search' query parameter
-        matching title or description.
+        Returns auction items, limited to the long-text-free columns for list
+        pages, with the related rows the serializer reads joined in.
+        """
+        queryset = prefetch.optimize(AuctionItem.objects.all(), self.get_serializer_class())
+        if self.action in ('list', 'export'):
+            queryset = queryset.only(*self.list_only_fields)
+        return queryset
+
+    def filter_queryset(self, queryset):
+        """
+        Optionally runs a ranked full-text search for the 'search' query
+        parameter over title and description.
         """
-        queryset = AuctionItem.objects.all()
-        search = self.request.query_params.get('search', None)
-        if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) | Q(description__icontains=search)
-            )
+        queryset = super().filter_queryset(queryset)
+        if self.action == 'list' and self.search_term:
+            return get_search_engine(queryset.db).search(queryset, self.search_term)
         return queryset
 
+    @method_decorator(conditional_get(auction_item_list_validators))
+    def list(self, request, *args, **kwargs):
+        """
+        List pages are served from the versioned cache, keyed by the full URL.
+        """
+        def build():
+            return super(AuctionItemViewSet, self).list(request, *args, **kwargs).data
+
+        key = api_cache.list_key(request.build_absolute_uri())
+        return Response(api_cache.get_or_build('list', key, build))
+
+    @method_decorator(conditional_get(auction_item_validators))
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Item payloads are served from the versioned cache.
+        """
+        def build():
+            return self.get_serializer(self.get_object()).data
+
+        key = api_cache.item_key(kwargs['pk'], request.build_absolute_uri('/'))
+        return Response(api_cache.get_or_build('item', key, build))
+
+    @action(detail=False, methods=['get'])
+    @method_decorator(conditional_get(auction_item_list_validators))
+    def export(self, request):
+        """
+        Every auction item as list entries, oldest first, streamed as one
+        JSON array.
+        """
+        return streaming.json_response(self.get_queryset().order_by('pk'), self.get_serializer())
+
     def perform_create(self, serializer):
         serializer.save(owner=self.request.user)  # Placeholder for actual user assignment logic
 
-    @action(detail=True, methods=['post'])
+    @action(detail=True, methods=['post'], throttle_classes=[BidIPThrottle, BidUserThrottle])
     def place_bid(self, request, pk=None):
         """
         Custom action to place a bid on an auction item.
         """
         try:
-            item = self.get_object()
-            bid_amount = request.data.get('bid_amount', None)
-            if bid_amount is None:
-                return Response({'error': 'Bid amount is required.'}, status=400)
-
-            bid_amount = float(bid_amount)
-            current = item.current_bid or item.starting_bid
-            if bid_amount <= current:
-                return Response({'error': 'Bid must be higher than current bid.'}, status=400)
-
-            item.current_bid = bid_amount
-            item.save()
-
-            ItemBid.objects.create(item=item, bidder=request.user, amount=Decimal(bid_amount))
-
-            serializer = self.get_serializer(item)
-            return Response(serializer.data)
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-            return Response({'error': str(e)}, status=500)
-    
+            amount = auctions.parse_bid_amount(request.data.get('bid_amount', None))
+            auctions.place_bid(pk, request.user, amount)
+        except auctions.BidRejected as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except (AuctionItem.DoesNotExist, ValueError):
+            raise Http404
+
+        serializer = self.get_serializer(self.get_object())
+        return Response(serializer.data)
+
+    @action(detail=True, methods=['get'])
+    @method_decorator(conditional_get(auction_item_validators))
+    def bids(self, request, pk=None):
+        """
+        The item's bid history, highest first, a keyset-paginated page at a time.
+        """
+        try:
+            queryset = prefetch.optimize(ItemBid.objects.filter(item_id=pk), ItemBidSerializer)
+            paginator = ItemBidCursorPagination()
+            page = paginator.paginate_queryset(queryset, request, view=self)
+        except ValueError:
+            raise Http404
+        if not page and not AuctionItem.objects.filter(pk=pk).exists():
+            raise Http404
+        return paginator.get_paginated_response(ItemBidSerializer(page, many=True).data)
+
+    @action(detail=True, methods=['get'])
+    @method_decorator(conditional_get(item_question_thread_validators))
+    def questions(self, request, pk=None):
+        """
+        The item's questions and answers, oldest first, streamed. Accepts the
+        filters of ``filter_questions``.
+        """
+        try:
+            if not AuctionItem.objects.filter(pk=pk).exists():
+                raise Http404
+        except ValueError:
+            raise Http404
+        queryset = filter_questions(ItemQuestion.objects.filter(item_id=pk), request.query_params)
+        queryset = prefetch.optimize(queryset, ItemQuestionSerializer).order_by('asked_at', 'pk')
+        return streaming.json_response(queryset, ItemQuestionSerializer(context=self.get_serializer_context()))
 
-class ItemQuestionViewSet(viewsets.ModelViewSet):
+
+def item_id_param(params):
+    """
+    The ``item_id`` query parameter as a number, or ``None`` if it is absent.
+    """
+    item_id = params.get('item_id')
+    if not item_id:
+        return None
+    try:
+        return int(item_id)
+    except ValueError:
+        raise exceptions.ValidationError({'item_id': 'Must be an integer.'})
+
+
+# ``updated_at`` is set when a row is saved, not when it commits, so a
+# question saved just before one a client has seen may commit after it.
+# ``since`` looks back this far to pick such rows up; clients merge by id.
+SINCE_OVERLAP = timedelta(seconds=10)
+
+
+def filter_questions(queryset, params):
+    """
+    ``queryset`` narrowed by the query parameters ``answered`` (``true`` or
+    ``false``) and ``since``, a timestamp: only questions asked or answered
+    after it (less ``SINCE_OVERLAP``), so a page already showing a thread
+    can fetch just the changes by passing the latest ``updated_at`` it has.
+    """
+    answered = params.get('answered')
+    if answered is not None:
+        if answered not in ('true', 'false'):
+            raise exceptions.ValidationError({'answered': 'Must be "true" or "false".'})
+        queryset = queryset.filter(answered_at__isnull=answered == 'false')
+    since = params.get('since')
+    if since is not None:
+        try:
+            moment = parse_datetime(since)
+        except ValueError:
+            moment = None
+        if moment is None:
+            raise exceptions.ValidationError({'since': 'Must be an ISO 8601 timestamp.'})
+        if timezone.is_naive(moment):
+            moment = timezone.make_aware(moment)
+        queryset = queryset.filter(updated_at__gt=moment - SINCE_OVERLAP)
+    return queryset
+
+
+@login_required
+@user_passes_test(lambda user: user.is_staff)
+def cache_stats(request):
+    """
+    Hit/miss counters of the API cache in this process, for monitoring.
+    """
+    return JsonResponse(api_cache.stats())
+
+
+@login_required
+@user_passes_test(lambda user: user.is_staff)
+def db_stats(request):
+    """
+    Database connection and pool counters in this process, for monitoring.
+    """
+    return JsonResponse(database.stats())
+
+
+class ItemQuestionViewSet(EarlyThrottleMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing ItemQuestion instances.
     Provides CRUD operations for item questions.
@@ -143,18 +317,44 @@ class ItemQuestionViewSet(viewsets.ModelViewSet):
     serializer_class = ItemQuestionSerializer
     permission_classes = [permissions.IsAuthenticated]
 
+    def get_throttles(self):
+        if self.action == 'create':
+            return [QuestionIPThrottle(), QuestionUserThrottle()]
+        return super().get_throttles()
+
+    def get_serializer_class(self):
+        if self.action == 'unanswered':
+            return UnansweredQuestionSerializer
+        return ItemQuestionSerializer
+
     def perform_create(self, serializer):
         serializer.save(asked_by=self.request.user)
 
     def get_queryset(self):
         """
-        Returns only questions related to a specific auction item
+        Returns only questions related to a specific auction item, oldest
+        first, with the item's owner alongside for the answer action.
         """
 
-        item_id = self.request.query_params.get('item_id', None)
-        if item_id:
-            return ItemQuestion.objects.filter(item_id=item_id)
-        return ItemQuestion.objects.all()
+        queryset = prefetch.optimize(ItemQuestion.objects.all(), self.get_serializer_class())
+        if self.action == 'answer':
+            queryset = queryset.annotate(item_owner_id=F('item__owner_id'))
+        item_id = item_id_param(self.request.query_params)
+        if item_id is not None:
+            queryset = queryset.filter(item_id=item_id)
+        return queryset.order_by('asked_at', 'pk')
+
+    @method_decorator(conditional_get(item_question_list_validators))
+    def list(self, request, *args, **kwargs):
+        """
+        Questions are streamed, so an item with many of them is never held
+        in memory at once.
+        """
+        return streaming.json_response(self.filter_queryset(self.get_queryset()), self.get_serializer())
+
+    @method_decorator(conditional_get(item_question_validators))
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
     
     @action(detail=True, methods=['patch', 'post'])
     def answer(self, request, pk=None):
@@ -164,7 +364,7 @@ class ItemQuestionViewSet(viewsets.ModelViewSet):
         question = self.get_object()
         user = request.user
 
-        if question.item.owner != user:
+        if question.item_owner_id != user.pk:
             return Response({'error': 'Only the item owner can answer questions.'}, status=status.HTTP_403_FORBIDDEN)
         answer_text = request.data.get('answer_text', '').strip()
 
@@ -173,10 +373,20 @@ class ItemQuestionViewSet(viewsets.ModelViewSet):
         
         question.answer_text = answer_text
         question.answered_at = timezone.now()
-        question.save()
+        question.save(update_fields=['answer_text', 'answered_at', 'updated_at'])
 
         serializer = self.get_serializer(question)
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get'])
+    def unanswered(self, request):
+        """
+        Questions still waiting for an answer on any of the user's items,
+        oldest first, streamed. One query, through the partial index on
+        unanswered questions.
+        """
+        queryset = self.get_queryset().filter(item__owner=request.user, answered_at__isnull=True)
+        return streaming.json_response(queryset, self.get_serializer())
     
 class SignUpForm(UserCreationForm):
     """
@@ -204,6 +414,7 @@ class SignUpForm(UserCreationForm):
 
 
 
+@throttle_ip('signup')
 def signup(request):
     if request.user.is_authenticated:
         return redirect("/")
@@ -0,0 +1,7 @@
+"""
+Benchmarks for the auction API.
+
+Each module is runnable with ``python -m benchmarks.<name>`` from the project
+root. Benchmarks build a throwaway test database, seed it, and print their
+results as JSON so runs can be compared across commits.
+"""
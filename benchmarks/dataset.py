@@ -0,0 +1,143 @@
+"""
+Synthetic auction data at a chosen scale, inserted with ``bulk_create``.
+
+The same ``--seed`` always produces the same rows, so results from
+different commits are comparable. Bids on each item rise from its starting
+price, and the items' denormalized bid counters match the bids.
+
+    python -m benchmarks.dataset --users 1000 --items 10000
+"""
+import argparse
+import random
+import time
+from dataclasses import dataclass
+
+from .harness import benchmark_database, report, setup_django
+
+
+WORDS = (
+    "antique brass oak walnut lamp chair table clock vintage mirror silver "
+    "painting camera guitar violin bicycle watch ceramic vase rug leather "
+    "signed rare boxed mint used restored original edition print frame"
+).split()
+
+BATCH_SIZE = 2000
+
+
+@dataclass
+class Scale:
+    users: int = 200
+    items: int = 2000
+    bids_per_item: int = 5
+    questions_per_item: int = 2
+
+
+def add_arguments(parser):
+    defaults = Scale()
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument("--items", type=int, default=defaults.items)
+    parser.add_argument("--bids-per-item", type=int, default=defaults.bids_per_item)
+    parser.add_argument("--questions-per-item", type=int, default=defaults.questions_per_item)
+    parser.add_argument("--seed", type=int, default=1)
+
+
+def scale_from(args):
+    return Scale(args.users, args.items, args.bids_per_item, args.questions_per_item)
+
+
+def _insert(model, rows):
+    for start in range(0, len(rows), BATCH_SIZE):
+        model.objects.bulk_create(rows[start:start + BATCH_SIZE])
+
+
+def generate(scale, seed):
+    """
+    Insert ``scale`` worth of users, open auctions, bids and questions and
+    return the row counts and how long it took.
+    """
+    from datetime import timedelta
+    from decimal import Decimal
+
+    from django.contrib.auth.hashers import make_password
+    from django.utils import timezone
+
+    from api.models import AuctionItem, ItemBid, ItemQuestion, User
+    from api.search import get_search_engine
+
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    now = timezone.now()
+
+    # Benchmark clients log in with force_login, so no password is hashed.
+    password = make_password(None)
+    _insert(User, [
+        User(username=f"bench-user-{i}", email=f"bench-user-{i}@example.com", password=password)
+        for i in range(scale.users)
+    ])
+    users = list(User.objects.filter(username__startswith="bench-user-").order_by("pk"))
+
+    def words(k):
+        return " ".join(rng.choice(WORDS) for _ in range(k))
+
+    items = []
+    bids_by_item = []
+    for i in range(scale.items):
+        starting = Decimal(rng.randint(100, 10000)) / 100
+        amount, bids = starting, []
+        for _ in range(rng.randint(0, scale.bids_per_item * 2)):
+            amount += Decimal(rng.randint(1, 500)) / 100
+            bids.append((rng.choice(users), amount))
+        items.append(AuctionItem(
+            owner=rng.choice(users),
+            title=words(3).title(),
+            description=words(60),
+            starting_bid=starting,
+            current_bid=bids[-1][1] if bids else None,
+            end_datetime=now + timedelta(days=7, minutes=i),
+            bid_count=len(bids),
+            last_bid_at=now if bids else None,
+            top_bidder=bids[-1][0] if bids else None,
+        ))
+        bids_by_item.append(bids)
+    _insert(AuctionItem, items)
+    items = list(AuctionItem.objects.order_by("pk"))
+
+    _insert(ItemBid, [
+        ItemBid(item=item, bidder=bidder, amount=amount)
+        for item, bids in zip(items, bids_by_item)
+        for bidder, amount in bids
+    ])
+    _insert(ItemQuestion, [
+        ItemQuestion(
+            item=item,
+            asked_by=rng.choice(users),
+            question_text=f"Is the {words(1)} {words(1)} included?",
+            answer_text="Yes." if rng.random() < 0.5 else None,
+        )
+        for item in items
+        for _ in range(rng.randint(0, scale.questions_per_item * 2))
+    ])
+    # bulk_create skips the signals that keep the search index up to date.
+    get_search_engine().rebuild()
+
+    return {
+        "users": User.objects.count(),
+        "items": AuctionItem.objects.count(),
+        "bids": ItemBid.objects.count(),
+        "questions": ItemQuestion.objects.count(),
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        report(generate(scale_from(args), args.seed))
+
+
+if __name__ == "__main__":
+    main()
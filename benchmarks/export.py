@@ -0,0 +1,89 @@
+"""
+Peak memory and time of a large JSON list response: rendered in one piece,
+as DRF renders an unpaginated list, against streamed by ``api.streaming``.
+
+Seeds ``--items`` auctions and then produces every item's list entry three
+ways:
+
+* ``rendered``: ``AuctionItemListSerializer(many=True)`` and DRF's
+  ``JSONRenderer``, the whole queryset at once
+* ``streamed``: ``GET /api/auction-items/export/``, read to the end
+* ``streamed_stdlib``: the same, encoded without orjson
+
+Peak memory is the most Python had allocated at once while producing the
+body (``tracemalloc``), so the seeded data and the interpreter are not
+counted.
+
+    python -m benchmarks.export --items 100000
+"""
+import argparse
+import time
+import tracemalloc
+from unittest import mock
+
+from . import dataset
+from .harness import benchmark_database, report, setup_django
+
+
+def measure(produce):
+    """
+    ``produce()`` returns an iterable of bytes. It is run twice: once timed,
+    and once under ``tracemalloc``, which slows it down, for peak memory.
+    """
+    started = time.perf_counter()
+    size = sum(len(chunk) for chunk in produce())
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    sum(len(chunk) for chunk in produce())
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {'bytes': size, 'seconds': round(elapsed, 3), 'peak_mb': round(peak / (1 << 20), 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.test import Client, RequestFactory
+    from rest_framework.renderers import JSONRenderer
+
+    from api import streaming
+    from api.models import User
+    from api.serializers import AuctionItemListSerializer
+    from api.views import AuctionItemViewSet
+
+    with benchmark_database():
+        scale = dataset.Scale(users=100, items=args.items, bids_per_item=0, questions_per_item=0)
+        data = dataset.generate(scale, args.seed)
+        user = User.objects.order_by('pk').first()
+        client = Client()
+        client.force_login(user)
+        request = RequestFactory().get('/api/auction-items/export/')
+
+        def rendered():
+            queryset = AuctionItemViewSet(action='export').get_queryset().order_by('pk')
+            payload = AuctionItemListSerializer(queryset, many=True, context={'request': request}).data
+            return [JSONRenderer().render(payload)]
+
+        def streamed():
+            response = client.get('/api/auction-items/export/')
+            return response.streaming_content
+
+        results = {'rendered': measure(rendered), 'streamed': measure(streamed)}
+        with mock.patch.object(streaming, 'orjson', None):
+            results['streamed_stdlib'] = measure(streamed)
+
+        report({
+            'dataset': data,
+            'orjson': streaming.orjson is not None,
+            'chunk_size': streaming.CHUNK_SIZE,
+            'results': results,
+        })
+
+
+if __name__ == "__main__":
+    main()
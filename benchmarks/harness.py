@@ -0,0 +1,70 @@
+import json
+import os
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+
+
+def setup_django():
+    """
+    Configure Django for a standalone benchmark run.
+    """
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project.settings')
+
+    import django
+    django.setup()
+
+
+@contextmanager
+def benchmark_database():
+    """
+    Create a fresh, migrated test database and destroy it afterwards.
+    """
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def timed(func, repeat):
+    """
+    Call ``func`` ``repeat`` times and return the wall-clock latencies in ms.
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def summarize(samples):
+    """
+    Reduce latency samples (in ms) to the percentiles reported by benchmarks.
+    """
+    ordered = sorted(samples)
+    if len(ordered) == 1:
+        ordered = ordered * 2
+    cuts = statistics.quantiles(ordered, n=100, method='inclusive')
+    return {
+        'count': len(samples),
+        'mean_ms': round(statistics.fmean(samples), 3),
+        'p50_ms': round(cuts[49], 3),
+        'p95_ms': round(cuts[94], 3),
+        'p99_ms': round(cuts[98], 3),
+        'max_ms': round(ordered[-1], 3),
+    }
+
+
+def report(results):
+    json.dump(results, sys.stdout, indent=2, default=str)
+    sys.stdout.write('\n')
@@ -0,0 +1,286 @@
+"""
+Throughput and latency of the API under a mixed, concurrent workload.
+
+Seeds a throwaway database (see ``benchmarks.dataset``), then has
+``--concurrency`` clients, each logged in as a different user, send
+``--requests`` requests in total through the real URL routing and
+middleware. The clients run in-process, either as threads sharing a
+``django.test.Client`` per thread (``--interface wsgi``) or as asyncio
+tasks on ``django.test.AsyncClient`` (``--interface asgi``). Requests are
+drawn from a fixed mix:
+
+* ``list``: ``GET /api/auction-items/``, following the cursor a few pages
+* ``search``: ``GET /api/auction-items/?search=...``
+* ``detail``: ``GET /api/auction-items/<id>/``
+* ``bid``: ``POST /api/auction-items/<id>/place_bid/``
+* ``questions``: ``GET /api/item-questions/?item_id=<id>``
+* ``ask``: ``POST /api/item-questions/``
+* ``profile``: ``GET /api/profile/``
+
+The JSON report has overall and per-operation latency percentiles, req/s,
+response statuses, and mean query counts per view (from
+``project.metrics``). Rate limits are off unless ``--throttle`` is given.
+``--sessions`` and ``--user-cache-timeout`` override the session store and
+the user cache (see ``project.auth``), to compare authentication costs.
+``--api-cache-timeout`` sets ``API_CACHE_TIMEOUT``, which is 0 (off) with
+the default per-process cache.
+``--views async`` sends the list, search, detail and questions requests to
+the async views under ``/api/async/`` (see ``api.async_views``) instead.
+
+    python -m benchmarks.load --items 5000 --requests 2000 --concurrency 8
+    python -m benchmarks.load --interface asgi --views async --concurrency 64
+"""
+import argparse
+import asyncio
+import random
+import subprocess
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from . import dataset
+from .harness import benchmark_database, report, setup_django, summarize
+
+
+MIX = {
+    'list': 25,
+    'search': 10,
+    'detail': 25,
+    'bid': 15,
+    'questions': 10,
+    'ask': 5,
+    'profile': 10,
+}
+
+
+class Workload:
+    """
+    Builds requests for one client. Prices are shared between clients so
+    most bids are high enough to be accepted.
+    """
+
+    def __init__(self, item_ids, prices, prices_lock, seed, read_prefix='/api/'):
+        self.rng = random.Random(seed)
+        self.read_prefix = read_prefix
+        self.item_ids = item_ids
+        self.prices = prices
+        self.prices_lock = prices_lock
+        self.operations = list(MIX)
+        self.weights = list(MIX.values())
+        self.next_page = None
+
+    def next(self):
+        """
+        ``(operation, method, path, data)`` for the next request.
+        """
+        operation = self.rng.choices(self.operations, self.weights)[0]
+        item_id = self.rng.choice(self.item_ids)
+        prefix = self.read_prefix
+        if operation == 'list':
+            path = self.next_page if self.next_page and self.rng.random() < 0.7 else f"{prefix}auction-items/"
+            return operation, 'get', path, None
+        if operation == 'search':
+            return operation, 'get', f"{prefix}auction-items/?search={self.rng.choice(dataset.WORDS)}", None
+        if operation == 'detail':
+            return operation, 'get', f"{prefix}auction-items/{item_id}/", None
+        if operation == 'bid':
+            with self.prices_lock:
+                amount = self.prices[item_id] + Decimal(self.rng.randint(1, 500)) / 100
+                self.prices[item_id] = amount
+            return operation, 'post', f"/api/auction-items/{item_id}/place_bid/", {'bid_amount': str(amount)}
+        if operation == 'questions':
+            return operation, 'get', f"{prefix}item-questions/?item_id={item_id}", None
+        if operation == 'ask':
+            return operation, 'post', '/api/item-questions/', {'item': item_id, 'question_text': 'Still available?'}
+        return operation, 'get', '/api/profile/', None
+
+    def saw(self, operation, response):
+        if operation == 'list' and response.status_code == 200:
+            self.next_page = response.json().get('next')
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self.lock = threading.Lock()
+
+    def record(self, operation, status, milliseconds):
+        with self.lock:
+            self.latencies[operation].append(milliseconds)
+            self.statuses[operation][status] += 1
+
+
+def run_wsgi(users, workloads, per_client, recorder):
+    from django.db import connections
+    from django.test import Client
+
+    def client_loop(user, workload):
+        client = Client()
+        client.force_login(user)
+        try:
+            for _ in range(per_client):
+                operation, method, path, data = workload.next()
+                started = time.perf_counter()
+                response = getattr(client, method)(path, data) if data else getattr(client, method)(path)
+                if response.streaming:
+                    b''.join(response.streaming_content)
+                recorder.record(operation, response.status_code, (time.perf_counter() - started) * 1000)
+                workload.saw(operation, response)
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(len(users)) as pool:
+        for future in [pool.submit(client_loop, user, workload) for user, workload in zip(users, workloads)]:
+            future.result()
+
+
+def run_asgi(users, workloads, per_client, recorder):
+    from django.test import AsyncClient
+
+    async def client_loop(user, workload):
+        client = AsyncClient()
+        await client.aforce_login(user)
+        for _ in range(per_client):
+            operation, method, path, data = workload.next()
+            started = time.perf_counter()
+            response = await (getattr(client, method)(path, data) if data else getattr(client, method)(path))
+            if response.streaming:
+                [chunk async for chunk in response.streaming_content]
+            recorder.record(operation, response.status_code, (time.perf_counter() - started) * 1000)
+            workload.saw(operation, response)
+
+    async def main():
+        await asyncio.gather(*(client_loop(user, workload) for user, workload in zip(users, workloads)))
+
+    asyncio.run(main())
+
+
+def query_counts():
+    """
+    Mean queries and database time per request, by view and method.
+    """
+    from project import metrics
+
+    db_time = metrics.request_db_time.snapshot()
+    result = {}
+    for (view, method), (count, total) in sorted(metrics.request_queries.snapshot().items()):
+        result[f"{method} {view}"] = {
+            'requests': count,
+            'queries_mean': round(total / count, 2),
+            'db_ms_mean': round(db_time[(view, method)][1] / count * 1000, 3),
+        }
+    return result
+
+
+def commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    dataset.add_arguments(parser)
+    parser.add_argument("--requests", type=int, default=2000, help="Requests in total, after warm-up.")
+    parser.add_argument("--warmup", type=int, default=20, help="Unrecorded requests per client first.")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--interface", choices=("wsgi", "asgi"), default="wsgi")
+    parser.add_argument(
+        "--views", choices=("sync", "async"), default="sync",
+        help="Serve reads from the DRF views or the async views under /api/async/.",
+    )
+    parser.add_argument("--throttle", action="store_true", help="Keep the configured rate limits.")
+    parser.add_argument(
+        "--sessions", choices=("db", "cached_db", "cache", "signed_cookies"),
+        help="Session store; by default the configured SESSION_BACKEND.",
+    )
+    parser.add_argument(
+        "--user-cache-timeout", type=int,
+        help="Seconds users stay in the per-process cache; 0 turns it off.",
+    )
+    parser.add_argument(
+        "--api-cache-timeout", type=int,
+        help="Seconds API payloads stay cached; by default the configured API_CACHE_TIMEOUT.",
+    )
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from django.test import override_settings
+
+    from api.models import AuctionItem, User
+    from project import cache, metrics
+
+    overrides = {}
+    if not args.throttle:
+        overrides['REST_FRAMEWORK'] = {'DEFAULT_THROTTLE_RATES': {}, 'NUM_PROXIES': 0}
+    if args.sessions:
+        overrides['SESSION_ENGINE'] = cache.session_engines[args.sessions]
+    if args.user_cache_timeout is not None:
+        overrides['USER_CACHE_TIMEOUT'] = args.user_cache_timeout
+    if args.api_cache_timeout is not None:
+        overrides['API_CACHE_TIMEOUT'] = args.api_cache_timeout
+    with benchmark_database(), override_settings(**overrides):
+        data = dataset.generate(dataset.scale_from(args), args.seed)
+        users = list(User.objects.order_by('pk')[:args.concurrency])
+        prices = {
+            pk: current or starting
+            for pk, current, starting in AuctionItem.objects.values_list('pk', 'current_bid', 'starting_bid')
+        }
+        prices_lock = threading.Lock()
+        read_prefix = '/api/async/' if args.views == 'async' else '/api/'
+        workloads = [
+            Workload(sorted(prices), prices, prices_lock, seed=args.seed * 1000 + i, read_prefix=read_prefix)
+            for i in range(len(users))
+        ]
+        run = run_asgi if args.interface == 'asgi' else run_wsgi
+
+        run(users, workloads, args.warmup, Recorder())
+        metrics.reset()
+
+        recorder = Recorder()
+        started = time.perf_counter()
+        run(users, workloads, args.requests // len(users), recorder)
+        elapsed = time.perf_counter() - started
+
+        all_latencies = [ms for samples in recorder.latencies.values() for ms in samples]
+        report({
+            'commit': commit(),
+            'config': {
+                'interface': args.interface,
+                'views': args.views,
+                'concurrency': len(users),
+                'requests': len(all_latencies),
+                'throttle': args.throttle,
+                'session_engine': settings.SESSION_ENGINE,
+                'user_cache_timeout': settings.USER_CACHE_TIMEOUT,
+                'api_cache_timeout': settings.API_CACHE_TIMEOUT,
+                'seed': args.seed,
+            },
+            'dataset': data,
+            'total': {
+                'seconds': round(elapsed, 3),
+                'req_per_s': round(len(all_latencies) / elapsed, 1),
+                'latency': summarize(all_latencies),
+            },
+            'operations': {
+                operation: {
+                    'req_per_s': round(len(samples) / elapsed, 1),
+                    'statuses': dict(sorted(recorder.statuses[operation].items())),
+                    'latency': summarize(samples),
+                }
+                for operation, samples in sorted(recorder.latencies.items())
+            },
+            'queries': query_counts(),
+        })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Search latency: the indexed search engine against the old ``icontains`` scan.
+
+    python -m benchmarks.search --items 100000
+"""
+import argparse
+import random
+
+from .harness import benchmark_database, report, setup_django, summarize, timed
+
+
+WORDS = (
+    "antique brass oak walnut lamp chair table clock vintage mirror silver "
+    "painting camera guitar violin bicycle watch ceramic vase rug leather "
+    "signed rare boxed mint used restored original edition print frame"
+).split()
+
+
+def seed(items, seed_value):
+    from datetime import timedelta
+
+    from django.utils import timezone
+
+    from api.models import AuctionItem, User
+    from api.search import get_search_engine
+
+    rng = random.Random(seed_value)
+    filler = [f"lot{n}" for n in range(20_000)]
+
+    def words(k):
+        # Real words are rare enough that each search term is selective.
+        return " ".join(rng.choice(WORDS) if rng.random() < 0.02 else rng.choice(filler) for _ in range(k))
+
+    owner = User.objects.create_user("bench-owner")
+    end = timezone.now() + timedelta(days=7)
+    batch = []
+    for i in range(items):
+        batch.append(AuctionItem(
+            owner=owner,
+            title=words(3),
+            description=words(60),
+            starting_bid="1.00",
+            end_datetime=end,
+        ))
+        if len(batch) == 5000:
+            AuctionItem.objects.bulk_create(batch)
+            batch = []
+    AuctionItem.objects.bulk_create(batch)
+    get_search_engine().rebuild()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--terms", nargs="+", default=["walnut", "rare violin", "signed print fr"])
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.db.models import Q
+
+    from api.models import AuctionItem
+    from api.search import get_search_engine
+
+    with benchmark_database():
+        seed(args.items, args.seed)
+        engine = get_search_engine()
+        page = slice(0, 20)
+        results = {"items": args.items, "engine": type(engine).__name__, "terms": {}}
+        for term in args.terms:
+            queryset = AuctionItem.objects.all()
+
+            def indexed():
+                hits = engine.search(queryset, term)
+                len(hits), list(hits[page])
+
+            def scan():
+                hits = queryset.filter(Q(title__icontains=term) | Q(description__icontains=term))
+                hits.count(), list(hits[page])
+
+            results["terms"][term] = {
+                "indexed": summarize(timed(indexed, args.repeat)),
+                "icontains": summarize(timed(scan, args.repeat)),
+            }
+        report(results)
+
+
+if __name__ == "__main__":
+    main()
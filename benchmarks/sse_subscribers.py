@@ -0,0 +1,146 @@
+"""
+Idle SSE subscribers held by a single ASGI worker.
+
+Opens ``--subscribers`` concurrent event streams for one auction item
+against ``project.asgi.application`` in-process, then publishes a bid and
+measures how long it takes to reach every subscriber.
+
+    python -m benchmarks.sse_subscribers --subscribers 5000
+"""
+import argparse
+import asyncio
+import os
+import resource
+import time
+
+from .harness import benchmark_database, report, setup_django, summarize
+
+
+def rss_mb():
+    """
+    Current resident set size in MB (peak RSS where /proc is unavailable).
+    """
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class Subscriber:
+    """
+    Minimal ASGI client for one event stream.
+    """
+
+    def __init__(self, scope):
+        self.scope = scope
+        self.request_sent = False
+        self.disconnected = asyncio.Event()
+        self.status = None
+        self.connected = asyncio.get_running_loop().create_future()
+        self.received_bid = asyncio.get_running_loop().create_future()
+
+    async def receive(self):
+        if not self.request_sent:
+            self.request_sent = True
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        await self.disconnected.wait()
+        return {'type': 'http.disconnect'}
+
+    async def send(self, message):
+        if message['type'] == 'http.response.start':
+            self.status = message['status']
+            if self.status != 200 and not self.connected.done():
+                self.connected.set_exception(RuntimeError(f"status {self.status}"))
+        elif message['type'] == 'http.response.body' and message.get('body'):
+            now = time.perf_counter()
+            if not self.connected.done():
+                self.connected.set_result(now)
+            elif b'"bench"' in message['body'] and not self.received_bid.done():
+                self.received_bid.set_result(now)
+
+
+async def run(subscribers, item_id, cookie):
+    from project.asgi import application
+
+    from api.realtime import get_broker, item_channel
+
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': f'/api/auction-items/{item_id}/events/',
+        'raw_path': f'/api/auction-items/{item_id}/events/'.encode(),
+        'query_string': b'',
+        'root_path': '',
+        'headers': [(b'host', b'testserver'), (b'cookie', cookie.encode())],
+        'client': ('127.0.0.1', 50000),
+        'server': ('testserver', 80),
+    }
+
+    rss_before = rss_mb()
+    clients = [Subscriber(scope) for _ in range(subscribers)]
+    started = time.perf_counter()
+    tasks = [asyncio.create_task(application(c.scope, c.receive, c.send)) for c in clients]
+    await asyncio.gather(*(c.connected for c in clients))
+    connect_seconds = time.perf_counter() - started
+
+    # Let the streams settle into their idle wait before measuring memory.
+    await asyncio.sleep(1)
+    rss_idle = rss_mb()
+
+    published = time.perf_counter()
+    get_broker().publish(item_channel(item_id), {'id': item_id, 'current_bid': '99.00', 'bidder': 'bench'})
+    arrivals = await asyncio.gather(*(c.received_bid for c in clients))
+
+    for c in clients:
+        c.disconnected.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    return {
+        'subscribers': subscribers,
+        'connect_seconds': round(connect_seconds, 3),
+        'rss_mb_before': round(rss_before, 1),
+        'rss_mb_idle': round(rss_idle, 1),
+        'rss_kb_per_subscriber': round((rss_idle - rss_before) * 1024 / subscribers, 2),
+        'fanout': summarize([(arrival - published) * 1000 for arrival in arrivals]),
+        'subscribers_left': get_broker().subscriber_count(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--subscribers", type=int, default=5000)
+    args = parser.parse_args()
+
+    os.environ.setdefault('REALTIME_BROKER', 'api.realtime.InProcessBroker')
+    setup_django()
+
+    from datetime import timedelta
+
+    from django.conf import settings
+    from django.test import Client
+    from django.utils import timezone
+
+    from api.models import AuctionItem, User
+
+    with benchmark_database():
+        user = User.objects.create_user("bench-subscriber")
+        item = AuctionItem.objects.create(
+            owner=user, title="Bench item", description="", starting_bid="1.00",
+            end_datetime=timezone.now() + timedelta(days=1),
+        )
+        client = Client()
+        client.force_login(user)
+        cookie = f"{settings.SESSION_COOKIE_NAME}={client.cookies[settings.SESSION_COOKIE_NAME].value}"
+
+        report(asyncio.run(run(args.subscribers, item.pk, cookie)))
+
+
+if __name__ == "__main__":
+    main()
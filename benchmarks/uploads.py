@@ -0,0 +1,232 @@
+"""
+Peak memory and latency of image uploads: Django's default upload handlers
+(small files buffered in memory, no checks until the view runs) against
+``api.uploads.HashingUploadHandler``.
+
+Each mode and scenario runs in its own process, since peak RSS only grows:
+
+* ``photos``: distinct camera-sized JPEGs
+* ``duplicates``: the same JPEG uploaded repeatedly
+* ``oversized``: a body well over ``IMAGE_MAX_UPLOAD_SIZE``
+
+Request bodies are prepared on disk and fed to the WSGI handler as a file,
+so the client side adds nothing to the measured memory.
+
+    python -m benchmarks.uploads --uploads 5
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+
+from .harness import benchmark_database, report, setup_django, summarize
+
+
+MODES = {
+    'buffered': [
+        'django.core.files.uploadhandler.MemoryFileUploadHandler',
+        'django.core.files.uploadhandler.TemporaryFileUploadHandler',
+    ],
+    'streaming': ['api.uploads.HashingUploadHandler'],
+}
+
+SCENARIOS = ('photos', 'duplicates', 'oversized')
+
+
+def peak_rss_mb():
+    """
+    Peak resident set size in MB (since ``reset_peak_rss`` where supported).
+    """
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def reset_peak_rss():
+    """
+    Restart peak tracking from the current RSS (Linux only; a no-op elsewhere).
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as clear_refs:
+            clear_refs.write('5')
+    except OSError:
+        pass
+
+
+def write_photo(path, size, seed):
+    """
+    A noisy JPEG, so it compresses about as badly as a real photo.
+    """
+    import random
+
+    from PIL import Image
+
+    rng = random.Random(seed)
+    image = Image.frombytes('RGB', size, rng.randbytes(size[0] * size[1] * 3))
+    image.save(path, 'JPEG', quality=92)
+
+
+def write_body(path, image_path, boundary):
+    """
+    Write a multipart item-creation body that embeds ``image_path``.
+    """
+    fields = {
+        'title': 'Benchmark upload', 'description': 'd', 'starting_bid': '1.00',
+        'end_datetime': '2100-01-01T00:00:00Z',
+    }
+    with open(path, 'wb') as body:
+        for name, value in fields.items():
+            body.write(
+                f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+            )
+        body.write(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="image"; filename="photo.jpg"\r\n'
+            f'Content-Type: image/jpeg\r\n\r\n'.encode()
+        )
+        with open(image_path, 'rb') as image:
+            while chunk := image.read(1 << 20):
+                body.write(chunk)
+        body.write(f'\r\n--{boundary}--\r\n'.encode())
+
+
+def prepare(directory, uploads, size):
+    boundary = uuid.uuid4().hex
+    bodies = {'photos': [], 'duplicates': [], 'oversized': []}
+    for i in range(uploads):
+        image_path = os.path.join(directory, f'photo{i}.jpg')
+        write_photo(image_path, size, seed=i)
+        body_path = os.path.join(directory, f'photo{i}.body')
+        write_body(body_path, image_path, boundary)
+        bodies['photos'].append(body_path)
+    bodies['duplicates'] = [bodies['photos'][0]] * uploads
+
+    big_image = os.path.join(directory, 'oversized.jpg')
+    with open(big_image, 'wb') as image, open(os.path.join(directory, 'photo0.jpg'), 'rb') as photo:
+        data = photo.read()
+        while image.tell() < 40 * 1024 * 1024:
+            image.write(data)
+    write_body(os.path.join(directory, 'oversized.body'), big_image, boundary)
+    bodies['oversized'] = [os.path.join(directory, 'oversized.body')] * uploads
+    return boundary, bodies
+
+
+def child(mode, scenario, boundary, bodies):
+    """
+    Run one scenario in this process and return its measurements.
+    """
+    os.environ['IMAGE_WORKERS'] = '0'
+    setup_django()
+
+    from django.conf import settings
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.db.models.signals import post_save
+    from django.test import Client
+    from django.utils.crypto import get_random_string
+
+    from api.models import AuctionItem, User
+    from api.signals import process_uploaded_image
+
+    settings.IMAGE_UPLOAD_HANDLERS = MODES[mode]
+    settings.MEDIA_ROOT = tempfile.mkdtemp()
+    # Only the upload itself is measured, not variant generation.
+    post_save.disconnect(process_uploaded_image, sender=AuctionItem)
+
+    with benchmark_database():
+        user = User.objects.create_user('bench-uploader')
+        client = Client()
+        client.force_login(user)
+        session = client.cookies[settings.SESSION_COOKIE_NAME].value
+        csrf = get_random_string(32)
+
+        handler = WSGIHandler()
+        statuses = []
+
+        def start_response(status, headers):
+            statuses.append(int(status.split()[0]))
+
+        reset_peak_rss()
+        baseline = peak_rss_mb()
+        latencies = []
+        for path in bodies:
+            with open(path, 'rb') as body:
+                environ = {
+                    'REQUEST_METHOD': 'POST',
+                    'PATH_INFO': '/api/auction-items/',
+                    'SCRIPT_NAME': '',
+                    'QUERY_STRING': '',
+                    'SERVER_NAME': 'localhost',
+                    'SERVER_PORT': '80',
+                    'SERVER_PROTOCOL': 'HTTP/1.1',
+                    'HTTP_HOST': 'localhost',
+                    'HTTP_COOKIE': f'{settings.SESSION_COOKIE_NAME}={session}; {settings.CSRF_COOKIE_NAME}={csrf}',
+                    'HTTP_X_CSRFTOKEN': csrf,
+                    'CONTENT_TYPE': f'multipart/form-data; boundary={boundary}',
+                    'CONTENT_LENGTH': str(os.path.getsize(path)),
+                    'wsgi.input': body,
+                    'wsgi.url_scheme': 'http',
+                    'wsgi.errors': sys.stderr,
+                    'wsgi.multithread': False,
+                    'wsgi.multiprocess': False,
+                    'wsgi.run_once': False,
+                    'wsgi.version': (1, 0),
+                }
+                started = time.perf_counter()
+                response = handler(environ, start_response)
+                b''.join(response)
+                response.close()
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        stored = sum(len(files) for _, _, files in os.walk(settings.MEDIA_ROOT))
+        return {
+            'statuses': sorted(set(statuses)),
+            'peak_rss_growth_mb': round(peak_rss_mb() - baseline, 1),
+            'files_stored': stored,
+            'latency': summarize(latencies),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--uploads", type=int, default=5, help="Requests per scenario.")
+    parser.add_argument("--width", type=int, default=4000)
+    parser.add_argument("--height", type=int, default=3000)
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "SCENARIO"), help=argparse.SUPPRESS)
+    parser.add_argument("--plan", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        with open(args.plan) as plan:
+            plan = json.load(plan)
+        mode, scenario = args.child
+        json.dump(child(mode, scenario, plan['boundary'], plan['bodies'][scenario]), sys.stdout)
+        return
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        boundary, bodies = prepare(directory, args.uploads, (args.width, args.height))
+        plan = os.path.join(directory, 'plan.json')
+        with open(plan, 'w') as f:
+            json.dump({'boundary': boundary, 'bodies': bodies}, f)
+        for mode in MODES:
+            for scenario in SCENARIOS:
+                output = subprocess.run(
+                    [sys.executable, '-m', 'benchmarks.uploads', '--child', mode, scenario, '--plan', plan],
+                    check=True, capture_output=True, text=True,
+                    cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                ).stdout
+                results.setdefault(scenario, {})[mode] = json.loads(output)
+    report(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,19 +6,39 @@ function getCookie(name: string): string | null {
   return match ? decodeURIComponent(match[2]) : null;
 }
 
+export interface ImageVariant {
+    width: number;
+    height: number;
+    webp: string;
+    jpeg: string;
+}
+
 export interface AuctionItem {
     id: number;
     title: string;
-    description: string;
+    description?: string;
     startingBid: number;
     currentBid: number;
     imageUrl: string | null;
+    imageVariants?: Record<string, ImageVariant>;
+    imagePlaceholder?: string;
     endDate: string;
     ownerUsername: string;
+    bidCount: number;
+    lastBidAt: string | null;
+    topBidderUsername: string | null;
+}
+
+export interface Bid {
+    id: number;
+    bidderUsername: string;
+    amount: number;
+    timestamp: string;
 }
 
 export const useAuctionStore = defineStore('auctionStore', () => {
     const items = ref<AuctionItem[]>([]);
+    const nextPage = ref<string | null>(null);
 
     function setItem(updatedItem: AuctionItem) {
         const index = items.value.findIndex(item => item.id === updatedItem.id);
@@ -29,33 +49,84 @@ export const useAuctionStore = defineStore('auctionStore', () => {
         }
     }
 
-    function updateBid(itemId: number, bid: number) {
+    // Apply a new highest bid; returns false if the item already has it.
+    function updateBid(itemId: number, bid: number, bidder: string | null = null) {
         const item = items.value.find(item => item.id === itemId);
-        if (item) item.currentBid = bid;
+        if (!item || bid <= item.currentBid) return false;
+        item.currentBid = bid;
+        item.bidCount += 1;
+        item.lastBidAt = new Date().toISOString();
+        if (bidder) item.topBidderUsername = bidder;
+        return true;
     }
 
     function getItem(itemId: number) {
         return items.value.find(i => i.id === itemId) || null;
     }
 
+    function fromPayload(d: any): AuctionItem {
+        return {
+            id: d.id,
+            title: d.title,
+            description: d.description,
+            startingBid: parseFloat(d.starting_bid),
+            currentBid: d.current_bid ? parseFloat(d.current_bid) : parseFloat(d.starting_bid),
+            imageUrl: d.image,
+            imageVariants: d.image_variants,
+            imagePlaceholder: d.image_placeholder,
+            endDate: d.end_datetime,
+            ownerUsername: d.ownerUsername,
+            bidCount: d.bid_count ?? 0,
+            lastBidAt: d.last_bid_at ?? null,
+            topBidderUsername: d.topBidderUsername ?? null,
+        };
+    }
+
+    // srcset of one format across all variant sizes, e.g. "a.webp 160w, b.webp 480w".
+    function imageSrcset(item: AuctionItem, format: 'webp' | 'jpeg') {
+        return Object.values(item.imageVariants ?? {})
+            .map(variant => `${variant[format]} ${variant.width}w`)
+            .join(', ');
+    }
+
+    async function fetchPage(url: string) {
+        const response = await fetch(url);
+        if (!response.ok) throw new Error('Failed to fetch auction items');
+        const data = await response.json();
+        nextPage.value = data.next;
+        return (data.results as any[]).map(fromPayload);
+    }
+
+    // One page of an item's bid history, highest first, and the next page's URL.
+    async function fetchBids(url: string): Promise<{ bids: Bid[]; next: string | null }> {
+        const response = await fetch(url);
+        if (!response.ok) throw new Error('Failed to fetch bids');
+        const data = await response.json();
+        return {
+            bids: (data.results as any[]).map(b => ({
+                id: b.id,
+                bidderUsername: b.bidderUsername,
+                amount: parseFloat(b.amount),
+                timestamp: b.timestamp,
+            })),
+            next: data.next,
+        };
+    }
+
     async function fetchItems(search = '') {
         try {
-            const response = await fetch(
+            items.value = await fetchPage(
                 `/api/auction-items/?search=${encodeURIComponent(search)}`
             );
-            if (!response.ok) throw new Error('Failed to fetch auction items');
-            const data = await response.json();
-
-            // Convert backend data to AuctionItem[]
-            items.value = data.map((d: any) => ({
-                id: d.id,
-                title: d.title,
-                description: d.description,
-                startingBid: parseFloat(d.starting_bid),
-                currentBid: d.current_bid ? parseFloat(d.current_bid) : parseFloat(d.starting_bid),
-                imageUrl: d.image,
-                endDate: d.end_datetime,
-            }));
+        } catch (err) {
+            console.error(err);
+        }
+    }
+
+    async function fetchMoreItems() {
+        if (!nextPage.value) return;
+        try {
+            items.value.push(...await fetchPage(nextPage.value));
         } catch (err) {
             console.error(err);
         }
@@ -108,12 +179,17 @@ export const useAuctionStore = defineStore('auctionStore', () => {
             startingBid: parseFloat(created.starting_bid),
             currentBid: created.current_bid ? parseFloat(created.current_bid) : 0,
             imageUrl: created.image,
+            imageVariants: created.image_variants,
+            imagePlaceholder: created.image_placeholder,
             endDate: created.end_datetime,
-            ownerUsername: created.ownerUsername
+            ownerUsername: created.ownerUsername,
+            bidCount: 0,
+            lastBidAt: null,
+            topBidderUsername: null,
         });
 
         return created;
     }
 
-    return { items, setItem, updateBid, getItem, fetchItems, createItem };
+    return { items, nextPage, setItem, updateBid, getItem, fromPayload, imageSrcset, fetchItems, fetchMoreItems, fetchBids, createItem };
 });
@@ -10,6 +10,8 @@ export default defineConfig(({ mode }) => ({
             : "/static/api/spa/",
     build: {
         emptyOutDir: true,
+        // Read by project/spa.py for the shell's preload hints.
+        manifest: true,
         outDir: "../api/static/api/spa",
     },
     plugins: [vue()],
@@ -13,4 +13,9 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Imported after Django is set up: the event stream endpoint uses the ORM.
+from api.realtime import EventStreamApplication  # noqa: E402
+
+application = EventStreamApplication(django_application)
@@ -0,0 +1,109 @@
+"""
+Cheaper sessions and authentication for API requests.
+
+With the stock setup every authenticated request loads its session row and
+then its user row. The session store chosen by SESSION_BACKEND (see
+``project.cache.session_engine``) usually avoids the first query, and
+``CachedUserAuthenticationMiddleware`` avoids the second by keeping recently
+seen users in a per-process cache for ``USER_CACHE_TIMEOUT`` seconds.
+
+Cache entries are keyed by the session's auth hash, which is derived from
+the password hash, so a session created with an old password never matches
+an entry made after a password change. A user saved in this process is
+dropped from its cache straight away (see ``api.signals``); other processes
+may serve the old copy until it expires.
+"""
+import copy
+import threading
+import time
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib import auth
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.utils.functional import SimpleLazyObject
+
+
+def user_cache_timeout():
+    return getattr(settings, 'USER_CACHE_TIMEOUT', 30)
+
+
+class UserCache:
+    """
+    Users by ``(backend, user id, session auth hash)``, expiring after
+    ``user_cache_timeout()`` seconds. Callers get their own copy of a user.
+    """
+
+    def __init__(self, max_size=10000):
+        self.max_size = max_size
+        self._users = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._users.get(key)
+        if entry is None or entry[1] < time.monotonic():
+            return None
+        return copy.copy(entry[0])
+
+    def set(self, key, user):
+        timeout = user_cache_timeout()
+        if timeout <= 0:
+            return
+        with self._lock:
+            self._users[key] = (copy.copy(user), time.monotonic() + timeout)
+            if len(self._users) > self.max_size:
+                now = time.monotonic()
+                self._users = {k: v for k, v in self._users.items() if v[1] >= now}
+
+    def forget(self, user_id):
+        user_id = str(user_id)
+        with self._lock:
+            self._users = {k: v for k, v in self._users.items() if k[1] != user_id}
+
+    def clear(self):
+        with self._lock:
+            self._users.clear()
+
+
+user_cache = UserCache()
+
+
+def get_user(request):
+    """
+    ``django.contrib.auth.get_user`` through the user cache.
+    """
+    if hasattr(request, '_cached_user'):
+        return request._cached_user
+    session = request.session
+    key = None
+    if session.get(HASH_SESSION_KEY) and SESSION_KEY in session and BACKEND_SESSION_KEY in session:
+        key = (session[BACKEND_SESSION_KEY], str(session[SESSION_KEY]), session[HASH_SESSION_KEY])
+    user = user_cache.get(key) if key else None
+    if user is None:
+        user = auth.get_user(request)
+        # Only sessions verified against the current password hash are
+        # cached; get_user rewrites the hash of one verified by a fallback.
+        if key and user.is_authenticated and session.get(HASH_SESSION_KEY) == key[2]:
+            user_cache.set(key, user)
+    request._cached_user = user
+    return user
+
+
+async def auser(request):
+    if not hasattr(request, '_acached_user'):
+        request._acached_user = await sync_to_async(get_user)(request)
+    return request._acached_user
+
+
+class CachedUserAuthenticationMiddleware(AuthenticationMiddleware):
+    """
+    ``AuthenticationMiddleware`` that looks users up in the user cache.
+    """
+
+    def process_request(self, request):
+        super().process_request(request)
+        request.user = SimpleLazyObject(lambda: get_user(request))
+        request.auser = partial(auser, request)
@@ -0,0 +1,67 @@
+import os
+
+from django.conf import settings
+
+
+backends = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+}
+
+session_engines = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'cache': 'django.contrib.sessions.backends.cache',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+}
+
+
+def config():
+    """
+    Build the default cache from CACHE_BACKEND (locmem, file or redis) and
+    CACHE_LOCATION. locmem, the default, is per process, so deployments with
+    several workers should use file or a Redis-compatible server.
+    """
+    backend = backends.get(os.getenv('CACHE_BACKEND'), backends['locmem'])
+    location = os.getenv('CACHE_LOCATION')
+    if not location:
+        if backend == backends['file']:
+            location = os.path.join(settings.BASE_DIR, '.cache')
+        elif backend == backends['redis']:
+            location = 'redis://127.0.0.1:6379/0'
+        else:
+            location = 'default'
+    return {
+        'BACKEND': backend,
+        'LOCATION': location,
+        'KEY_PREFIX': os.getenv('CACHE_KEY_PREFIX', 'auction'),
+    }
+
+
+def is_shared(cache):
+    """
+    Whether every worker process sees the same entries in ``cache`` (a
+    CACHES entry).
+    """
+    return cache['BACKEND'] not in (backends['locmem'], 'django.core.cache.backends.dummy.DummyCache')
+
+
+def api_cache_timeout(cache):
+    """
+    API_CACHE_TIMEOUT, by default 300 seconds with a shared cache and 0 (no
+    caching) otherwise: a per-process cache would keep serving a payload
+    after a bid handled by another worker.
+    """
+    return int(os.getenv('API_CACHE_TIMEOUT', '300' if is_shared(cache) else '0'))
+
+
+def session_engine():
+    """
+    The session engine named by SESSION_BACKEND (db, cached_db, cache or
+    signed_cookies). cached_db, the default, reads sessions from the cache
+    and writes them through to the database, so a cache miss only costs a
+    query. signed_cookies keeps sessions in the cookie itself and never
+    queries, but a session cannot be revoked before it expires.
+    """
+    return session_engines.get(os.getenv('SESSION_BACKEND'), session_engines['cached_db'])
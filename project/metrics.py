@@ -0,0 +1,300 @@
+"""
+Per-request cost metrics in Prometheus text format.
+
+``MetricsMiddleware`` times every request and counts and times its database
+queries, with an execute wrapper installed on every connection as it is
+opened. The wrapper finds the current request's ``RequestStats`` through a
+context variable, which also reaches the threads async views run their
+queries in. The middleware records them in histograms labelled by view, along with the time spent in
+serializers (see ``serializer_timer``) and the response size, and logs a
+warning for requests that run more than ``METRICS_QUERY_BUDGET`` queries,
+which is how N+1 regressions show up. For a streamed response (see
+``api.streaming``) the queries and serializer time spent producing the body
+count too, and the request is recorded once the body has been sent.
+
+``metrics_view`` serves the histograms at ``/metrics``. They are kept per
+process, so with several workers each one reports its own.
+"""
+import hmac
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.http import FileResponse, HttpResponse, HttpResponseForbidden
+
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+class Histogram:
+    """
+    A Prometheus histogram with one series per combination of label values.
+    """
+
+    def __init__(self, name, documentation, labels, buckets):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.buckets = buckets
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * len(self.buckets), 0.0, 0]
+            counts = series[0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            series[1] += value
+            series[2] += 1
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+    def snapshot(self):
+        """
+        ``{label values: (observations, sum)}`` for every series.
+        """
+        with self._lock:
+            return {labels: (count, total) for labels, (_, total, count) in self._series.items()}
+
+    def expose(self):
+        with self._lock:
+            snapshot = {labels: (list(counts), total, count) for labels, (counts, total, count) in self._series.items()}
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for label_values, (counts, total, count) in sorted(snapshot.items()):
+            labels = ','.join(f'{name}="{_escape(value)}"' for name, value in zip(self.labels, label_values))
+            for bound, bucket_count in zip(self.buckets, counts):
+                lines.append(f'{self.name}_bucket{{{labels},le="{bound}"}} {bucket_count}')
+            lines.append(f'{self.name}_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f'{self.name}_sum{{{labels}}} {total:g}')
+            lines.append(f'{self.name}_count{{{labels}}} {count}')
+        return lines
+
+
+def _escape(value):
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+REQUEST_LABELS = ('view', 'method')
+
+request_duration = Histogram(
+    'http_request_duration_seconds', 'Time to produce a response.', REQUEST_LABELS, LATENCY_BUCKETS,
+)
+request_queries = Histogram(
+    'http_request_db_queries', 'Database queries run per request.', REQUEST_LABELS, QUERY_BUCKETS,
+)
+request_db_time = Histogram(
+    'http_request_db_duration_seconds', 'Time spent in database queries per request.', REQUEST_LABELS, LATENCY_BUCKETS,
+)
+request_serializer_time = Histogram(
+    'http_request_serializer_duration_seconds', 'Time spent serializing data per request.', REQUEST_LABELS, LATENCY_BUCKETS,
+)
+response_size = Histogram(
+    'http_response_size_bytes', 'Size of response bodies (files excluded).', REQUEST_LABELS, SIZE_BUCKETS,
+)
+
+HISTOGRAMS = (request_duration, request_queries, request_db_time, request_serializer_time, response_size)
+
+
+class RequestStats:
+    """
+    Costs accumulated while one request is handled.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.serializer_depth = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - started
+            self.queries += 1
+
+
+_current = ContextVar('request_stats', default=None)
+
+
+def record_query(execute, sql, params, many, context):
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    return stats(execute, sql, params, many, context)
+
+
+@receiver(connection_created)
+def instrument_connection(sender, connection, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        # First, so connection.execute_wrapper() blocks that are open while
+        # the connection is made still pop their own wrapper.
+        connection.execute_wrappers.insert(0, record_query)
+
+
+@contextmanager
+def serializer_timer():
+    """
+    Count the time spent in the block as serializer time of the current
+    request. Nested blocks are only counted once.
+    """
+    stats = _current.get()
+    if stats is None or stats.serializer_depth:
+        yield
+        return
+    stats.serializer_depth += 1
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.serializer_time += time.perf_counter() - started
+        stats.serializer_depth -= 1
+
+
+def query_budget():
+    return getattr(settings, 'METRICS_QUERY_BUDGET', 20)
+
+
+def view_label(request):
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return '<unresolved>'
+    return match.view_name or match._func_path
+
+
+class MetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, stats, started)
+
+    async def __acall__(self, request):
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, stats, started)
+
+    def finish(self, request, response, stats, started):
+        if not response.streaming:
+            self.record(request, stats, time.perf_counter() - started, len(response.content))
+        elif isinstance(response, FileResponse):
+            # Left alone so the server can still send the file directly.
+            self.record(request, stats, time.perf_counter() - started, None)
+        elif response.is_async:
+            response.streaming_content = self.ametered(request, response.streaming_content, stats, started)
+        else:
+            response.streaming_content = self.metered(request, response.streaming_content, stats, started)
+        return response
+
+    def metered(self, request, chunks, stats, started):
+        """
+        ``chunks``, produced with ``stats`` as the current request's, which
+        is recorded when they run out.
+        """
+        chunks, size = iter(chunks), 0
+        try:
+            while True:
+                token = _current.set(stats)
+                try:
+                    chunk = next(chunks, None)
+                finally:
+                    _current.reset(token)
+                if chunk is None:
+                    return
+                size += len(chunk)
+                yield chunk
+        finally:
+            self.record(request, stats, time.perf_counter() - started, size)
+
+    async def ametered(self, request, chunks, stats, started):
+        chunks, size = aiter(chunks), 0
+        try:
+            while True:
+                token = _current.set(stats)
+                try:
+                    chunk = await anext(chunks, None)
+                finally:
+                    _current.reset(token)
+                if chunk is None:
+                    return
+                size += len(chunk)
+                yield chunk
+        finally:
+            self.record(request, stats, time.perf_counter() - started, size)
+
+    @staticmethod
+    def record(request, stats, duration, size):
+        labels = (view_label(request), request.method)
+        request_duration.observe(duration, *labels)
+        request_queries.observe(stats.queries, *labels)
+        request_db_time.observe(stats.db_time, *labels)
+        request_serializer_time.observe(stats.serializer_time, *labels)
+        if size is not None:
+            response_size.observe(size, *labels)
+        if stats.queries > query_budget():
+            logger.warning(
+                "%s %s ran %d database queries (budget %d) in %.1f ms",
+                request.method, request.path, stats.queries, query_budget(), stats.db_time * 1000,
+            )
+
+
+def reset():
+    for histogram in HISTOGRAMS:
+        histogram.clear()
+
+
+def metrics_view(request):
+    """
+    The histograms in Prometheus text format, for staff users or for
+    scrapers presenting ``Authorization: Bearer <METRICS_TOKEN>``.
+    """
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    authorization = request.headers.get('Authorization', '')
+    allowed = (
+        # compare_digest only takes ASCII strings, so compare bytes.
+        (token and hmac.compare_digest(authorization.encode(), f"Bearer {token}".encode()))
+        or (request.user.is_authenticated and request.user.is_staff)
+    )
+    if not allowed:
+        return HttpResponseForbidden()
+    lines = []
+    for histogram in HISTOGRAMS:
+        lines += histogram.expose()
+    return HttpResponse('\n'.join(lines) + '\n', content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,113 @@
+"""
+Read-replica routing.
+
+``ReplicaRoutingMiddleware`` marks safe requests (GET, HEAD, OPTIONS) as
+allowed to read from ``settings.REPLICA_DATABASES``, and ``ReplicaRouter``
+then sends their reads to a random replica. Everything else uses
+``default``: writes, reads during unsafe requests, and code running outside
+a request (management commands, the scheduler, the event stream).
+
+A client that makes an unsafe request is pinned to ``default`` for
+``REPLICA_PIN_SECONDS`` afterwards with a cookie, so right after bidding,
+asking or answering it reads its own writes rather than a lagging replica.
+"""
+import random
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+
+PIN_COOKIE = 'primary_pin'
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+_replica_reads = ContextVar('replica_reads', default=False)
+
+
+def replica_aliases():
+    return getattr(settings, 'REPLICA_DATABASES', [])
+
+
+def pin_seconds():
+    return getattr(settings, 'REPLICA_PIN_SECONDS', 10)
+
+
+def reading_from_replicas():
+    """
+    Whether reads in the current context may be served by a replica.
+    """
+    return _replica_reads.get() and bool(replica_aliases())
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if reading_from_replicas():
+            return random.choice(replica_aliases())
+        return 'default'
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold copies of the primary's rows.
+        aliases = {'default', *replica_aliases()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not replica_aliases():
+            return self.get_response(request)
+
+        token = _replica_reads.set(self.may_use_replicas(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            _replica_reads.reset(token)
+        return self.pin(request, response)
+
+    async def __acall__(self, request):
+        if not replica_aliases():
+            return await self.get_response(request)
+
+        # Async views run their queries in threads that copy this context.
+        token = _replica_reads.set(self.may_use_replicas(request))
+        try:
+            response = await self.get_response(request)
+        finally:
+            _replica_reads.reset(token)
+        return self.pin(request, response)
+
+    def may_use_replicas(self, request):
+        return request.method in SAFE_METHODS and not self.pinned(request)
+
+    @staticmethod
+    def pin(request, response):
+        if request.method not in SAFE_METHODS:
+            response.set_cookie(
+                PIN_COOKIE, str(int(time.time()) + pin_seconds()), max_age=pin_seconds(),
+                httponly=True, samesite='Lax', secure=request.is_secure(),
+            )
+        return response
+
+    @staticmethod
+    def pinned(request):
+        try:
+            return int(request.COOKIES.get(PIN_COOKIE, 0)) > time.time()
+        except ValueError:
+            return False
@@ -10,7 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/stable/ref/settings/
 """
 
-from . import database
+from . import cache, database
 import os
 
 from pathlib import Path
@@ -54,17 +54,25 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "project.metrics.MetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "project.spa.StaticFilesMiddleware",
     "corsheaders.middleware.CorsMiddleware",
+    "project.routers.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "project.auth.CachedUserAuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# Requests running more database queries than this are logged as warnings.
+METRICS_QUERY_BUDGET = int(os.getenv("METRICS_QUERY_BUDGET", "20"))
+
+# Lets Prometheus scrape /metrics with "Authorization: Bearer <token>".
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
 CORS_ALLOW_ALL_ORIGINS = False
 
 CORS_ALLOWED_ORIGINS = [
@@ -111,9 +119,66 @@ WSGI_APPLICATION = 'project.wsgi.application'
 
 
 DATABASES = {
-    'default': database.config()
+    'default': database.config(),
+    **database.replicas(),
+}
+
+# Safe requests read from the replicas, if any are configured.
+DATABASE_ROUTERS = ['project.routers.ReplicaRouter']
+
+REPLICA_DATABASES = [alias for alias in DATABASES if alias != 'default']
+
+# Seconds a client reads from the primary after making a write request.
+REPLICA_PIN_SECONDS = int(os.getenv("REPLICA_PIN_SECONDS", "10"))
+
+
+# Cache
+# https://docs.djangoproject.com/en/stable/topics/cache/
+
+CACHES = {
+    'default': cache.config()
+}
+
+# Seconds a serialized auction item payload or list page stays cached; 0
+# turns the API cache off, which is the default unless the cache is shared.
+API_CACHE_TIMEOUT = cache.api_cache_timeout(CACHES['default'])
+
+# Seconds a payload read from a replica stays cached; roughly the longest
+# replication lag to expect.
+REPLICA_CACHE_TIMEOUT = int(os.getenv("REPLICA_CACHE_TIMEOUT", "10"))
+
+
+# Sessions and authentication
+
+SESSION_ENGINE = cache.session_engine()
+
+# Seconds an authenticated user is reused from the per-process cache
+# (see project.auth); 0 loads the user from the database on every request.
+USER_CACHE_TIMEOUT = int(os.getenv("USER_CACHE_TIMEOUT", "30"))
+
+
+# Django REST framework
+# https://www.django-rest-framework.org/api-guide/settings/
+
+REST_FRAMEWORK = {
+    # Token-bucket rates (see api.throttling): bursts of up to N requests,
+    # refilled at N per period.
+    'DEFAULT_THROTTLE_RATES': {
+        'bid': os.getenv("THROTTLE_BID_RATE", "30/min"),
+        'bid_ip': os.getenv("THROTTLE_BID_IP_RATE", "120/min"),
+        'question': os.getenv("THROTTLE_QUESTION_RATE", "10/min"),
+        'question_ip': os.getenv("THROTTLE_QUESTION_IP_RATE", "30/min"),
+        'signup': os.getenv("THROTTLE_SIGNUP_RATE", "5/hour"),
+    },
+    # Proxies in front of the app that append the client address to
+    # X-Forwarded-For (1 behind the OpenShift router). The default of 0 uses
+    # REMOTE_ADDR, since without a proxy clients could write the header.
+    'NUM_PROXIES': int(os.getenv("NUM_PROXIES", "0")),
 }
 
+# Cache holding the throttle buckets; shared by all workers unless locmem.
+THROTTLE_CACHE_ALIAS = 'default'
+
 
 # Password validation
 # https://docs.djangoproject.com/en/stable/ref/settings/#auth-password-validators
@@ -157,7 +222,13 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# collectstatic fingerprints static files and writes gzip and (with the
+# Brotli package) .br copies next to them, which WhiteNoise serves. Run it on
+# every deploy; files it has not collected are linked by their plain names.
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'project.spa.StaticFilesStorage'},
+}
 
 INTERNAL_IPS = ['127.0.0.1']
 
@@ -165,8 +236,27 @@ INTERNAL_IPS = ['127.0.0.1']
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Threads per process that resize uploaded images (0 resizes during the request).
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", "2"))
+# Uploads with more pixels or bytes than this are rejected.
+IMAGE_MAX_PIXELS = int(os.getenv("IMAGE_MAX_PIXELS", "40000000"))
+IMAGE_MAX_UPLOAD_SIZE = int(os.getenv("IMAGE_MAX_UPLOAD_SIZE", str(15 * 1024 * 1024)))
+
+# Upload handlers of the views that take images (item images, profile
+# pictures): stream uploads to disk, hashing them and checking the limits as
+# they arrive. Other uploads use Django's FILE_UPLOAD_HANDLERS.
+IMAGE_UPLOAD_HANDLERS = ['api.uploads.HashingUploadHandler']
+
 AUTH_USER_MODEL = 'api.User'
 
+# Full-text search
+# Leave SEARCH_ENGINE empty to pick an engine from the database vendor.
+SEARCH_ENGINE = os.getenv("SEARCH_ENGINE") or None
+
+# Live bid updates
+# Use api.realtime.PostgresBroker when running more than one ASGI worker.
+REALTIME_BROKER = os.getenv("REALTIME_BROKER", "api.realtime.InProcessBroker")
+
 LOGIN_REDIRECT_URL = "/"
 LOGIN_URL = "/login/"
 LOGOUT_REDIRECT_URL = "/login/"
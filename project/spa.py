@@ -0,0 +1,180 @@
+"""
+Serving the Vue single-page app.
+
+The shell page (``api/spa/index.html``, written by ``npm run build``) is the
+same for every user apart from the CSRF token, so ``shell`` renders it once
+per process, adds ``<link rel=preload>`` hints for everything the entry
+chunk needs (from the Vite manifest) and splits it where the token goes.
+Each request then only joins the two halves around its own token.
+
+Vite names the files it writes to ``assets/`` after a hash of their
+contents. ``StaticFilesMiddleware`` tells WhiteNoise so, and they are served
+with ``Cache-Control: immutable`` like Django's own hashed static files.
+Gzip and Brotli copies are written by ``collectstatic``, which a deployment
+must run; until it has, ``StaticFilesStorage`` links files by their plain
+names rather than failing.
+"""
+import json
+import posixpath
+from functools import lru_cache
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.template.loader import render_to_string
+from django.utils.cache import patch_cache_control
+from django.utils.html import escape
+from whitenoise.middleware import WhiteNoiseMiddleware
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+
+TEMPLATE_NAME = 'api/spa/index.html'
+
+# Where the Vite build lives under STATIC_URL (its ``base`` in vite.config.ts).
+STATIC_DIR = 'api/spa/'
+
+MANIFEST_NAME = STATIC_DIR + '.vite/manifest.json'
+
+TOKEN_PLACEHOLDER = '\x00csrf-token\x00'
+
+ASSET_TYPES = {
+    '.css': 'style',
+    '.woff2': 'font', '.woff': 'font', '.ttf': 'font', '.otf': 'font',
+    '.png': 'image', '.jpg': 'image', '.jpeg': 'image', '.gif': 'image',
+    '.svg': 'image', '.webp': 'image', '.avif': 'image',
+}
+
+
+def load_manifest():
+    """
+    The Vite build manifest, or ``{}`` if the build did not write one.
+    """
+    path = finders.find(MANIFEST_NAME)
+    if path is None:
+        return {}
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def preload_hints(manifest):
+    """
+    ``(url, destination)`` for the entry chunks, the chunks they import and
+    the styles and assets of all of them, in load order. JavaScript chunks
+    have the destination ``'script'``.
+    """
+    hints, seen = [], set()
+
+    def add(file):
+        destination = 'script' if file.endswith('.js') else ASSET_TYPES.get(posixpath.splitext(file)[1].lower())
+        if destination and file not in seen:
+            seen.add(file)
+            hints.append((f"{settings.STATIC_URL}{STATIC_DIR}{file}", destination))
+
+    def visit(key):
+        chunk = manifest[key]
+        add(chunk['file'])
+        for imported in chunk.get('imports', ()):
+            if manifest[imported]['file'] not in seen:
+                visit(imported)
+        for file in [*chunk.get('css', ()), *chunk.get('assets', ())]:
+            add(file)
+
+    for key, chunk in manifest.items():
+        if chunk.get('isEntry'):
+            visit(key)
+    return hints
+
+
+def hint_tag(url, destination):
+    if destination == 'script':
+        return f'<link rel="modulepreload" crossorigin href="{escape(url)}">'
+    crossorigin = ' crossorigin' if destination == 'font' else ''
+    return f'<link rel="preload" href="{escape(url)}" as="{destination}"{crossorigin}>'
+
+
+def hint_header(url, destination):
+    if destination == 'script':
+        return f'<{url}>; rel=modulepreload'
+    crossorigin = '; crossorigin' if destination == 'font' else ''
+    return f'<{url}>; rel=preload; as={destination}{crossorigin}'
+
+
+def build_shell():
+    hints = preload_hints(load_manifest())
+    tags = [f'<meta name="csrf-token" content="{TOKEN_PLACEHOLDER}">']
+    tags += [hint_tag(url, destination) for url, destination in hints]
+    html = render_to_string(TEMPLATE_NAME).replace('</head>', '\n'.join(tags) + '\n</head>', 1)
+    before, after = html.split(TOKEN_PLACEHOLDER)
+    return before, after, ', '.join(hint_header(url, destination) for url, destination in hints)
+
+
+@lru_cache(maxsize=None)
+def shell():
+    """
+    ``(before token, after token, Link header)`` of the shell page, built
+    once per process.
+    """
+    return build_shell()
+
+
+def shell_view(request, *args, **kwargs):
+    """
+    The shell page, with this request's CSRF token. With DEBUG on it is
+    rebuilt every time so a fresh ``npm run build`` shows up at once.
+    """
+    before, after, link = build_shell() if settings.DEBUG else shell()
+    response = HttpResponse(before + escape(get_token(request)) + after)
+    if link:
+        response['Link'] = link
+    # The page names the current build's assets, so it must be revalidated.
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise, also treating the Vite build's hashed assets as immutable,
+    and able to pass requests on to async views without a thread switch.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response, *args, **kwargs):
+        super().__init__(get_response, *args, **kwargs)
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
+
+    def immutable_file_test(self, path, url):
+        return url.startswith(f"{self.static_prefix}{STATIC_DIR}assets/") or super().immutable_file_test(path, url)
+
+
+class StaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """
+    WhiteNoise's fingerprinting storage, linking a file by its plain name
+    when ``collectstatic`` has not written it yet, so templates still render
+    (unstyled) instead of raising a missing manifest entry error.
+    """
+    manifest_strict = False
+
+    def stored_name(self, name):
+        try:
+            return super().stored_name(name)
+        except ValueError:
+            return name
@@ -18,13 +18,13 @@ from django.contrib import admin
 from django.urls import include, path, re_path
 from django.http import HttpResponse
 from django.conf.urls.static import static
-from django.views.generic import TemplateView
 from django.contrib.auth import views as auth_views
 from django.contrib.auth.forms import AuthenticationForm
 from django.contrib.auth.decorators import login_required
 from django.views.decorators.csrf import ensure_csrf_cookie
 
 from api import views as api_views
+from project import metrics, spa
 
 
 
@@ -42,13 +42,14 @@ urlpatterns = [
 
     #health & admin
     path('health', lambda request: HttpResponse("OK")),
+    path('metrics', metrics.metrics_view, name='metrics'),
     path('admin/', admin.site.urls),
 
     path(
         "app/",
         login_required(
             ensure_csrf_cookie(
-                TemplateView.as_view(template_name="api/spa/index.html")
+                spa.shell_view
             )
         ),
         name="spa",
@@ -59,7 +60,7 @@ urlpatterns = [
         r"^(?!login/|signup/|logout/|api/|admin/).*$",
         login_required(
             ensure_csrf_cookie(
-                TemplateView.as_view(template_name="api/spa/index.html")
+                spa.shell_view
             )
         ),
     ),